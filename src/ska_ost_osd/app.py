@@ -2,6 +2,7 @@
 
 import logging
 import os
+from contextlib import asynccontextmanager
 from importlib.metadata import version
 
 from fastapi import FastAPI
@@ -12,6 +13,9 @@ from pydantic import ValidationError
 from ska_ser_logging import configure_logging
 
 from ska_ost_osd.common.error_handling import generic_exception_handler
+from ska_ost_osd.common.metrics import metrics_endpoint, track_requests
+from ska_ost_osd.common.request_timing import server_timing
+from ska_ost_osd.osd.cache.warmup import osd_warmup, readiness_endpoint
 from ska_ost_osd.osd.common.error_handling import OSDModelError
 from ska_ost_osd.osd.routers.api import osd_router
 from ska_ost_osd.telvalidation.common.error_handling import (
@@ -29,12 +33,23 @@ LOGGER = logging.getLogger(__name__)
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Start warming the OSD caches when the app starts serving."""
+    osd_warmup.start()
+    yield
+
+
 def create_app(production=PRODUCTION) -> FastAPI:
     """Create the FastAPI application with required config."""
     LOGGER.info("Creating FastAPI app")
     configure_logging(level=LOG_LEVEL)
 
-    app = FastAPI(openapi_url=f"{API_PREFIX}/openapi.json", docs_url=f"{API_PREFIX}/ui")
+    app = FastAPI(
+        openapi_url=f"{API_PREFIX}/openapi.json",
+        docs_url=f"{API_PREFIX}/ui",
+        lifespan=lifespan,
+    )
 
     app.add_middleware(
         CORSMiddleware,
@@ -43,6 +58,13 @@ def create_app(production=PRODUCTION) -> FastAPI:
         allow_headers=["*"],
         allow_credentials=True,
     )
+    app.middleware("http")(track_requests)
+    app.middleware("http")(server_timing)
+
+    # Prometheus scrapes the pod directly, outside of the API prefix
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+    # readiness is reported once the warm-up has finished
+    app.add_route("/ready", readiness_endpoint, include_in_schema=False)
 
     # Assemble the constituent APIs:
     app.include_router(osd_router, prefix=API_PREFIX, tags=["OSD"])
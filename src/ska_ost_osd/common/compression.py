@@ -0,0 +1,173 @@
+"""Content-Encoding negotiation for pre-encoded JSON responses.
+
+Template-expanded OSD responses compress very well. EncodedBody keeps a
+response body together with its compressed variants so that a body held
+in a cache is compressed at most once per encoding rather than once per
+request. brotli is preferred over gzip at equal quality values.
+"""
+
+import gzip
+import threading
+from os import environ
+from typing import Dict, Mapping, Optional
+
+import brotli
+
+from ska_ost_osd.common.metrics import stage_timer
+from ska_ost_osd.common.utils import EncodedJSONResponse
+
+# Bodies smaller than this are always sent uncompressed.
+COMPRESSION_MIN_BYTES = int(environ.get("OSD_COMPRESSION_MIN_BYTES", "1024"))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 6
+# supported content codings, most preferred first
+ENCODINGS = ("br", "gzip")
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the content coding for a request.
+
+    :param accept_encoding: Optional[str], Accept-Encoding header value.
+    :return: Optional[str], supported coding with the highest quality
+        value, None to send the body uncompressed.
+    """
+    if not accept_encoding:
+        return None
+
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a body with the given content coding.
+
+    :param body: bytes, body to compress.
+    :param encoding: str, "br" or "gzip".
+    :return: bytes, compressed body.
+    """
+    with stage_timer("compression"):
+        if encoding == "br":
+            return brotli.compress(body, quality=BROTLI_QUALITY)
+        # a fixed mtime keeps the output identical for identical bodies
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def representation_etag(etag: str, encoding: Optional[str]) -> str:
+    """Return the ETag of a compressed representation.
+
+    Compressed bodies are different representations and must not share
+    a strong ETag with the uncompressed body.
+
+    :param etag: str, quoted ETag of the uncompressed body.
+    :param encoding: Optional[str], content coding of the response.
+    :return: str, quoted ETag of the representation.
+    """
+    if encoding is None:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+class EncodedBody:
+    """Encoded JSON response body and its compressed variants.
+
+    Variants are computed on first use and kept, so a body shared through
+    a cache is compressed at most once per encoding.
+
+    :param body: bytes, uncompressed response body.
+    """
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self._variants: Dict[str, Optional[bytes]] = {}
+        self._lock = threading.Lock()
+
+    def variant(self, encoding: str) -> Optional[bytes]:
+        """Return the body compressed with encoding.
+
+        :param encoding: str, supported content coding.
+        :return: Optional[bytes], compressed body, or None when the body
+            is too small or does not get smaller.
+        """
+        if len(self.body) < COMPRESSION_MIN_BYTES:
+            return None
+        try:
+            return self._variants[encoding]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if encoding not in self._variants:
+                compressed = compress(self.body, encoding)
+                self._variants[encoding] = (
+                    compressed if len(compressed) < len(self.body) else None
+                )
+            return self._variants[encoding]
+
+    def precompress(self) -> "EncodedBody":
+        """Compute the variants of all supported encodings.
+
+        :return: EncodedBody, self.
+        """
+        for encoding in ENCODINGS:
+            self.variant(encoding)
+        return self
+
+    @property
+    def precompressed(self) -> bool:
+        """Whether the variants of all supported encodings are computed."""
+        return len(self.body) < COMPRESSION_MIN_BYTES or all(
+            encoding in self._variants for encoding in ENCODINGS
+        )
+
+    @property
+    def size(self) -> int:
+        """Summed size in bytes of the body and its variants."""
+        return len(self.body) + sum(
+            len(variant) for variant in self._variants.values() if variant
+        )
+
+    def response(
+        self,
+        accept_encoding: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> EncodedJSONResponse:
+        """Build the response for a request.
+
+        :param accept_encoding: Optional[str], Accept-Encoding header of
+            the request.
+        :param headers: Optional[Mapping[str, str]], additional response
+            headers.
+        :return: EncodedJSONResponse, response with the best variant.
+        """
+        response_headers = dict(headers or {})
+        response_headers["Vary"] = "Accept-Encoding"
+        content = self.body
+
+        encoding = negotiate_encoding(accept_encoding)
+        variant = self.variant(encoding) if encoding else None
+        if variant is not None:
+            content = variant
+            response_headers["Content-Encoding"] = encoding
+            if "ETag" in response_headers:
+                response_headers["ETag"] = representation_etag(
+                    response_headers["ETag"], encoding
+                )
+
+        return EncodedJSONResponse(content=content, headers=response_headers)
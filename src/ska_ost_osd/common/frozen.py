@@ -0,0 +1,61 @@
+"""Read-only containers for data shared between requests.
+
+FrozenDict and FrozenList subclass dict and list so that JSON encoders,
+pydantic and the isinstance checks used throughout OSD and semantic
+validation keep working, while any attempt to modify shared data raises
+a TypeError. Copying or pickling returns ordinary mutable containers.
+"""
+
+import copy
+from typing import Any
+
+
+def _read_only(self, *_args, **_kwargs):
+    raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+
+class FrozenDict(dict):
+    """Dictionary that cannot be modified after construction."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class FrozenList(list):
+    """List that cannot be modified after construction."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def freeze(data: Any) -> Any:
+    """Recursively convert dictionaries and lists into read-only views.
+
+    :param data: Any, JSON-like data.
+    :return: Any, the same data built from FrozenDict and FrozenList.
+    """
+    if isinstance(data, FrozenDict | FrozenList):
+        return data
+    if isinstance(data, dict):
+        return FrozenDict((key, freeze(value)) for key, value in data.items())
+    if isinstance(data, list):
+        return FrozenList(freeze(value) for value in data)
+    return data
@@ -0,0 +1,180 @@
+"""Prometheus metrics of the OSD service.
+
+Metrics are collected with ``prometheus_client`` in a registry of their
+own and exposed by GET /metrics:
+
+* ``osd_stage_duration_seconds``, a histogram per processing stage such
+  as TMData fetch, version lookup, document parsing, template mapping,
+  rule evaluation and response serialisation,
+* ``osd_http_request_duration_seconds`` per route and
+  ``osd_http_requests_in_flight``,
+* hit and miss counters and the hit ratio of every registered cache,
+  read from the caches when scraped,
+* metrics of other components registered as collectors, e.g. the number
+  of coalesced OSD resolutions in flight.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Mapping
+
+from fastapi import Request, Response
+from prometheus_client import CollectorRegistry, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.exposition import choose_encoder
+from prometheus_client.registry import Collector
+
+from ska_ost_osd.common.request_timing import record_stage
+
+# seconds, from cache hits to fetching a whole TMData source
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+registry = CollectorRegistry()
+
+
+class CacheCollector(Collector):
+    """Expose the hits, misses and hit ratio of registered caches.
+
+    The counts are read from the caches when scraped, so caches keep
+    their own statistics and do not depend on prometheus_client.
+    """
+
+    def __init__(self) -> None:
+        self._caches: Dict[str, Callable[[], Mapping[str, int]]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, cache: str, stats: Callable[[], Mapping[str, int]]) -> None:
+        """Add a cache, replacing a cache with the same name.
+
+        :param cache: str, cache name used as label value.
+        :param stats: Callable[[], Mapping[str, int]], returns a mapping
+            with "hits" and "misses".
+        """
+        with self._lock:
+            self._caches[cache] = stats
+
+    def collect(self) -> Iterator[Metric]:
+        with self._lock:
+            caches = list(self._caches.items())
+        hits = CounterMetricFamily("osd_cache_hits", "Cache hits", labels=["cache"])
+        misses = CounterMetricFamily(
+            "osd_cache_misses", "Cache misses", labels=["cache"]
+        )
+        ratio = GaugeMetricFamily(
+            "osd_cache_hit_ratio", "Cache hits per cache lookup", labels=["cache"]
+        )
+        for cache, stats in caches:
+            values = stats()
+            lookups = values["hits"] + values["misses"]
+            hits.add_metric([cache], values["hits"])
+            misses.add_metric([cache], values["misses"])
+            ratio.add_metric([cache], values["hits"] / lookups if lookups else 0.0)
+        yield from (hits, misses, ratio)
+
+
+cache_collector = CacheCollector()
+registry.register(cache_collector)
+
+
+def register_cache(cache: str, stats: Callable[[], Mapping[str, int]]) -> None:
+    """Expose the hit and miss counts of a cache.
+
+    :param cache: str, cache name used as label value.
+    :param stats: Callable[[], Mapping[str, int]], returns a mapping with
+        "hits" and "misses".
+    """
+    cache_collector.register(cache, stats)
+
+
+STAGE_DURATION = Histogram(
+    "osd_stage_duration_seconds",
+    "Duration of OSD request processing stages",
+    ("stage",),
+    buckets=DEFAULT_BUCKETS,
+    registry=registry,
+)
+REQUEST_DURATION = Histogram(
+    "osd_http_request_duration_seconds",
+    "Duration of HTTP requests",
+    ("method", "route"),
+    buckets=DEFAULT_BUCKETS,
+    registry=registry,
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "osd_http_requests_in_flight", "HTTP requests being processed", registry=registry
+)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Time a processing stage into osd_stage_duration_seconds and the
+    Server-Timing breakdown of the current request.
+
+    :param stage: str, stage name, e.g. "tmdata_fetch".
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        STAGE_DURATION.labels(stage=stage).observe(seconds)
+        record_stage(stage, seconds)
+
+
+def route_of(request: Request) -> str:
+    """Return the path template of the route that served a request.
+
+    Templates rather than raw paths keep the number of label values
+    bounded. The route is only known once the request has been routed.
+
+    :param request: Request, served request.
+    :return: str, route path or "unmatched".
+    """
+    route = request.scope.get("route")
+    return getattr(route, "path_format", None) or getattr(route, "path", "unmatched")
+
+
+async def track_requests(request: Request, call_next) -> Response:
+    """HTTP middleware recording request durations and requests in
+    flight.
+
+    :param request: Request, incoming request.
+    :param call_next: callable, next ASGI handler.
+    :return: Response, the response of the request.
+    """
+    REQUESTS_IN_FLIGHT.inc()
+    start = time.perf_counter()
+    try:
+        return await call_next(request)
+    finally:
+        REQUESTS_IN_FLIGHT.dec()
+        REQUEST_DURATION.labels(method=request.method, route=route_of(request)).observe(
+            time.perf_counter() - start
+        )
+
+
+def metrics_endpoint(request: Request) -> Response:
+    """Serve all metrics in the exposition format the scraper accepts.
+
+    :param request: Request, incoming request.
+    :return: Response, exposition text.
+    """
+    encoder, content_type = choose_encoder(request.headers.get("accept"))
+    return Response(content=encoder(registry), media_type=content_type)
@@ -0,0 +1,124 @@
+"""Per-request stage timings.
+
+Stages timed with ``stage_timer`` are also added to the timings of the
+request being served, which are returned in a ``Server-Timing`` header
+so that a slow call can be broken down from the client side. Requests
+taking longer than ``OSD_SLOW_REQUEST_THRESHOLD_MS`` log one line with
+the same breakdown and their query parameters.
+
+Timings follow the request through the context of the worker thread
+serving it. Work done on behalf of another request, e.g. a resolution
+shared through SingleFlight, is only counted for the request that did
+it.
+"""
+
+import json
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from os import environ
+from typing import Dict, Mapping, Optional
+
+from fastapi import Request, Response
+
+LOGGER = logging.getLogger(__name__)
+
+# Requests taking at least this long are logged with their stage timings.
+SLOW_REQUEST_THRESHOLD_MS = float(environ.get("OSD_SLOW_REQUEST_THRESHOLD_MS", "1000"))
+
+
+class RequestTimings:
+    """Summed stage durations of a single request."""
+
+    def __init__(self) -> None:
+        self._stages: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Add the duration of a stage, repeated stages are summed.
+
+        :param stage: str, stage name.
+        :param seconds: float, duration in seconds.
+        """
+        with self._lock:
+            self._stages[stage] = self._stages.get(stage, 0.0) + seconds
+
+    def stages(self) -> Dict[str, float]:
+        """Return the stage durations in the order the stages first ran.
+
+        :return: Dict[str, float], seconds per stage.
+        """
+        with self._lock:
+            return dict(self._stages)
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "osd_request_timings", default=None
+)
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    """Add a stage duration to the timings of the current request, if
+    any.
+
+    :param stage: str, stage name.
+    :param seconds: float, duration in seconds.
+    """
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add(stage, seconds)
+
+
+def server_timing_header(stages: Mapping[str, float], total: float) -> str:
+    """Format stage durations as a Server-Timing header value.
+
+    :param stages: Mapping[str, float], seconds per stage.
+    :param total: float, duration of the whole request in seconds.
+    :return: str, e.g. ``get_data;dur=1.204, total;dur=3.551``.
+    """
+    metrics = {**stages, "total": total}
+    return ", ".join(
+        f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in metrics.items()
+    )
+
+
+async def server_timing(request: Request, call_next) -> Response:
+    """HTTP middleware adding the Server-Timing header and logging slow
+    requests.
+
+    :param request: Request, incoming request.
+    :param call_next: callable, next ASGI handler.
+    :return: Response, the response with a Server-Timing header.
+    """
+    timings = RequestTimings()
+    token = _current_timings.set(timings)
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        _current_timings.reset(token)
+    total = time.perf_counter() - start
+
+    stages = timings.stages()
+    response.headers["Server-Timing"] = server_timing_header(stages, total)
+    response.headers["Timing-Allow-Origin"] = "*"
+
+    if total * 1000 >= SLOW_REQUEST_THRESHOLD_MS:
+        LOGGER.warning(
+            "Slow request: %s",
+            json.dumps(
+                {
+                    "method": request.method,
+                    "path": request.url.path,
+                    "query": dict(request.query_params),
+                    "status": response.status_code,
+                    "duration_ms": round(total * 1000, 3),
+                    "stages_ms": {
+                        stage: round(seconds * 1000, 3)
+                        for stage, seconds in stages.items()
+                    },
+                }
+            ),
+        )
+    return response
@@ -0,0 +1,123 @@
+"""Coalescing of concurrent identical calls.
+
+When many requests for the same data arrive at once, each of them would
+otherwise run the same expensive resolution in its own worker thread.
+SingleFlight lets the first caller for a key do the work while callers
+arriving before it finishes wait for and share its result. When the call
+fails, every waiter raises its own copy of the exception, chained to the
+original, so threads never re-raise one exception object concurrently.
+Nothing is kept once the call has finished, caching is left to the
+caller.
+"""
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+from ska_ost_osd.common.metrics import registry
+
+
+class _Call:
+    """A call in progress and its outcome."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def _copy_error(error: BaseException) -> BaseException:
+    """Return a copy of an exception without its traceback.
+
+    :param error: BaseException, exception raised by the running call.
+    :return: BaseException, the copy, or error itself if it cannot be
+        copied.
+    """
+    try:
+        return copy.copy(error).with_traceback(None)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return error
+
+
+class SingleFlight:
+    """Run a function at most once at a time per key.
+
+    Results are shared between all callers of a flight and must be
+    treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self.shared = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call function unless a call for key is already running, in which
+        case wait for that call and return its result.
+
+        :param key: Hashable, identifies calls that return the same result.
+        :param function: Callable, function to run.
+        :param args: positional arguments for function.
+        :param kwargs: keyword arguments for function.
+        :return: Any, result of function.
+        :raises Exception: Whatever function raised, in every caller.
+            Waiters raise a copy caused by the original exception.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise _copy_error(call.error) from call.error
+            return call.result
+
+        try:
+            call.result = function(*args, **kwargs)
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """Return the number of calls currently running."""
+        with self._lock:
+            return len(self._calls)
+
+
+class SingleFlightCollector(Collector):
+    """Expose the calls of a SingleFlight, read when scraped.
+
+    :param flight: SingleFlight, flight to report on.
+    """
+
+    def __init__(self, flight: SingleFlight) -> None:
+        self.flight = flight
+
+    def collect(self) -> Iterator[Metric]:
+        yield GaugeMetricFamily(
+            "osd_single_flight_in_flight",
+            "Coalesced resolutions currently running",
+            value=self.flight.in_flight(),
+        )
+        yield CounterMetricFamily(
+            "osd_single_flight_shared",
+            "Calls that shared the result of a running resolution",
+            value=self.flight.shared,
+        )
+
+
+single_flight = SingleFlight()
+registry.register(SingleFlightCollector(single_flight))
@@ -6,12 +6,14 @@ from http import HTTPStatus
 from pathlib import Path
 from typing import Any, Dict, List
 
-from fastapi import status
+import orjson
+from fastapi import Response, status
 
 from ska_ost_osd.common.constant import (
     API_RESPONSE_RESULT_STATUS_FAILED,
     API_RESPONSE_RESULT_STATUS_SUCCESS,
 )
+from ska_ost_osd.common.metrics import stage_timer
 from ska_ost_osd.common.models import ApiResponse
 
 logging.basicConfig(level=logging.INFO)
@@ -65,6 +67,60 @@ def convert_to_response_object(
     )
 
 
+def encode_json(data: Any) -> bytes:
+    """Serialise data to compact UTF-8 JSON with orjson.
+
+    :param data: Any, JSON serialisable data.
+    :return: bytes, encoded JSON.
+    """
+    return orjson.dumps(data)
+
+
+def response_envelope(
+    response: List[T] | Dict[str, T] | str, result_code: HTTPStatus
+) -> Dict[str, Any]:
+    """Return a response in the ApiResponse envelope as a plain dictionary.
+
+    :param response: response data.
+    :param result_code: HTTPStatus, status code of the response.
+    :return: Dict[str, Any], envelope with the ApiResponse fields.
+    """
+    result_status = (
+        API_RESPONSE_RESULT_STATUS_SUCCESS
+        if result_code == HTTPStatus.OK
+        else API_RESPONSE_RESULT_STATUS_FAILED
+    )
+    return {
+        "result_data": response,
+        "result_status": result_status,
+        "result_code": int(result_code),
+    }
+
+
+def encode_response_object(
+    response: List[T] | Dict[str, T] | str, result_code: HTTPStatus
+) -> bytes:
+    """Encode a response in the ApiResponse envelope without building and
+    validating the pydantic model.
+
+    The output is the JSON FastAPI would produce for the ApiResponse
+    returned by convert_to_response_object, so endpoints can keep
+    ApiResponse as their documented response_model.
+
+    :param response: response data, must be JSON serialisable.
+    :param result_code: HTTPStatus, status code of the response.
+    :return: bytes, encoded JSON response body.
+    """
+    with stage_timer("serialization"):
+        return encode_json(response_envelope(response, result_code))
+
+
+class EncodedJSONResponse(Response):
+    """Response sending an already encoded JSON body as is."""
+
+    media_type = "application/json"
+
+
 def get_responses(response_model) -> Dict[str, Any]:
     """Return a formatted responses dictionary for FastAPI.
 
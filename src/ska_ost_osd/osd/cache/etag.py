@@ -0,0 +1,135 @@
+"""Validators for conditional GET requests on OSD resources.
+
+ETags are strong content hashes of the snapshot a response is built from
+plus the normalised query, so they can be compared before any OSD data
+is resolved. Released OSD versions never change, their ETag only depends
+on the source URI. Clients may only cache them indefinitely when the
+release was requested explicitly, queries resolved to the latest release
+or through a cycle point at a new release once one is made. Branch and
+file sources are hashed from the content of the files OSD reads and
+always have to be revalidated.
+"""
+
+import hashlib
+import json
+from importlib.metadata import version
+from typing import Any, List, Optional, Tuple
+
+from ska_telmodel_client import TMData
+
+from ska_ost_osd.osd.cache.snapshot_cache import snapshot_cache
+from ska_ost_osd.osd.cache.tmdata_pool import (
+    is_pinned_source,
+    is_release_ref,
+    source_key,
+    tmdata_pool,
+)
+from ska_ost_osd.osd.common.constant import osd_file_mapping
+
+# responses may change between service releases even for the same data
+SERVICE_VERSION = version("ska-ost-osd")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+SNAPSHOT_FILES = (
+    osd_file_mapping["observatory_policies"],
+    osd_file_mapping["mid"],
+    osd_file_mapping["low"],
+    osd_file_mapping["subarray_templates"],
+)
+
+
+def compute_etag(*parts: Any) -> str:
+    """Return a strong ETag for JSON serialisable parts.
+
+    :param parts: Any, values identifying the response content.
+    :return: str, quoted sha256 hex digest.
+    """
+    content = json.dumps(
+        [SERVICE_VERSION, *parts], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return f'"{hashlib.sha256(content.encode("utf-8")).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag.
+
+    Comparison is weak as required for If-None-Match, so ``W/`` prefixed
+    tags added by proxies still match.
+
+    :param if_none_match: Optional[str], If-None-Match header value.
+    :param etag: str, current ETag of the resource.
+    :return: bool, True when the client copy is current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def snapshot_digest(tmdata: TMData) -> str:
+    """Return a content hash of the OSD files of a snapshot, computed once
+    per snapshot.
+
+    :param tmdata: TMData, snapshot to hash.
+    :return: str, sha256 hex digest.
+    """
+
+    def digest() -> str:
+        sha = hashlib.sha256()
+        for path in SNAPSHOT_FILES:
+            try:
+                content = tmdata[path].get()
+            except KeyError:
+                content = b""
+            sha.update(path.encode("utf-8"))
+            sha.update(hashlib.sha256(content).digest())
+        return sha.hexdigest()
+
+    return snapshot_cache.derived(tmdata, "content_digest", digest)
+
+
+def osd_validators(
+    tm_data_source: List[str],
+    cycle_id: Optional[int] = None,
+    capabilities: Optional[str] = None,
+    array_assembly: Optional[str] = None,
+    process_templates: bool = False,
+    fields: Optional[Tuple[str, ...]] = None,
+    expand_templates: bool = True,
+    requested_ref: Optional[str] = None,
+) -> Tuple[str, str]:
+    """Return the ETag and Cache-Control header of an OSD query.
+
+    :param tm_data_source: List[str], resolved TMData source URIs.
+    :param cycle_id: int, optional cycle ID.
+    :param capabilities: str, optional capabilities.
+    :param array_assembly: str, optional array assembly.
+    :param process_templates: bool, whether templates are processed.
+    :param fields: Optional[Tuple[str, ...]], selected fields.
+    :param expand_templates: bool, whether templates are expanded.
+    :param requested_ref: Optional[str], osd_version or gitlab_branch as
+        given by the caller, the response is only cacheable indefinitely
+        when it names a release.
+    :return: Tuple[str, str], ETag and Cache-Control header values.
+    """
+    query = [
+        cycle_id,
+        capabilities,
+        array_assembly,
+        process_templates,
+        fields,
+        expand_templates,
+    ]
+    if is_pinned_source(tm_data_source):
+        cache_control = (
+            IMMUTABLE_CACHE_CONTROL
+            if is_release_ref(requested_ref)
+            else REVALIDATE_CACHE_CONTROL
+        )
+        return compute_etag(source_key(tm_data_source), query), cache_control
+
+    tmdata = tmdata_pool.get(tm_data_source)
+    return compute_etag(snapshot_digest(tmdata), query), REVALIDATE_CACHE_CONTROL
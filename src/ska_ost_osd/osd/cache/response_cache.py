@@ -0,0 +1,152 @@
+"""LRU cache of fully resolved OSD responses.
+
+OSD data behind a released version never changes, so the resolved
+payload for a given query can be reused until it is evicted. The cache
+is bounded by the total serialised size of its entries rather than by
+entry count, because payloads range from a few KB to several hundred KB
+once subarray templates are expanded.
+
+The resolved data of a query and its encoded GET /osd body share one
+CachedResponse entry, so a hot query is only held once and its size is
+counted in full against the byte budget. The data is serialised once,
+into the body, whose length also stands in for the size of the data.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from os import environ
+from typing import Any, Dict, Hashable, Optional
+
+from ska_ost_osd.common.compression import EncodedBody
+from ska_ost_osd.common.metrics import register_cache
+from ska_ost_osd.common.utils import encode_json
+
+LOGGER = logging.getLogger(__name__)
+
+# Upper bound for the summed size of all cached responses.
+RESPONSE_CACHE_MAX_BYTES = int(
+    environ.get("OSD_RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+
+
+def payload_size(payload: Any) -> int:
+    """Return the size of a payload serialised as compact JSON.
+
+    :param payload: Any, JSON serialisable payload.
+    :return: int, size in bytes.
+    """
+    return len(encode_json(payload))
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Resolved OSD data of a query and its encoded GET /osd response body.
+
+    :param data: Any, read-only OSD data.
+    :param encoded: EncodedBody, encoded ApiResponse envelope around data,
+        compressed variants are added once it is served by GET /osd.
+    """
+
+    data: Any
+    encoded: EncodedBody
+
+    @property
+    def size(self) -> int:
+        """Size in bytes of the data, estimated by the length of the
+        uncompressed body, and of the encoded body with its variants."""
+        return len(self.encoded.body) + self.encoded.size
+
+
+class ResponseCache:
+    """Thread-safe LRU cache bounded by the size of its entries in bytes.
+
+    Cached values are shared between requests and must be treated as
+    read-only by callers.
+
+    :param max_bytes: int, maximum summed size of all entries. Entries
+        larger than this are never cached.
+    """
+
+    def __init__(self, max_bytes: int = RESPONSE_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, tuple[Any, int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value and mark it as most recently used.
+
+        :param key: Hashable, cache key.
+        :return: Optional[Any], cached value or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None) -> None:
+        """Store a value, evicting least recently used entries as needed.
+
+        :param key: Hashable, cache key.
+        :param value: Any, value to cache.
+        :param size: Optional[int], size of the value in bytes, computed
+            from its JSON form when not given.
+        """
+        if size is None:
+            size = payload_size(value)
+        if size > self.max_bytes:
+            LOGGER.info("Not caching response of %d bytes for %s", size, key)
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def size(self) -> int:
+        """Summed size in bytes of all cached entries."""
+        return self._size
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache statistics.
+
+        :return: Dict[str, int], hits, misses, number of entries and size
+            in bytes.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+response_cache = ResponseCache()
+register_cache("response", response_cache.stats)
@@ -0,0 +1,125 @@
+"""Per-snapshot cache of parsed TMData documents.
+
+A TMData instance is an immutable snapshot of an OSD source, so every
+file in it only needs to be parsed once, and anything computed purely
+from its files only needs to be computed once. Parsed documents and
+derived results are stored as read-only views and shared between all
+requests using the snapshot. Entries are held weakly and disappear
+together with their TMData, e.g. when the TMData pool refreshes a branch
+source.
+"""
+
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable
+
+from ska_telmodel_client import TMData
+
+from ska_ost_osd.common.frozen import freeze
+from ska_ost_osd.common.metrics import register_cache, stage_timer
+
+
+class _SnapshotEntry:
+    """Parsed documents and derived results of a single TMData snapshot."""
+
+    def __init__(self) -> None:
+        self.documents: Dict[str, Any] = {}
+        self.derived: Dict[Hashable, Any] = {}
+        # re-entrant because derived factories read documents
+        self.lock = threading.RLock()
+
+
+class SnapshotCache:
+    """Thread-safe cache of parsed documents keyed by TMData snapshot."""
+
+    def __init__(self) -> None:
+        self._snapshots: "weakref.WeakKeyDictionary[TMData, _SnapshotEntry]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        # counted without locking the read path, approximate under load
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, tmdata: TMData) -> _SnapshotEntry:
+        with self._lock:
+            entry = self._snapshots.get(tmdata)
+            if entry is None:
+                entry = self._snapshots[tmdata] = _SnapshotEntry()
+            return entry
+
+    def document(self, tmdata: TMData, path: str) -> Any:
+        """Return a read-only view of a parsed JSON document.
+
+        :param tmdata: TMData, snapshot to read from.
+        :param path: str, path of the JSON file inside the snapshot.
+        :return: Any, parsed document built from FrozenDict and
+            FrozenList.
+        :raises KeyError: If the file does not exist in the snapshot.
+        """
+        entry = self._entry(tmdata)
+        try:
+            document = entry.documents[path]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return document
+
+        with entry.lock:
+            if path in entry.documents:
+                self.hits += 1
+            else:
+                self.misses += 1
+                with stage_timer("get_data"):
+                    entry.documents[path] = freeze(tmdata[path].get_dict())
+            return entry.documents[path]
+
+    def derived(self, tmdata: TMData, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return a result computed from the snapshot, computing it once.
+
+        :param tmdata: TMData, snapshot the result is derived from.
+        :param key: Hashable, identifies the derived result.
+        :param factory: Callable[[], Any], computes the result. It must
+            only depend on the snapshot.
+        :return: Any, read-only view of the result.
+        """
+        entry = self._entry(tmdata)
+        try:
+            result = entry.derived[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return result
+
+        with entry.lock:
+            if key in entry.derived:
+                self.hits += 1
+            else:
+                self.misses += 1
+                entry.derived[key] = freeze(factory())
+            return entry.derived[key]
+
+    def clear(self) -> None:
+        """Drop all cached snapshots and reset the statistics."""
+        with self._lock:
+            self._snapshots.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache statistics.
+
+        :return: Dict[str, int], hits, misses and number of snapshots.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._snapshots),
+            }
+
+
+snapshot_cache = SnapshotCache()
+register_cache("snapshot", snapshot_cache.stats)
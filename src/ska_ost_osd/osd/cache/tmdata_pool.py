@@ -0,0 +1,195 @@
+"""Process-wide pool of TMData instances.
+
+Building a TMData object fetches and unpacks the whole source (CAR
+package or GitLab archive), so doing it on every request dominates the
+OSD API latency. The pool keeps one TMData instance per resolved source
+URI and decides per source whether it may ever go stale:
+
+* pinned sources (``car``/``gitlab`` sources that point at a released
+  OSD version such as ``6.0.5``) never change and are never refreshed.
+* mutable sources (branches such as ``main``, and local ``file`` sources)
+  are rebuilt with ``update=True`` once their TTL has expired.
+"""
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from os import environ
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from ska_telmodel_client import TMData
+
+from ska_ost_osd.common.metrics import register_cache, stage_timer
+from ska_ost_osd.osd.common.constant import OSD_VERSION_PATTERN
+
+LOGGER = logging.getLogger(__name__)
+
+# TTL in seconds after which a mutable (branch or file) source is re-fetched.
+TMDATA_POOL_TTL_SECONDS = float(environ.get("OSD_TMDATA_POOL_TTL_SECONDS", "300"))
+
+SOURCE_REF_PATTERN = re.compile(r"\?(?P<ref>[^#]+)")
+
+SourceKey = Tuple[str, ...]
+
+
+def source_key(source_uris: Iterable[str]) -> SourceKey:
+    """Normalise source URIs into a hashable pool key.
+
+    :param source_uris: Iterable[str], source URIs as produced by
+        osd_tmdata_source.
+    :return: SourceKey, tuple of source URIs.
+    """
+    if isinstance(source_uris, str):
+        return (source_uris,)
+    return tuple(source_uris)
+
+
+def is_release_ref(ref: Optional[str]) -> bool:
+    """Check whether a ref names a released OSD version such as ``6.0.5``.
+
+    :param ref: Optional[str], OSD version, branch or tag name.
+    :return: bool, True if the whole ref is a release version.
+    """
+    return ref is not None and re.fullmatch(OSD_VERSION_PATTERN, ref) is not None
+
+
+def is_pinned_source(source_uris: Iterable[str]) -> bool:
+    """Check whether all source URIs point at a released OSD version.
+
+    A source is pinned when it is a ``car`` or ``gitlab`` source whose ref
+    is exactly a version matching OSD_VERSION_PATTERN, e.g.
+    ``car:ost/ska-ost-osd?6.0.5#tmdata``. Branches like ``main`` or
+    ``1.2.3-fix`` and local ``file`` sources are mutable.
+
+    :param source_uris: Iterable[str], source URIs to check.
+    :return: bool, True if the content behind the URIs can never change.
+    """
+    key = source_key(source_uris)
+    if not key:
+        return False
+
+    for uri in key:
+        if uri.startswith("file"):
+            return False
+        match = SOURCE_REF_PATTERN.search(uri)
+        if not match or not is_release_ref(match.group("ref")):
+            return False
+    return True
+
+
+@dataclass
+class _PoolEntry:
+    """Pooled TMData instance with its refresh bookkeeping."""
+
+    tmdata: Optional[TMData] = None
+    loaded_at: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class TMDataPool:
+    """Thread-safe pool of TMData instances keyed by resolved source URI.
+
+    :param ttl_seconds: float, TTL for mutable sources. A value of 0 or
+        less rebuilds mutable sources on every request.
+    :param pinned_ttl_seconds: Optional[float], TTL for pinned sources,
+        None means they are never refreshed.
+    :param factory: Callable, used to build TMData instances.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = TMDATA_POOL_TTL_SECONDS,
+        pinned_ttl_seconds: Optional[float] = None,
+        factory: Callable[..., TMData] = None,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.pinned_ttl_seconds = pinned_ttl_seconds
+        self.factory = factory
+        # counted without locking the read path, approximate under load
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[SourceKey, _PoolEntry] = {}
+        self._lock = threading.Lock()
+
+    def _ttl_for(self, key: SourceKey) -> Optional[float]:
+        return self.pinned_ttl_seconds if is_pinned_source(key) else self.ttl_seconds
+
+    def _is_fresh(self, entry: _PoolEntry, ttl: Optional[float]) -> bool:
+        if entry.tmdata is None:
+            return False
+        if ttl is None:
+            return True
+        return (time.monotonic() - entry.loaded_at) < ttl
+
+    def get(self, source_uris: Iterable[str]) -> TMData:
+        """Return the pooled TMData for the given sources, building or
+        refreshing it when required.
+
+        Concurrent callers for the same source wait for a single build
+        instead of each fetching the source.
+
+        :param source_uris: Iterable[str], source URIs for TMData.
+        :return: TMData, shared TMData instance.
+        """
+        key = source_key(source_uris)
+        ttl = self._ttl_for(key)
+
+        with self._lock:
+            entry = self._entries.setdefault(key, _PoolEntry())
+
+        if self._is_fresh(entry, ttl):
+            self.hits += 1
+            return entry.tmdata
+
+        with entry.lock:
+            if self._is_fresh(entry, ttl):
+                self.hits += 1
+            else:
+                self.misses += 1
+                # a pinned source only needs the local download cache,
+                # anything else must be fetched again
+                update = ttl is not None
+                LOGGER.info("Loading TMData for %s (update=%s)", key, update)
+                factory = self.factory or TMData
+                with stage_timer("tmdata_fetch"):
+                    entry.tmdata = factory(list(key), update=update)
+                entry.loaded_at = time.monotonic()
+            return entry.tmdata
+
+    def invalidate(self, source_uris: Optional[Iterable[str]] = None) -> None:
+        """Drop pooled TMData so the next request rebuilds it.
+
+        :param source_uris: Optional[Iterable[str]], sources to drop, all
+            mutable sources are dropped if not given.
+        """
+        with self._lock:
+            if source_uris is not None:
+                self._entries.pop(source_key(source_uris), None)
+                return
+            for key in [key for key in self._entries if not is_pinned_source(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every pooled TMData instance and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return pool statistics.
+
+        :return: Dict[str, int], hits, misses and number of loaded
+            instances.
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(1 for entry in self._entries.values() if entry.tmdata)
+
+
+tmdata_pool = TMDataPool()
+register_cache("tmdata_pool", tmdata_pool.stats)
@@ -0,0 +1,209 @@
+"""Startup warm-up of the OSD caches and readiness reporting.
+
+Right after a rollout the first requests for each OSD release pay for
+the TMData fetch, document parsing and template resolution. The warm-up
+does this work for the latest release and for every release of the
+active cycles before the pod reports ready, so Kubernetes only routes
+traffic to it once requests are served at steady-state latency.
+
+Releases are warmed in parallel in the background, GET /ready answers
+503 until all of them have been attempted. A release that fails to warm
+is logged and listed but does not keep the pod unready, it will be
+loaded on first use instead.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from os import environ
+from typing import Dict, List, Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from ska_ost_osd.osd.cache.etag import snapshot_digest
+from ska_ost_osd.osd.cache.snapshot_cache import snapshot_cache
+from ska_ost_osd.osd.cache.tmdata_pool import tmdata_pool
+from ska_ost_osd.osd.common.constant import osd_file_mapping
+from ska_ost_osd.osd.osd import OSD, osd_tmdata_source
+from ska_ost_osd.osd.version_mapping.version_resolver import version_resolver
+
+LOGGER = logging.getLogger(__name__)
+
+WARMUP_ENABLED = environ.get("OSD_WARMUP_ENABLED", "true").lower() == "true"
+# Comma separated cycle IDs whose releases are warmed, all cycles if empty.
+ACTIVE_CYCLES = environ.get("OSD_ACTIVE_CYCLES", "")
+WARMUP_WORKERS = int(environ.get("OSD_WARMUP_WORKERS", "4"))
+WARMUP_SOURCE = environ.get("OSD_WARMUP_SOURCE", "car")
+
+TELESCOPES = ("mid", "low")
+
+
+def parse_cycles(cycles: str) -> Optional[List[int]]:
+    """Parse a comma separated list of cycle IDs.
+
+    :param cycles: str, e.g. "1,2".
+    :return: Optional[List[int]], cycle IDs or None when empty.
+    """
+    parsed = [int(cycle) for cycle in cycles.split(",") if cycle.strip()]
+    return parsed or None
+
+
+def warmup_versions(
+    versions_dict: Dict[str, List[str]],
+    latest_version: str,
+    active_cycles: Optional[List[int]] = None,
+) -> List[str]:
+    """Return the OSD versions to warm, latest first.
+
+    :param versions_dict: Dict[str, List[str]], cycle to version mapping.
+    :param latest_version: str, latest released OSD version.
+    :param active_cycles: Optional[List[int]], cycles whose versions are
+        warmed, all cycles when not given.
+    :return: List[str], distinct versions.
+    """
+    versions = [latest_version]
+    for cycle, cycle_versions in versions_dict.items():
+        if active_cycles is None or int(cycle.split("_")[-1]) in active_cycles:
+            versions.extend(cycle_versions)
+    return list(dict.fromkeys(versions))
+
+
+def warm_version(osd_version: str, source: str = WARMUP_SOURCE) -> None:
+    """Load an OSD release and compute everything requests derive from
+    its snapshot.
+
+    :param osd_version: str, OSD version such as "6.0.5".
+    :param source: str, "car" or "gitlab".
+    :raises Exception: If the release cannot be loaded.
+    """
+    tm_data_source, errors = osd_tmdata_source(osd_version=osd_version, source=source)
+    if errors:
+        raise ValueError(errors)
+
+    tm_data = tmdata_pool.get(tm_data_source)
+    snapshot_digest(tm_data)
+    snapshot_cache.document(tm_data, osd_file_mapping["observatory_policies"])
+    for expand_templates in (False, True):
+        osd = OSD(
+            capabilities=None,
+            array_assembly=None,
+            tmdata=tm_data,
+            cycle_id=None,
+            process_templates=True,
+            expand_templates=expand_templates,
+        )
+        for telescope in TELESCOPES:
+            osd.get_resolved_capabilities(tm_data, osd_file_mapping[telescope])
+
+
+class Warmup:
+    """Runs the cache warm-up once and reports readiness.
+
+    :param enabled: bool, when False the service is ready immediately.
+    :param workers: int, number of releases warmed in parallel.
+    """
+
+    def __init__(
+        self, enabled: bool = WARMUP_ENABLED, workers: int = WARMUP_WORKERS
+    ) -> None:
+        self.enabled = enabled
+        self.workers = workers
+        self.warmed: List[str] = []
+        self.failed: Dict[str, str] = {}
+        self.duration: Optional[float] = None
+        self._done = threading.Event()
+        self._started = False
+        self._lock = threading.Lock()
+        if not enabled:
+            self._done.set()
+
+    @property
+    def ready(self) -> bool:
+        """True once the warm-up has finished or is disabled."""
+        return self._done.is_set()
+
+    def _warm(self, osd_version: str) -> None:
+        try:
+            warm_version(osd_version)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            LOGGER.warning("Failed to warm OSD version %s: %s", osd_version, error)
+            with self._lock:
+                self.failed[osd_version] = str(error)
+        else:
+            with self._lock:
+                self.warmed.append(osd_version)
+
+    def run(self) -> None:
+        """Warm the latest release and the releases of the active cycles,
+        then report ready."""
+        start = time.perf_counter()
+        try:
+            snapshot = version_resolver.snapshot()
+            versions = warmup_versions(
+                snapshot.versions_dict,
+                snapshot.latest_version,
+                parse_cycles(ACTIVE_CYCLES),
+            )
+            LOGGER.info("Warming OSD versions %s", versions)
+            with ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="osd-warmup"
+            ) as executor:
+                list(executor.map(self._warm, versions))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            LOGGER.warning("OSD warm-up failed: %s", error)
+            with self._lock:
+                self.failed["version_mapping"] = str(error)
+        finally:
+            self.duration = time.perf_counter() - start
+            LOGGER.info(
+                "OSD warm-up finished in %.2fs, warmed %s",
+                self.duration,
+                self.warmed,
+            )
+            self._done.set()
+
+    def start(self) -> None:
+        """Run the warm-up in a background thread, only the first call
+        has an effect."""
+        with self._lock:
+            if not self.enabled or self._started:
+                return
+            self._started = True
+        threading.Thread(target=self.run, name="osd-warmup", daemon=True).start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the warm-up to finish.
+
+        :param timeout: Optional[float], seconds to wait at most.
+        :return: bool, True if the service is ready.
+        """
+        return self._done.wait(timeout)
+
+    def status(self) -> Dict:
+        """Return the readiness state.
+
+        :return: Dict, ready flag, warmed and failed versions and the
+            warm-up duration in seconds.
+        """
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "warmed": list(self.warmed),
+                "failed": dict(self.failed),
+                "duration_seconds": self.duration,
+            }
+
+
+osd_warmup = Warmup()
+
+
+def readiness_endpoint(_request: Request) -> JSONResponse:
+    """Report whether the OSD caches are warm.
+
+    :param _request: Request, incoming request.
+    :return: JSONResponse, 200 once ready, 503 before.
+    """
+    status = osd_warmup.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
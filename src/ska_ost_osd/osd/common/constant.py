@@ -1,5 +1,7 @@
 """Created file to maintain OSD Model constants."""
 
+from ska_ost_osd.common.frozen import freeze
+
 MID_CONSTANT_JSON_FILE_PATH = "ska1_mid/mid_capabilities.json"
 LOW_CONSTANT_JSON_FILE_PATH = "ska1_low/low_capabilities.json"
 POLICIES_CONSTANT_JSON_FILE_PATH = "observatory_policies.json"
@@ -17,10 +19,12 @@ osd_file_mapping = {
     "subarray_templates": SUBARRAY_TEMPLATES_PATH,
 }
 
-osd_response_template = {
-    "observatory_policy": {"cycle_number": 1, "telescope_capabilities": []},
-    "capabilities": {},
-}
+osd_response_template = freeze(
+    {
+        "observatory_policy": {"cycle_number": 1, "telescope_capabilities": []},
+        "capabilities": {},
+    }
+)
 
 
 BASE_URL = "//gitlab.com/ska-telescope/"
@@ -19,3 +19,4 @@ ARRAY_ASSEMBLY_INVALID_ERROR_MESSAGE = "array_assembly {} is not valid"
 ARRAY_ASSEMBLY_DOESNOT_BELONGS_TO_CYCLE_ERROR_MESSAGE = (
     "Array Assembly {} does not belongs to cycle {}"
 )
+FIELD_DOESNOT_EXIST_ERROR_MESSAGE = "Field {} does not exist in the OSD data"
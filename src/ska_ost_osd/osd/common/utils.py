@@ -3,15 +3,12 @@ import os
 from pathlib import Path
 from typing import Dict
 
-from ska_telmodel_client import TMData
-
 from ska_ost_osd.common.utils import read_json
 from ska_ost_osd.osd.common.constant import (
-    GITLAB_SOURCE,
     LOW_CAPABILITIES_JSON_PATH,
     MID_CAPABILITIES_JSON_PATH,
-    RELEASE_FILE_PATH_LATEST,
 )
+from ska_ost_osd.osd.version_mapping.version_resolver import version_resolver
 
 
 def load_json_from_file(filename):
@@ -51,14 +48,12 @@ def read_file(filename: Path) -> Dict:
 def get_osd_latest_version() -> str:
     """Read the latest_release.txt file and retrieve the latest OSD version.
 
+    The value is served from the in-memory version resolver, which
+    refreshes it from GitLab in the background.
+
     :return: str, the latest OSD release version.
     """
-    tmdata_version = TMData(GITLAB_SOURCE, update=True)
-    osd_version = (
-        tmdata_version[RELEASE_FILE_PATH_LATEST].get().decode("utf-8").replace('"', "")
-    )
-
-    return osd_version
+    return version_resolver.latest_version
 
 
 def get_mid_low_capabilities(data: dict):
@@ -0,0 +1,157 @@
+"""Field selection for OSD responses.
+
+Callers of GET /osd often only need a few values out of the full
+capabilities tree. A selection is a comma separated list of paths, each
+either a JSON pointer (``/capabilities/mid/AA0.5/number_ska_dishes``) or
+a dotted path (``AA0.5.number_ska_dishes``). Dotted paths whose first
+key is not a top level key of the response are resolved against every
+telescope under ``capabilities``. Keys may contain dots themselves, such
+as ``AA0.5``, so dotted paths match the longest key present at each
+level. Only dictionary keys can be selected, lists are returned whole.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+ROOT_KEYS = ("observatory_policy", "capabilities")
+TEMPLATES_KEY = "subarray_templates"
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Split a fields query parameter into its paths.
+
+    :param fields: Optional[str], comma separated paths.
+    :return: Optional[Tuple[str, ...]], unique paths in order, or None
+        when nothing is selected.
+    """
+    if not fields:
+        return None
+    paths = tuple(dict.fromkeys(path.strip() for path in fields.split(",")))
+    return tuple(path for path in paths if path) or None
+
+
+def _pointer_segments(pointer: str) -> List[str]:
+    return [
+        segment.replace("~1", "/").replace("~0", "~")
+        for segment in pointer.split("/")[1:]
+    ]
+
+
+def _resolve_pointer(data: Any, segments: List[str]) -> Optional[List[str]]:
+    keys = []
+    for segment in segments:
+        if not isinstance(data, dict) or segment not in data:
+            return None
+        data = data[segment]
+        keys.append(segment)
+    return keys
+
+
+def _resolve_dotted(data: Any, parts: List[str]) -> Optional[List[str]]:
+    keys = []
+    position = 0
+    while position < len(parts):
+        if not isinstance(data, dict):
+            return None
+        # longest match first so that "AA0.5" wins over "AA0"
+        for end in range(len(parts), position, -1):
+            key = ".".join(parts[position:end])
+            if key in data:
+                data = data[key]
+                keys.append(key)
+                position = end
+                break
+        else:
+            return None
+    return keys
+
+
+def _resolve(osd_data: Dict, path: str) -> Iterator[List[str]]:
+    """Yield the key path of every subtree a path selects."""
+    if path.startswith("/"):
+        keys = _resolve_pointer(osd_data, _pointer_segments(path))
+        if keys is not None:
+            yield keys
+        return
+
+    parts = path.split(".")
+    if parts[0] in ROOT_KEYS:
+        keys = _resolve_dotted(osd_data, parts)
+        if keys is not None:
+            yield keys
+        return
+
+    for telescope, telescope_data in osd_data.get("capabilities", {}).items():
+        keys = _resolve_dotted(telescope_data, parts)
+        if keys is not None:
+            yield ["capabilities", telescope, *keys]
+
+
+def _insert(selected: Dict, osd_data: Dict, keys: List[str]) -> None:
+    node, source = selected, osd_data
+    for key in keys[:-1]:
+        source = source[key]
+        child = node.get(key)
+        if child is source:
+            # an enclosing subtree is already selected whole
+            return
+        if child is None:
+            child = node[key] = {}
+        node = child
+    node[keys[-1]] = source[keys[-1]]
+
+
+def select_fields(osd_data: Dict, fields: Tuple[str, ...]) -> Tuple[Dict, List[str]]:
+    """Return only the selected subtrees of an OSD response.
+
+    The selected values are shared with osd_data, only the dictionaries
+    leading to them are new.
+
+    :param osd_data: Dict, OSD response data.
+    :param fields: Tuple[str, ...], JSON pointers or dotted paths.
+    :return: Tuple[Dict, List[str]], selected data with the structure of
+        osd_data and the paths that matched nothing.
+    """
+    selected: Dict = {}
+    missing = []
+    # shorter paths first so that whole subtrees are not split up again
+    resolved = []
+    for path in fields:
+        matches = list(_resolve(osd_data, path))
+        if not matches:
+            missing.append(path)
+        resolved.extend(matches)
+
+    for keys in sorted(resolved, key=len):
+        _insert(selected, osd_data, keys)
+    return selected, missing
+
+
+def path_has_key(path: str, key: str) -> bool:
+    """Check whether a path passes through a key without a dot in it.
+
+    :param path: str, JSON pointer or dotted path.
+    :param key: str, key to look for.
+    :return: bool, True if one of the path segments is the key.
+    """
+    if path.startswith("/"):
+        return key in _pointer_segments(path)
+    return key in path.split(".")
+
+
+def contains_key(data: Any, key: str) -> bool:
+    """Check whether a key occurs anywhere in nested dictionaries.
+
+    :param data: Any, data to search.
+    :param key: str, key to look for.
+    :return: bool, True if any dictionary in data has the key.
+    """
+    stack = [data]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if key in current:
+                return True
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+    return False
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Literal, Optional, TypeVar
 
 from pydantic import BaseModel, Field, model_validator
 
+from ska_ost_osd.common.models import ApiResponse
 from ska_ost_osd.osd.common.constant import ARRAY_ASSEMBLY_PATTERN, OSD_VERSION_PATTERN
 from ska_ost_osd.osd.common.error_handling import CapabilityError, OSDModelError
 from ska_ost_osd.osd.common.osd_validation_messages import (
@@ -202,6 +203,12 @@ class OSDQueryParams(BaseModel):
     :param array_assembly: Optional[str], the version identifier of the Array
         Assembly component.
         Example: "AA0.5"
+    :param expand_templates: bool, return the data of the matching
+        subarray templates instead of only their names. Defaults to False.
+        Example: False
+    :param fields: Optional[str], comma separated JSON pointers or dotted
+        paths of the fields to return, all fields when not given.
+        Example: "basic_capabilities.receiver_information"
     """
 
     cycle_id: Optional[int] = Field(
@@ -237,3 +244,120 @@ class OSDQueryParams(BaseModel):
         title="Array Assembly",
         example="AA0.5",
     )
+    expand_templates: bool = Field(
+        default=False,
+        description=(
+            "Return the data of the subarray templates matching each array"
+            " assembly instead of only their names"
+        ),
+        title="Expand Templates",
+        example=False,
+    )
+    fields: Optional[str] = Field(
+        default=None,
+        description=(
+            "Comma separated JSON pointers or dotted paths of the fields to"
+            " return. Dotted paths not starting with observatory_policy or"
+            " capabilities are resolved under each telescope's capabilities"
+        ),
+        title="Fields",
+        example="basic_capabilities.receiver_information,AA0.5.number_ska_dishes",
+    )
+
+
+class OSDBatchResult(ApiResponse[Any]):
+    """Result of a single query of an OSD batch request.
+
+    result_data holds the OSD data on success and the error messages
+    otherwise, result_code is the status the query would have returned
+    as a separate GET /osd request.
+
+    :param query: OSDQueryParams, the query this result belongs to.
+    """
+
+    query: OSDQueryParams
+
+
+class SubarrayTemplateQueryParams(BaseModel):
+    """Query parameters for listing subarray templates.
+
+    :param cycle_id: Optional[int], the ID of the release cycle.
+    :param osd_version: Optional[str], the version of the OSD to read the
+        template library from.
+    :param source: Optional[Literal["car", "file", "gitlab"]], the source
+        from which the OSD is obtained.
+    :param gitlab_branch: Optional[str], the name of the GitLab branch.
+    :param pattern: str, comma separated glob patterns of template names.
+        Example: "LOW_*_AA2"
+    :param telescope: Optional[Literal["mid", "low"]], leave out the
+        templates of the other telescope.
+    :param subarray_type: Optional[str], only list templates with this
+        subarray_type.
+        Example: "custom"
+    :param page: int, page number starting at 1.
+    :param page_size: int, number of templates per page, at most 100.
+    """
+
+    cycle_id: Optional[int] = Field(
+        default=None, example=1, description="Cycle ID", title="Cycle ID"
+    )
+    osd_version: Optional[str] = Field(
+        default=None,
+        pattern=OSD_VERSION_PATTERN,
+        example="1.0.0",
+        description="OSD Version (e.g., 1.0.0)",
+        title="OSD Version",
+    )
+    source: Optional[Literal["car", "file", "gitlab"]] = Field(
+        default="car",
+        description="Source of OSD release",
+        title="Source",
+        example="file",
+    )
+    gitlab_branch: Optional[str] = Field(
+        default=None,
+        description="GitLab branch name",
+        title="GitLab Branch",
+        example="gitlab_branch",
+    )
+    pattern: str = Field(
+        default="*",
+        description="Comma separated glob patterns of template names",
+        title="Pattern",
+        example="LOW_*_AA2",
+    )
+    telescope: Optional[Literal["mid", "low"]] = Field(
+        default=None,
+        description="Leave out the templates of the other telescope",
+        title="Telescope",
+        example="low",
+    )
+    subarray_type: Optional[str] = Field(
+        default=None,
+        description="Subarray type of the templates",
+        title="Subarray Type",
+        example="custom",
+    )
+    page: int = Field(default=1, ge=1, description="Page number", title="Page")
+    page_size: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="Number of templates per page",
+        title="Page Size",
+    )
+
+
+class SubarrayTemplatePage(BaseModel):
+    """One page of subarray templates.
+
+    :param total: int, number of templates matching the query.
+    :param page: int, page number starting at 1.
+    :param page_size: int, number of templates per page.
+    :param templates: Dict[str, Any], templates of the page keyed by name.
+    """
+
+    total: int
+    page: int
+    page_size: int
+    templates: Dict[str, Any]
@@ -1,10 +1,24 @@
 import copy
 import re
-from typing import Any, Dict, Optional
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
 
 from ska_telmodel_client import TMData
 
-from ska_ost_osd.common.utils import update_file
+from ska_ost_osd.common.compression import EncodedBody
+from ska_ost_osd.common.frozen import freeze
+from ska_ost_osd.common.metrics import stage_timer
+from ska_ost_osd.common.utils import encode_response_object, update_file
+from ska_ost_osd.osd.cache.response_cache import (
+    CachedResponse,
+    response_cache,
+)
+from ska_ost_osd.osd.cache.snapshot_cache import snapshot_cache
+from ska_ost_osd.osd.cache.tmdata_pool import (
+    is_pinned_source,
+    source_key,
+    tmdata_pool,
+)
 from ska_ost_osd.osd.common.error_handling import OSDModelError
 from ska_ost_osd.osd.common.osd_validation_messages import (
     ARRAY_ASSEMBLY_DOESNOT_EXIST_ERROR_MESSAGE,
@@ -12,29 +26,55 @@ from ska_ost_osd.osd.common.osd_validation_messages import (
     CAPABILITY_DOESNOT_EXIST_ERROR_MESSAGE,
     CYCLE_ERROR_MESSAGE,
     CYCLE_ID_ERROR_MESSAGE,
+    FIELD_DOESNOT_EXIST_ERROR_MESSAGE,
     OSD_VERSION_ERROR_MESSAGE,
     SOURCE_ERROR_MESSAGE,
 )
 from ska_ost_osd.osd.common.utils import get_osd_latest_version
+from ska_ost_osd.osd.field_selection.field_selection import (
+    TEMPLATES_KEY,
+    contains_key,
+    parse_fields,
+    path_has_key,
+    select_fields,
+)
 from ska_ost_osd.osd.models.models import OSDModel
+from ska_ost_osd.osd.template_mapping.template_index import get_template_index
 from ska_ost_osd.osd.template_mapping.template_mapping import process_template_mappings
+from ska_ost_osd.osd.version_mapping.version_resolver import (
+    cycle_resolver,
+    version_resolver,
+)
 
 from .common.constant import (
     ARRAY_ASSEMBLY_PATTERN,
     BASE_FOLDER_NAME,
     BASE_URL,
     CAR_URL,
-    GITLAB_SOURCE,
     LOW_CAPABILITIES_JSON_PATH,
     MID_CAPABILITIES_JSON_PATH,
     OBSERVATORY_POLICIES_JSON_PATH,
     SOURCES,
-    VERSION_FILE_PATH,
     osd_file_mapping,
     osd_response_template,
 )
 
 
+def new_osd_response() -> Dict:
+    """Return a per-request OSD response envelope.
+
+    Only the envelope and its capabilities dictionary belong to the
+    request. The values placed into it are read-only snapshot data that
+    are shared with other requests, so no deep copies are needed.
+
+    :return: Dict, envelope referencing osd_response_template values.
+    """
+    return {
+        "observatory_policy": osd_response_template["observatory_policy"],
+        "capabilities": {},
+    }
+
+
 class OSD:
     """Initialize OSD-related variables and methods, including
     get_telescope_observatory_policies, get_data, and get_osd_data."""
@@ -46,6 +86,7 @@ class OSD:
         tmdata: TMData,
         cycle_id: int,
         process_templates: bool = False,
+        expand_templates: bool = True,
     ) -> None:
         """Initialize the OSD class.
 
@@ -56,15 +97,18 @@ class OSD:
         :param tmdata: TMData, TMData class object.
         :param cycle_id: int, cycle identifier.
         :param process_templates: bool, whether to process template mappings.
+        :param expand_templates: bool, whether processed template mappings
+            hold the template data or only the matching template names.
         :return: None
         """
         self.cycle_id = cycle_id
-        self.osd_data = copy.deepcopy(osd_response_template)
+        self.osd_data = new_osd_response()
         self.capabilities = capabilities
         self.array_assembly = array_assembly
         self.tmdata = tmdata
         self.keys_list = {}
         self.process_templates = process_templates
+        self.expand_templates = expand_templates
 
     def check_capabilities(self, capabilities: list = None) -> str | None:
         """Check if the given capabilities exist, and raise an exception if
@@ -142,15 +186,12 @@ class OSD:
         """
         cap_err_msg_list = []
         for key, value in telescope_capabilities_dict.items():
-            data = self.get_data(tmdata, capability=osd_file_mapping[key.lower()])
-
             if self.process_templates:
-                template_data = self.get_data(
-                    tmdata, templates=osd_file_mapping["subarray_templates"]
-                )
-                data = process_template_mappings(
-                    data, osd_file_mapping[key.lower()], template_data
+                data = self.get_resolved_capabilities(
+                    tmdata, osd_file_mapping[key.lower()]
                 )
+            else:
+                data = self.get_data(tmdata, capability=osd_file_mapping[key.lower()])
             self.keys_list = list(data.keys())
             err_msg = None
             if self.array_assembly:
@@ -184,6 +225,9 @@ class OSD:
         """Retrieve data from the tmdata object based on capability and array
         assembly.
 
+        Each file is parsed once per tmdata snapshot and returned as a
+        read-only view shared with other requests.
+
         :param tmdata: TMData class object.
         :param capability: str, capability such as "mid" or "low".
         :param array_assembly: str, for "mid" can be one of "AA0.5",
@@ -193,19 +237,47 @@ class OSD:
         """
         if templates:
             try:
-                return tmdata[templates].get_dict()
+                return snapshot_cache.document(tmdata, templates)
             except (KeyError, AttributeError):
                 return {}
 
-        if "observatory_policies" in capability:
-            return tmdata[capability].get_dict()
+        document = snapshot_cache.document(tmdata, capability)
+        if "observatory_policies" in capability or not array_assembly:
+            return document
+        return document[array_assembly]
 
-        else:
-            return (
-                tmdata[capability].get_dict()[array_assembly]
-                if array_assembly
-                else tmdata[capability].get_dict()
+    def get_resolved_capabilities(
+        self, tmdata: TMData, capability: str
+    ) -> dict[dict[str, Any]]:
+        """Return the capabilities of a telescope with subarray_templates
+        patterns replaced by the matching templates.
+
+        Template resolution runs once per tmdata snapshot, telescope and
+        expand_templates mode, requests only slice the stored result.
+
+        :param tmdata: TMData class object.
+        :param capability: str, capabilities file path for "mid" or "low".
+        :return: dict, read-only template-resolved capabilities.
+        """
+
+        def resolve() -> dict[dict[str, Any]]:
+            capabilities_data = self.get_data(tmdata, capability=capability)
+            template_data = self.get_data(
+                tmdata, templates=osd_file_mapping["subarray_templates"]
             )
+            with stage_timer("template_mapping"):
+                return process_template_mappings(
+                    capabilities_data,
+                    capability,
+                    template_data,
+                    keys_only=not self.expand_templates,
+                )
+
+        return snapshot_cache.derived(
+            tmdata,
+            ("resolved_capabilities", capability, self.expand_templates),
+            resolve,
+        )
 
     def get_osd_data(self) -> dict[dict[str, Any]]:
         """Call get_telescope_observatory_policies and
@@ -266,8 +338,7 @@ def get_available_cycles() -> list[int]:
 
     :return: list[int], list of available cycle numbers.
     """
-    tmdata = TMData([f"car:{CAR_URL}main#{BASE_FOLDER_NAME}"], update=True)
-    versions_dict = tmdata[VERSION_FILE_PATH].get_dict()
+    versions_dict = cycle_resolver.versions_dict
 
     return [
         int(key.split("_")[1])
@@ -385,6 +456,7 @@ def get_osd_data(
     tmdata: TMData = None,
     cycle_id: int = None,
     process_templates: bool = False,
+    expand_templates: bool = True,
 ) -> dict[dict[str, Any]]:
     """This function creates OSD class object and returns osd_data dictionary
     as json object.
@@ -395,6 +467,8 @@ def get_osd_data(
     :param tmdata: TMData class object.
     :param cycle_id: cycle id
     :param process_templates: bool, whether to process template mappings
+    :param expand_templates: bool, whether to return the matching template
+        data or only the template names
     :return: json object
     """
     osd_data, data_error_msg_list = OSD(
@@ -403,21 +477,23 @@ def get_osd_data(
         tmdata=tmdata,
         cycle_id=cycle_id,
         process_templates=process_templates,
+        expand_templates=expand_templates,
     ).get_osd_data()
 
     return osd_data, data_error_msg_list
 
 
-def get_osd_using_tmdata(
+def resolve_osd_source(
     cycle_id: Optional[int] = None,
     osd_version: Optional[str] = None,
     source: Optional[str] = None,
     gitlab_branch: Optional[str] = None,
     capabilities: Optional[str] = None,
     array_assembly: Optional[str] = None,
-    process_templates: bool = False,
-) -> Dict:
-    """Retrieve OSD data using TMData.
+    versions_dict: Optional[Dict] = None,
+) -> List[str]:
+    """Validate OSD query parameters and resolve the TMData source URIs
+    they point to.
 
     :param cycle_id: int, optional cycle ID.
     :param osd_version: str, optional OSD version.
@@ -425,9 +501,10 @@ def get_osd_using_tmdata(
     :param gitlab_branch: str, optional GitLab branch.
     :param capabilities: str, optional capabilities.
     :param array_assembly: str, optional array assembly.
-    :param process_templates: bool, whether to process template mappings.
-    :return: Dict[Dict[str, Any]], OSD data.
-    :raises ValueError: If any validation or processing errors occur.
+    :param versions_dict: Dict, cycle to version mapping, read from the
+        version resolver when not given.
+    :return: List[str], TMData source URIs.
+    :raises ValueError: If any validation errors occur.
     """
     errors = []
 
@@ -442,8 +519,8 @@ def get_osd_using_tmdata(
     except OSDModelError as error:
         errors.extend(error.args[0])
 
-    tmdata_version = TMData(GITLAB_SOURCE, update=True)
-    versions_dict = tmdata_version[VERSION_FILE_PATH].get_dict()
+    if versions_dict is None:
+        versions_dict = version_resolver.versions_dict
     _, cycle_errors = check_cycle_id(
         cycle_id=cycle_id,
         osd_version=osd_version,
@@ -467,7 +544,84 @@ def get_osd_using_tmdata(
     if errors:
         raise ValueError(errors)
 
-    tm_data = TMData(source_uris=tm_data_source)
+    return tm_data_source
+
+
+def resolve_template_source(
+    cycle_id: Optional[int] = None,
+    osd_version: Optional[str] = None,
+    source: Optional[str] = None,
+    gitlab_branch: Optional[str] = None,
+) -> List[str]:
+    """Resolve the TMData source URIs of a subarray template library.
+
+    Unlike resolve_osd_source no capabilities are required, the latest
+    release is used when neither cycle_id, osd_version nor gitlab_branch
+    is given.
+
+    :param cycle_id: int, optional cycle ID.
+    :param osd_version: str, optional OSD version.
+    :param source: str, optional source.
+    :param gitlab_branch: str, optional GitLab branch.
+    :return: List[str], TMData source URIs.
+    :raises ValueError: If any validation errors occur.
+    """
+    tm_data_source, errors = osd_tmdata_source(
+        cycle_id=cycle_id,
+        osd_version=osd_version,
+        source=source,
+        gitlab_branch=gitlab_branch,
+        versions_dict=version_resolver.versions_dict,
+    )
+    if errors:
+        raise ValueError(errors)
+    return tm_data_source
+
+
+def osd_cache_key(
+    tm_data_source: List[str],
+    cycle_id: Optional[int] = None,
+    capabilities: Optional[str] = None,
+    array_assembly: Optional[str] = None,
+    process_templates: bool = False,
+    expand_templates: bool = True,
+) -> Optional[Tuple]:
+    """Return the response cache key of an OSD query.
+
+    :param tm_data_source: List[str], TMData source URIs.
+    :param cycle_id: int, optional cycle ID.
+    :param capabilities: str, optional capabilities.
+    :param array_assembly: str, optional array assembly.
+    :param process_templates: bool, whether to process template mappings.
+    :param expand_templates: bool, whether templates are expanded.
+    :return: Optional[Tuple], cache key or None when the source may
+        change.
+    """
+    # only released versions are immutable, branch and file sources
+    # always have to be resolved again
+    if not is_pinned_source(tm_data_source):
+        return None
+    return (
+        source_key(tm_data_source),
+        cycle_id,
+        capabilities,
+        array_assembly,
+        process_templates,
+        expand_templates,
+    )
+
+
+def _resolve_osd_data(
+    tm_data_source: List[str],
+    cycle_id: Optional[int],
+    capabilities: Optional[str],
+    array_assembly: Optional[str],
+    process_templates: bool,
+    expand_templates: bool,
+    tm_data: Optional[TMData],
+) -> Dict:
+    if tm_data is None:
+        tm_data = tmdata_pool.get(tm_data_source)
 
     osd_data, osd_errors = get_osd_data(
         capabilities=[capabilities] if capabilities else None,
@@ -475,14 +629,369 @@ def get_osd_using_tmdata(
         array_assembly=array_assembly,
         cycle_id=cycle_id,
         process_templates=process_templates,
+        expand_templates=expand_templates,
     )
-    errors.extend(osd_errors)
-    if errors:
-        raise ValueError(errors)
+    if osd_errors:
+        raise ValueError(osd_errors)
+    return osd_data
+
+
+def get_osd_from_source(
+    tm_data_source: List[str],
+    cycle_id: Optional[int] = None,
+    capabilities: Optional[str] = None,
+    array_assembly: Optional[str] = None,
+    process_templates: bool = False,
+    tm_data: Optional[TMData] = None,
+    expand_templates: bool = True,
+) -> Dict:
+    """Retrieve OSD data from an already resolved TMData source.
+
+    Responses resolved from a released OSD version are cached together
+    with their encoded response body, so the returned dictionary may be
+    shared and must not be modified.
+
+    :param tm_data_source: List[str], TMData source URIs.
+    :param cycle_id: int, optional cycle ID.
+    :param capabilities: str, optional capabilities.
+    :param array_assembly: str, optional array assembly.
+    :param process_templates: bool, whether to process template mappings.
+    :param tm_data: TMData, snapshot of tm_data_source, taken from the
+        TMData pool when not given.
+    :param expand_templates: bool, whether to return the matching template
+        data or only the template names.
+    :return: Dict[Dict[str, Any]], OSD data.
+    :raises ValueError: If the requested data does not exist.
+    """
+    cache_key = osd_cache_key(
+        tm_data_source,
+        cycle_id,
+        capabilities,
+        array_assembly,
+        process_templates,
+        expand_templates,
+    )
+    if cache_key is not None:
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached.data
+
+    osd_data = _resolve_osd_data(
+        tm_data_source,
+        cycle_id,
+        capabilities,
+        array_assembly,
+        process_templates,
+        expand_templates,
+        tm_data,
+    )
+
+    if cache_key is not None:
+        # freezing only wraps the per-request envelope, the snapshot
+        # data inside it is frozen already
+        osd_data = freeze(osd_data)
+        # the body sizes the entry and is reused by GET /osd
+        cached = CachedResponse(osd_data, encode_osd_body(osd_data))
+        response_cache.put(cache_key, cached, size=cached.size)
 
     return osd_data
 
 
+def get_selected_osd_from_source(
+    fields: Tuple[str, ...],
+    tm_data_source: List[str],
+    cycle_id: Optional[int] = None,
+    capabilities: Optional[str] = None,
+    array_assembly: Optional[str] = None,
+    process_templates: bool = False,
+    tm_data: Optional[TMData] = None,
+    expand_templates: bool = True,
+) -> Dict:
+    """Retrieve only the selected fields of the OSD data.
+
+    Fields are first selected from the data without template mappings.
+    Templates are only processed when the selection includes
+    subarray_templates, or when expanded templates are requested and a
+    path that matched nothing goes into subarray_templates.
+
+    :param fields: Tuple[str, ...], JSON pointers or dotted paths, see
+        field_selection.
+    :param tm_data_source: List[str], TMData source URIs.
+    :param cycle_id: int, optional cycle ID.
+    :param capabilities: str, optional capabilities.
+    :param array_assembly: str, optional array assembly.
+    :param process_templates: bool, whether to process template mappings.
+    :param tm_data: TMData, snapshot of tm_data_source, taken from the
+        TMData pool when not given.
+    :param expand_templates: bool, whether to return the matching template
+        data or only the template names.
+    :return: Dict, selected OSD data.
+    :raises ValueError: If the requested data or a field does not exist.
+    """
+    query = (tm_data_source, cycle_id, capabilities, array_assembly)
+    osd_data = get_osd_from_source(*query, process_templates=False, tm_data=tm_data)
+    selected, missing = select_fields(osd_data, fields)
+
+    # paths into a single template only exist once templates are expanded
+    if process_templates and (
+        contains_key(selected, TEMPLATES_KEY)
+        or (
+            expand_templates
+            and any(path_has_key(path, TEMPLATES_KEY) for path in missing)
+        )
+    ):
+        osd_data = get_osd_from_source(
+            *query,
+            process_templates=True,
+            tm_data=tm_data,
+            expand_templates=expand_templates,
+        )
+        selected, missing = select_fields(osd_data, fields)
+
+    if missing:
+        raise ValueError(
+            [FIELD_DOESNOT_EXIST_ERROR_MESSAGE.format(field) for field in missing]
+        )
+    return selected
+
+
+def get_encoded_osd_from_source(
+    tm_data_source: List[str],
+    cycle_id: Optional[int] = None,
+    capabilities: Optional[str] = None,
+    array_assembly: Optional[str] = None,
+    process_templates: bool = False,
+    fields: Optional[Tuple[str, ...]] = None,
+    expand_templates: bool = True,
+) -> EncodedBody:
+    """Return the encoded GET /osd response body for an already resolved
+    TMData source.
+
+    For released OSD versions the encoded body and its compressed
+    variants are cached next to the OSD data in the same response cache
+    entry, so repeated queries skip resolution, serialisation and
+    compression. Bodies of field selections are cached on their own.
+
+    :param tm_data_source: List[str], TMData source URIs.
+    :param cycle_id: int, optional cycle ID.
+    :param capabilities: str, optional capabilities.
+    :param array_assembly: str, optional array assembly.
+    :param process_templates: bool, whether to process template mappings.
+    :param fields: Optional[Tuple[str, ...]], fields to select, all data
+        when not given.
+    :param expand_templates: bool, whether to return the matching template
+        data or only the template names.
+    :return: EncodedBody, ApiResponse envelope encoded as JSON.
+    :raises ValueError: If the requested data does not exist.
+    """
+    query = (tm_data_source, cycle_id, capabilities, array_assembly, process_templates)
+    cache_key = osd_cache_key(*query, expand_templates)
+
+    if fields:
+        selected_key = None if cache_key is None else ("selected", *cache_key, fields)
+        if selected_key is not None:
+            encoded = response_cache.get(selected_key)
+            if encoded is not None:
+                return encoded
+        osd_data = get_selected_osd_from_source(
+            fields, *query, expand_templates=expand_templates
+        )
+        encoded = encode_osd_body(osd_data, cache=selected_key is not None)
+        if selected_key is not None:
+            response_cache.put(selected_key, encoded, size=encoded.size)
+        return encoded
+
+    if cache_key is None:
+        return encode_osd_body(_resolve_osd_data(*query, expand_templates, None))
+
+    cached = response_cache.get(cache_key)
+    if cached is None:
+        osd_data = freeze(_resolve_osd_data(*query, expand_templates, None))
+        cached = CachedResponse(osd_data, encode_osd_body(osd_data, cache=True))
+    elif cached.encoded.precompressed:
+        return cached.encoded
+    else:
+        # added by other callers, e.g. batch queries, without variants
+        cached.encoded.precompress()
+
+    # the entry grows by the compressed variants
+    response_cache.put(cache_key, cached, size=cached.size)
+    return cached.encoded
+
+
+def encode_osd_body(osd_data: Dict, cache: bool = False) -> EncodedBody:
+    """Encode OSD data as the body of a successful ApiResponse.
+
+    :param osd_data: Dict, OSD data.
+    :param cache: bool, whether the body is going to be cached, in which
+        case all compressed variants are computed up front.
+    :return: EncodedBody, encoded response body.
+    """
+    encoded = EncodedBody(encode_response_object(osd_data, result_code=HTTPStatus.OK))
+    if cache:
+        encoded.precompress()
+    return encoded
+
+
+def get_osd_using_tmdata(
+    cycle_id: Optional[int] = None,
+    osd_version: Optional[str] = None,
+    source: Optional[str] = None,
+    gitlab_branch: Optional[str] = None,
+    capabilities: Optional[str] = None,
+    array_assembly: Optional[str] = None,
+    process_templates: bool = False,
+) -> Dict:
+    """Retrieve OSD data using TMData.
+
+    Responses resolved from a released OSD version are cached, so the
+    returned dictionary may be shared and must not be modified.
+
+    :param cycle_id: int, optional cycle ID.
+    :param osd_version: str, optional OSD version.
+    :param source: str, optional source.
+    :param gitlab_branch: str, optional GitLab branch.
+    :param capabilities: str, optional capabilities.
+    :param array_assembly: str, optional array assembly.
+    :param process_templates: bool, whether to process template mappings.
+    :return: Dict[Dict[str, Any]], OSD data.
+    :raises ValueError: If any validation or processing errors occur.
+    """
+    tm_data_source = resolve_osd_source(
+        cycle_id=cycle_id,
+        osd_version=osd_version,
+        source=source,
+        gitlab_branch=gitlab_branch,
+        capabilities=capabilities,
+        array_assembly=array_assembly,
+    )
+
+    return get_osd_from_source(
+        tm_data_source,
+        cycle_id=cycle_id,
+        capabilities=capabilities,
+        array_assembly=array_assembly,
+        process_templates=process_templates,
+    )
+
+
+def get_osd_batch(
+    queries: List[Dict], process_templates: bool = False
+) -> List[Tuple[Optional[Dict], List]]:
+    """Retrieve OSD data for several queries at once.
+
+    Queries are grouped by their resolved TMData source so that every
+    snapshot is taken from the pool once for the whole batch. A failing
+    query does not affect the others.
+
+    :param queries: List[Dict], keyword arguments of get_osd_using_tmdata
+        for each query, optionally with comma separated "fields" to
+        select and "expand_templates".
+    :param process_templates: bool, whether to process template mappings.
+    :return: List[Tuple[Optional[Dict], List]], OSD data and error list
+        of each query, in the order of queries.
+    """
+    versions_dict = version_resolver.versions_dict
+    results: List[Tuple[Optional[Dict], List]] = [(None, [])] * len(queries)
+    groups: Dict[Tuple[str, ...], List[int]] = {}
+    sources: Dict[Tuple[str, ...], List[str]] = {}
+
+    for position, query in enumerate(queries):
+        source_query = {
+            field: value
+            for field, value in query.items()
+            if field not in ("fields", "expand_templates")
+        }
+        try:
+            tm_data_source = resolve_osd_source(
+                **source_query, versions_dict=versions_dict
+            )
+        except ValueError as error:
+            results[position] = (None, error.args[0])
+            continue
+        key = source_key(tm_data_source)
+        sources[key] = tm_data_source
+        groups.setdefault(key, []).append(position)
+
+    for key, positions in groups.items():
+        try:
+            tm_data = tmdata_pool.get(sources[key])
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            for position in positions:
+                results[position] = (None, [str(error)])
+            continue
+
+        for position in positions:
+            query = queries[position]
+            selection = {
+                "cycle_id": query.get("cycle_id"),
+                "capabilities": query.get("capabilities"),
+                "array_assembly": query.get("array_assembly"),
+                "process_templates": process_templates,
+                "tm_data": tm_data,
+                "expand_templates": query.get("expand_templates", True),
+            }
+            fields = parse_fields(query.get("fields"))
+            try:
+                if fields:
+                    osd_data = get_selected_osd_from_source(
+                        fields, sources[key], **selection
+                    )
+                else:
+                    osd_data = get_osd_from_source(sources[key], **selection)
+            except ValueError as error:
+                results[position] = (None, error.args[0])
+            else:
+                results[position] = (osd_data, [])
+
+    return results
+
+
+def get_subarray_templates(
+    tm_data_source: List[str],
+    patterns: Tuple[str, ...] = ("*",),
+    telescope: Optional[str] = None,
+    subarray_type: Optional[str] = None,
+    page: int = 1,
+    page_size: int = 20,
+) -> Dict:
+    """Return one page of the subarray template library of a TMData
+    source.
+
+    Templates are looked up in the TemplateIndex of the library snapshot,
+    so listing costs do not grow with the number of templates.
+
+    :param tm_data_source: List[str], TMData source URIs.
+    :param patterns: Tuple[str, ...], glob patterns of template names.
+    :param telescope: Optional[str], "mid" or "low" to leave out the
+        templates of the other telescope.
+    :param subarray_type: Optional[str], only list templates with this
+        subarray_type.
+    :param page: int, page number starting at 1.
+    :param page_size: int, number of templates per page.
+    :return: Dict, total number of matching templates, page, page_size
+        and the templates of the page keyed by name.
+    """
+    tm_data = tmdata_pool.get(tm_data_source)
+    try:
+        template_data = snapshot_cache.document(
+            tm_data, osd_file_mapping["subarray_templates"]
+        )
+    except (KeyError, AttributeError):
+        template_data = {}
+
+    template_index = get_template_index(template_data)
+    names = template_index.names(patterns, telescope, subarray_type)
+    start = (page - 1) * page_size
+    end = start + page_size
+    return {
+        "total": len(names),
+        "page": page,
+        "page_size": page_size,
+        "templates": {name: template_index.get(name) for name in names[start:end]},
+    }
+
+
 def update_osd_file(
     validated_capabilities: Dict,
     observatory_policy: Dict,
@@ -529,6 +1038,9 @@ def update_osd_file(
     if observatory_policy:
         update_file(OBSERVATORY_POLICIES_JSON_PATH, observatory_policy)
 
+    # local file sources now differ from what the pool holds
+    tmdata_pool.invalidate()
+
     return updated_data
 
 
@@ -566,6 +1078,7 @@ def add_new_data_storage(body: Dict) -> Dict:
         update_file(OBSERVATORY_POLICIES_JSON_PATH, body["observatory_policy"])
         result.update(body["observatory_policy"])
     result.update(mid_capabilities)
+    tmdata_pool.invalidate()
     return mid_capabilities
 
 
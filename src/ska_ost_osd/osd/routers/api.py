@@ -7,13 +7,32 @@ mappings.
 from http import HTTPStatus
 from os import environ
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Request, Response
 from pydantic import ValidationError
 
+from ska_ost_osd.common.compression import (
+    EncodedBody,
+    negotiate_encoding,
+    representation_etag,
+)
+from ska_ost_osd.common.metrics import stage_timer
 from ska_ost_osd.common.models import ApiResponse
-from ska_ost_osd.common.utils import convert_to_response_object, get_responses
+from ska_ost_osd.common.single_flight import single_flight
+from ska_ost_osd.common.utils import (
+    convert_to_response_object,
+    encode_response_object,
+    get_responses,
+    response_envelope,
+)
+from ska_ost_osd.osd.cache.etag import (
+    REVALIDATE_CACHE_CONTROL,
+    compute_etag,
+    etag_matches,
+    osd_validators,
+)
+from ska_ost_osd.osd.cache.tmdata_pool import source_key
 from ska_ost_osd.osd.common.constant import (
     CYCLE_TO_VERSION_MAPPING,
     MID_CAPABILITIES_JSON_PATH,
@@ -24,21 +43,30 @@ from ska_ost_osd.osd.common.constant import (
 from ska_ost_osd.osd.common.error_handling import CapabilityError, OSDModelError
 from ska_ost_osd.osd.common.gitlab_helper import push_to_gitlab
 from ska_ost_osd.osd.common.utils import get_mid_low_capabilities, load_json_from_file
+from ska_ost_osd.osd.field_selection.field_selection import parse_fields
 from ska_ost_osd.osd.models.models import (
     CycleModel,
+    OSDBatchResult,
     OSDQueryParams,
     OSDRelease,
     OSDUpdateModel,
     ReleaseType,
+    SubarrayTemplatePage,
+    SubarrayTemplateQueryParams,
     ValidationOnCapabilities,
 )
 from ska_ost_osd.osd.osd import (
     add_new_data_storage,
     get_available_cycles,
-    get_osd_using_tmdata,
+    get_encoded_osd_from_source,
+    get_osd_batch,
+    get_subarray_templates,
+    resolve_osd_source,
+    resolve_template_source,
     update_osd_file,
 )
 from ska_ost_osd.osd.version_mapping.version_manager import manage_version_release
+from ska_ost_osd.osd.version_mapping.version_resolver import cycle_resolver
 
 # this variable is added for restricting tmdata publish from local/dev environment.
 # usage: 0 means disable tmdata publish to artefact.
@@ -55,25 +83,153 @@ osd_router = APIRouter(prefix="")
     example and default values and return data based on that.
     All query parameters has its own validation if user provide
     any invalid value it will return the error message.
+    Subarray templates are returned by name unless expand_templates
+    is set, see GET /subarray_templates for their data.
     """,
     responses=get_responses(ApiResponse),
     response_model=ApiResponse,
 )
-def get_osd(osd_model: OSDQueryParams = Depends()) -> Dict:
+def get_osd(request: Request, osd_model: OSDQueryParams = Depends()) -> Response:
     """This function takes query parameters and OSD data source objects to
     generate a response containing matching OSD data.
 
+    The response carries an ETag of the resolved snapshot and query. A
+    request whose If-None-Match header matches it gets a 304 response
+    without the OSD data being resolved. Concurrent identical queries
+    share a single resolution.
+
+    :param request: Request, incoming request.
     :param osd_model (OSDQueryParams): OSD query params model with
         required fields.
-    :returns dict: A dictionary with OSD data satisfying the query.
+    :returns Response: ApiResponse with OSD data satisfying the query,
+        encoded as JSON.
     """
     try:
-        model_data = osd_model.model_dump()
-        model_data["process_templates"] = True
-        osd_data = get_osd_using_tmdata(**model_data)
+        model_data = osd_model.model_dump(exclude={"fields", "expand_templates"})
+        with stage_timer("source_resolve"):
+            tm_data_source = resolve_osd_source(**model_data)
+        query = {
+            "cycle_id": osd_model.cycle_id,
+            "capabilities": osd_model.capabilities,
+            "array_assembly": osd_model.array_assembly,
+            "process_templates": True,
+            "fields": parse_fields(osd_model.fields),
+            "expand_templates": osd_model.expand_templates,
+        }
+        etag, cache_control = osd_validators(
+            tm_data_source,
+            **query,
+            requested_ref=osd_model.gitlab_branch or osd_model.osd_version,
+        )
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        not_modified = not_modified_response(request, headers)
+        if not_modified is not None:
+            return not_modified
+
+        encoded = single_flight.do(
+            ("osd", source_key(tm_data_source), *query.values()),
+            get_encoded_osd_from_source,
+            tm_data_source,
+            **query,
+        )
     except (OSDModelError, ValueError) as error:
         raise error
-    return convert_to_response_object(osd_data, result_code=HTTPStatus.OK)
+    # the body is already encoded in the ApiResponse format, returning it
+    # directly skips re-validating the data against response_model
+    return encoded.response(request.headers.get("accept-encoding"), headers)
+
+
+@osd_router.post(
+    "/osd/batch",
+    summary="Get OSD data for several queries in one request",
+    description="""Accepts a list of queries with the same fields as the
+    GET /osd query parameters and returns one result per query, in the
+    same order. Queries are grouped by their OSD source so that each
+    source is loaded once. A failing query is reported in its own result
+    and does not fail the whole request.
+    """,
+    responses=get_responses(ApiResponse[OSDBatchResult]),
+    response_model=ApiResponse[OSDBatchResult],
+)
+def get_osd_batch_data(
+    request: Request,
+    queries: List[OSDQueryParams] = Body(
+        min_length=1,
+        example=[
+            {"cycle_id": 1, "capabilities": "mid"},
+            {"cycle_id": 1, "capabilities": "low"},
+        ],
+    ),
+) -> Response:
+    """This function resolves a list of OSD queries and returns the result
+    of each one.
+
+    :param request: Request, incoming request.
+    :param queries (List[OSDQueryParams]): OSD queries with the same
+        fields as the GET /osd query parameters.
+    :returns Response: ApiResponse[OSDBatchResult] with one result per
+        query, encoded as JSON.
+    """
+    results = get_osd_batch(
+        [query.model_dump() for query in queries], process_templates=True
+    )
+
+    batch_results = []
+    for query, (osd_data, errors) in zip(queries, results):
+        result_code = HTTPStatus.BAD_REQUEST if errors else HTTPStatus.OK
+        # plain dictionaries in the OSDBatchResult layout, encoded without
+        # re-validating the OSD data against response_model
+        batch_results.append(
+            {
+                **response_envelope(errors or osd_data, result_code),
+                "query": query.model_dump(),
+            }
+        )
+
+    return EncodedBody(
+        encode_response_object(batch_results, result_code=HTTPStatus.OK)
+    ).response(request.headers.get("accept-encoding"))
+
+
+@osd_router.get(
+    "/subarray_templates",
+    summary="GET a page of the subarray template library",
+    description="""Lists the subarray templates of an OSD release whose
+    names match the glob patterns, optionally restricted to one telescope
+    and subarray_type. Results are paginated in library order.
+    """,
+    responses=get_responses(ApiResponse[SubarrayTemplatePage]),
+    response_model=ApiResponse[SubarrayTemplatePage],
+)
+def get_subarray_template_page(
+    request: Request, query: SubarrayTemplateQueryParams = Depends()
+) -> Response:
+    """Return one page of the subarray templates matching the query.
+
+    :param request: Request, incoming request.
+    :param query (SubarrayTemplateQueryParams): template query params.
+    :returns Response: ApiResponse[SubarrayTemplatePage] encoded as JSON.
+    """
+    tm_data_source = resolve_template_source(
+        cycle_id=query.cycle_id,
+        osd_version=query.osd_version,
+        source=query.source,
+        gitlab_branch=query.gitlab_branch,
+    )
+    patterns = tuple(
+        pattern.strip() for pattern in query.pattern.split(",") if pattern.strip()
+    )
+    page = get_subarray_templates(
+        tm_data_source,
+        patterns=patterns or ("*",),
+        telescope=query.telescope,
+        subarray_type=query.subarray_type,
+        page=query.page,
+        page_size=query.page_size,
+    )
+    return EncodedBody(
+        encode_response_object(page, result_code=HTTPStatus.OK)
+    ).response(request.headers.get("accept-encoding"))
 
 
 @osd_router.put(
@@ -187,17 +343,50 @@ def release_osd_data(
     responses=get_responses(ApiResponse[CycleModel]),
     response_model=ApiResponse,
 )
-def get_cycle_list() -> ApiResponse[CycleModel]:
+def get_cycle_list(request: Request, response: Response) -> ApiResponse[CycleModel]:
     """Get the list of all available proposal cycles.
 
+    :param request: Request, incoming request.
+    :param response: Response, used to set the caching headers.
     :return: ApiResponse[CycleModel], response model containing the list
         of cycle numbers.
     """
+    etag = compute_etag(cycle_resolver.versions_dict)
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    not_modified = not_modified_response(request, headers)
+    if not_modified is not None:
+        return not_modified
+
     cycle_numbers = get_available_cycles()
     cycles = {"cycles": sorted(cycle_numbers)}
+    response.headers.update(headers)
     return convert_to_response_object(cycles, result_code=HTTPStatus.OK)
 
 
+def not_modified_response(
+    request: Request, headers: Dict[str, str]
+) -> Optional[Response]:
+    """Return a 304 response when the client copy of a resource is current.
+
+    The ETag of the compressed representation the request would receive
+    is accepted as well.
+
+    :param request: Request, incoming request.
+    :param headers: Dict[str, str], caching headers with the ETag of the
+        uncompressed response.
+    :return: Optional[Response], 304 response or None.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    for etag in {headers["ETag"], representation_etag(headers["ETag"], encoding)}:
+        if etag_matches(if_none_match, etag):
+            return Response(
+                status_code=HTTPStatus.NOT_MODIFIED,
+                headers={**headers, "ETag": etag, "Vary": "Accept-Encoding"},
+            )
+    return None
+
+
 def handle_validation_error(err: object) -> list:
     """Handle validation errors and return a list of error details.
 
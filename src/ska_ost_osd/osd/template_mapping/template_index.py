@@ -0,0 +1,222 @@
+"""Precomputed index over the subarray template library.
+
+Matching glob patterns with fnmatch against every template costs
+patterns x templates per request, and the library grows with each AA.
+TemplateIndex is built once per template library and answers glob
+queries from buckets instead:
+
+* telescope buckets (``MID_``, ``LOW_`` and everything else),
+* suffix buckets keyed by the last ``_`` separated part of the template
+  name (``AA0.5``, ``AA4``, ...), which serve ``*_AA0.5`` style patterns,
+* a sorted key list for patterns with a literal prefix,
+* one compiled regex union per pattern set for the final check.
+
+The results of the most recent queries are memoised, so repeated queries
+only cost a lookup. The memo is bounded because GET /subarray_templates
+passes client supplied patterns. The index also serves the paginated
+template listing of GET /subarray_templates, which can filter by
+``subarray_type``.
+"""
+
+import bisect
+import fnmatch
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Pattern, Tuple
+
+WILDCARD_CHARACTERS = "*?["
+TELESCOPE_PREFIXES = {"mid": "mid_", "low": "low_"}
+# Number of query results memoised per index.
+MEMOISED_RESULTS = 256
+
+
+@lru_cache(maxsize=256)
+def compile_patterns(patterns: Tuple[str, ...]) -> Pattern:
+    """Compile a set of glob patterns into one regular expression.
+
+    :param patterns: Tuple[str, ...], glob patterns with fnmatch
+        (case-sensitive) semantics.
+    :return: Pattern, regex matching any of the patterns.
+    """
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+def telescope_of(template_key: str) -> Optional[str]:
+    """Return the telescope a template belongs to based on its prefix.
+
+    :param template_key: str, template name such as ``MID_FULL_AA4``.
+    :return: Optional[str], "mid", "low" or None for shared templates.
+    """
+    lowered = template_key.lower()
+    for telescope, prefix in TELESCOPE_PREFIXES.items():
+        if lowered.startswith(prefix):
+            return telescope
+    return None
+
+
+class TemplateIndex:
+    """Index answering glob queries over a subarray template library.
+
+    :param template_data: Mapping[str, Any], template library keyed by
+        template name.
+    """
+
+    def __init__(self, template_data: Mapping[str, Any]) -> None:
+        # no reference to the library itself is kept so that cached
+        # indexes do not keep old snapshots alive
+        self._templates: Dict[str, Any] = dict(template_data)
+        self._order = {key: position for position, key in enumerate(self._templates)}
+        self._sorted_keys = sorted(self._templates)
+        self._telescopes = {key: telescope_of(key) for key in self._templates}
+        self._subarray_types = {
+            key: value.get("subarray_type") if isinstance(value, Mapping) else None
+            for key, value in self._templates.items()
+        }
+        self._suffix_buckets: Dict[str, List[str]] = {}
+        for key in self._templates:
+            self._suffix_buckets.setdefault(key.rsplit("_", 1)[-1], []).append(key)
+        self._results: "OrderedDict[Tuple[Tuple[str, ...], Optional[str]], Dict]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def _candidates(self, pattern: str) -> Iterable[str]:
+        wildcard = min(
+            (pattern.find(char) for char in WILDCARD_CHARACTERS if char in pattern),
+            default=-1,
+        )
+        if wildcard == -1:
+            return [pattern] if pattern in self._templates else []
+
+        literal_suffix = pattern[1:]
+        if (
+            wildcard == 0
+            and pattern[0] == "*"
+            and "_" in literal_suffix
+            and not any(char in literal_suffix for char in WILDCARD_CHARACTERS)
+        ):
+            return self._suffix_buckets.get(literal_suffix.rsplit("_", 1)[-1], [])
+
+        prefix = pattern[:wildcard]
+        if not prefix:
+            return self._sorted_keys
+        start = bisect.bisect_left(self._sorted_keys, prefix)
+        end = bisect.bisect_left(self._sorted_keys, prefix + "\U0010ffff")
+        return self._sorted_keys[start:end]
+
+    def _match(
+        self, patterns: Tuple[str, ...], telescope: Optional[str]
+    ) -> Dict[str, Any]:
+        regex = compile_patterns(patterns)
+        excluded = {"mid": "low", "low": "mid"}.get(telescope)
+        matched = set()
+        for pattern in patterns:
+            for key in self._candidates(pattern):
+                if excluded is not None and self._telescopes[key] == excluded:
+                    continue
+                if regex.match(key):
+                    matched.add(key)
+        return {
+            key: self._templates[key] for key in sorted(matched, key=self._order.get)
+        }
+
+    def _lookup(
+        self, patterns: Iterable[str], telescope: Optional[str]
+    ) -> Dict[str, Any]:
+        key = (tuple(sorted(set(patterns))), telescope)
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                return result
+
+        result = self._match(key[0], telescope)
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > MEMOISED_RESULTS:
+                self._results.popitem(last=False)
+        return result
+
+    def match(
+        self, patterns: Iterable[str], telescope: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Return the templates matching any of the glob patterns.
+
+        :param patterns: Iterable[str], glob patterns, e.g. ``*_AA0.5``.
+        :param telescope: Optional[str], "mid" or "low" to leave out the
+            templates of the other telescope.
+        :return: Dict[str, Any], matching templates in library order.
+        """
+        return dict(self._lookup(patterns, telescope))
+
+    def names(
+        self,
+        patterns: Iterable[str],
+        telescope: Optional[str] = None,
+        subarray_type: Optional[str] = None,
+    ) -> List[str]:
+        """Return the names of the templates matching any of the glob
+        patterns.
+
+        :param patterns: Iterable[str], glob patterns, e.g. ``*_AA0.5``.
+        :param telescope: Optional[str], "mid" or "low" to leave out the
+            templates of the other telescope.
+        :param subarray_type: Optional[str], only return templates with
+            this subarray_type, e.g. ``custom``.
+        :return: List[str], matching template names in library order.
+        """
+        result = self._lookup(patterns, telescope)
+        if subarray_type is None:
+            return list(result)
+        return [key for key in result if self._subarray_types[key] == subarray_type]
+
+    def get(self, key: str) -> Any:
+        """Return the template with the given name.
+
+        :param key: str, template name.
+        :return: Any, template data.
+        :raises KeyError: If the template does not exist.
+        """
+        return self._templates[key]
+
+
+_indexes: Dict[int, TemplateIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_template_index(template_data: Mapping[str, Any]) -> TemplateIndex:
+    """Return the index for a template library, building it only once per
+    library instance.
+
+    Indexes are cached for libraries that support weak references, such
+    as the read-only documents handed out by the snapshot cache, and
+    dropped together with the library. Other mappings get a fresh index.
+
+    :param template_data: Mapping[str, Any], template library.
+    :return: TemplateIndex, index over the library.
+    """
+    key = id(template_data)
+    with _indexes_lock:
+        index = _indexes.get(key)
+    if index is not None:
+        return index
+
+    index = TemplateIndex(template_data)
+    try:
+        weakref.finalize(template_data, _forget_index, key)
+    except TypeError:
+        return index
+    with _indexes_lock:
+        _indexes[key] = index
+    return index
+
+
+def _forget_index(key: int) -> None:
+    with _indexes_lock:
+        _indexes.pop(key, None)
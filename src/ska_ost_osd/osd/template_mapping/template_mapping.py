@@ -5,30 +5,36 @@ finding templates based on patterns and replacing template mappings with
 actual template data.
 """
 
-import fnmatch
-import json
 import logging
 from typing import Any, Dict, List
 
 from ska_ser_logging import configure_logging
 
+from ska_ost_osd.osd.template_mapping.template_index import (
+    TemplateIndex,
+    get_template_index,
+)
+
 configure_logging(level="INFO")
 LOGGER = logging.getLogger(__name__)
 
 
 def find_matching_templates(
-    template_data: Dict[str, Any], patterns: List[str], base_path: str = ""
+    template_data: Dict[str, Any],
+    patterns: List[str],
+    base_path: str = "",
+    template_index: TemplateIndex = None,
 ) -> Dict[str, Any]:
     """Find templates that match the given patterns and telescope type.
 
     :param template_data: template data
     :param patterns: List of patterns to match against template keys
     :param base_path: Path to determine telescope type
+    :param template_index: precomputed index over template_data, looked
+        up or built when not given
     :return: Dictionary of matching templates
     """
-    matching_templates = {}
     telescope_type = "mid" if "ska1_mid" in base_path else "low"
-    excluded_prefix = "low_" if telescope_type == "mid" else "mid_"
 
     LOGGER.info(
         "Finding templates for telescope type: %s with patterns: %s",
@@ -36,16 +42,9 @@ def find_matching_templates(
         patterns,
     )
 
-    for pattern in patterns:
-        for template_key, data in template_data.items():
-            if not fnmatch.fnmatch(template_key, pattern):
-                continue
-
-            if template_key.lower().startswith(excluded_prefix):
-                continue
-
-            matching_templates[template_key] = data
-            LOGGER.info("Matched template: %s for pattern: %s", template_key, pattern)
+    if template_index is None:
+        template_index = get_template_index(template_data)
+    matching_templates = template_index.match(patterns, telescope_type)
 
     LOGGER.info("Found %d matching templates", len(matching_templates))
     return matching_templates
@@ -55,6 +54,7 @@ def process_template_mappings(
     capabilities_data: Dict[str, Any],
     capability: str = None,
     template_data: Dict[str, Any] = None,
+    keys_only: bool = False,
 ) -> Dict[str, Any]:
     """Process template mappings in capabilities data.
 
@@ -65,7 +65,10 @@ def process_template_mappings(
     :param capabilities_data: Dictionary containing capabilities data
     :param capability: Capability string to determine base path
     :param template_data: template data
-    :return: Updated capabilities data with template mappings resolved
+    :param keys_only: replace the patterns with the list of matching
+        template names instead of the template data
+    :return: Updated capabilities data with template mappings resolved,
+        capabilities_data itself is left unchanged
     """
     if not capabilities_data:
         LOGGER.info("No capabilities data provided")
@@ -79,14 +82,17 @@ def process_template_mappings(
         capability,
         base_path,
     )
-    updated_data = json.loads(json.dumps(capabilities_data))
+    # only the entries whose subarray_templates get replaced are copied,
+    # everything else is shared with capabilities_data
+    updated_data = dict(capabilities_data)
 
     # Collect all unique patterns to process templates only once
     all_patterns = set()
     values_with_templates = []
 
-    for value in updated_data.values():
+    for key, value in capabilities_data.items():
         if isinstance(value, dict) and "subarray_templates" in value:
+            value = updated_data[key] = dict(value)
             template_patterns = value["subarray_templates"]
             if isinstance(template_patterns, list):
                 all_patterns.update(template_patterns)
@@ -102,20 +108,19 @@ def process_template_mappings(
     # Process all templates once if we have patterns
     if all_patterns:
         try:
-            all_matching_templates = find_matching_templates(
-                template_data, list(all_patterns), base_path
-            )
+            # the index is built once per template library
+            template_index = get_template_index(template_data)
 
             # Apply matching templates to each value
             for value, patterns in values_with_templates:
-                matching_templates = {
-                    k: v
-                    for k, v in all_matching_templates.items()
-                    if any(fnmatch.fnmatch(k, pattern) for pattern in patterns)
-                }
+                matching_templates = find_matching_templates(
+                    template_data, patterns, base_path, template_index
+                )
 
                 if matching_templates:
-                    value["subarray_templates"] = matching_templates
+                    value["subarray_templates"] = (
+                        list(matching_templates) if keys_only else matching_templates
+                    )
                     LOGGER.info(
                         "Successfully processed %d templates",
                         len(matching_templates),
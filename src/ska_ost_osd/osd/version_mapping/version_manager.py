@@ -9,6 +9,11 @@ import logging
 from pathlib import Path
 from typing import Optional, Tuple
 
+from ska_ost_osd.osd.version_mapping.version_resolver import (
+    cycle_resolver,
+    version_resolver,
+)
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -99,4 +104,8 @@ def manage_version_release(
     latest_release_path = project_root / "tmdata/version_mapping/latest_release.txt"
     with open(latest_release_path, "w", encoding="utf-8") as f:
         f.write(f'"{new_version}"')
+
+    # cached cycle mapping and latest release no longer match
+    version_resolver.invalidate()
+    cycle_resolver.invalidate()
     return new_version, cycle_id
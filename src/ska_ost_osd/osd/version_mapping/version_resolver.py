@@ -0,0 +1,159 @@
+"""Version resolution service for OSD.
+
+This module keeps the cycle-to-version mapping and the latest released
+OSD version in memory instead of downloading them from GitLab for every
+query. Once the data is older than the refresh interval it is reloaded
+in a background thread while callers keep being served the stale copy.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from os import environ
+from typing import Callable, Dict, List, Optional
+
+from ska_telmodel_client import TMData
+
+from ska_ost_osd.common.metrics import stage_timer
+from ska_ost_osd.osd.common.constant import (
+    BASE_FOLDER_NAME,
+    CAR_URL,
+    GITLAB_SOURCE,
+    RELEASE_FILE_PATH_LATEST,
+    VERSION_FILE_PATH,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# Age in seconds after which the version mapping is refreshed in the background.
+VERSION_REFRESH_INTERVAL_SECONDS = float(
+    environ.get("OSD_VERSION_REFRESH_INTERVAL_SECONDS", "60")
+)
+
+
+@dataclass(frozen=True)
+class VersionSnapshot:
+    """Version data loaded from the OSD version_mapping folder.
+
+    :param versions_dict: Dict[str, List[str]], cycle to version mapping.
+    :param latest_version: str, latest released OSD version.
+    """
+
+    versions_dict: Dict[str, List[str]]
+    latest_version: str
+
+
+class VersionResolver:
+    """Serve the cycle-to-version mapping and the latest OSD release from
+    memory with stale-while-revalidate refreshes.
+
+    :param refresh_interval: float, age in seconds after which a
+        background refresh is started.
+    :param source_uris: List[str], TMData source holding version_mapping.
+    :param factory: Callable, used to build TMData instances.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = VERSION_REFRESH_INTERVAL_SECONDS,
+        source_uris: List[str] = None,
+        factory: Callable[..., TMData] = None,
+    ) -> None:
+        self.refresh_interval = refresh_interval
+        self.source_uris = source_uris or GITLAB_SOURCE
+        self.factory = factory
+        self._snapshot: Optional[VersionSnapshot] = None
+        self._loaded_at = 0.0
+        self._generation = 0
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def _load(self) -> VersionSnapshot:
+        factory = self.factory or TMData
+        with stage_timer("version_lookup"):
+            tmdata = factory(self.source_uris, update=True)
+            versions_dict = tmdata[VERSION_FILE_PATH].get_dict()
+            latest_version = (
+                tmdata[RELEASE_FILE_PATH_LATEST].get().decode("utf-8").replace('"', "")
+            )
+        return VersionSnapshot(versions_dict, latest_version)
+
+    def _store(self, snapshot: VersionSnapshot, generation: int) -> None:
+        with self._lock:
+            # an invalidation while loading makes this result outdated
+            if generation == self._generation:
+                self._snapshot = snapshot
+                self._loaded_at = time.monotonic()
+
+    def _background_refresh(self, generation: int) -> None:
+        try:
+            self._store(self._load(), generation)
+        except Exception:  # pylint: disable=broad-exception-caught
+            LOGGER.exception("Failed to refresh OSD version mapping, serving stale")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def snapshot(self) -> VersionSnapshot:
+        """Return the current version data.
+
+        The first call loads synchronously. Later calls return the cached
+        data immediately and start a background refresh once it is older
+        than the refresh interval.
+
+        :return: VersionSnapshot, cached version data.
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            generation = self._generation
+            stale = time.monotonic() - self._loaded_at >= self.refresh_interval
+            start_refresh = snapshot is not None and stale and not self._refreshing
+            if start_refresh:
+                self._refreshing = True
+
+        if start_refresh:
+            threading.Thread(
+                target=self._background_refresh,
+                args=(generation,),
+                name="osd-version-refresh",
+                daemon=True,
+            ).start()
+
+        if snapshot is not None:
+            return snapshot
+
+        with self._load_lock:
+            with self._lock:
+                if self._snapshot is not None:
+                    return self._snapshot
+                generation = self._generation
+            snapshot = self._load()
+            self._store(snapshot, generation)
+            return snapshot
+
+    @property
+    def versions_dict(self) -> Dict[str, List[str]]:
+        """Cycle to OSD version mapping."""
+        return self.snapshot().versions_dict
+
+    @property
+    def latest_version(self) -> str:
+        """Latest released OSD version."""
+        return self.snapshot().latest_version
+
+    def invalidate(self) -> None:
+        """Drop the cached version data, the next call reloads it.
+
+        Called after a new OSD version has been released.
+        """
+        with self._lock:
+            self._snapshot = None
+            self._loaded_at = 0.0
+            self._generation += 1
+
+
+version_resolver = VersionResolver()
+# the list of available cycles is read from the mapping published to the CAR
+cycle_resolver = VersionResolver(source_uris=[f"car:{CAR_URL}main#{BASE_FOLDER_NAME}"])
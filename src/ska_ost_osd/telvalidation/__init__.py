@@ -8,10 +8,11 @@ from .coordinates_conversion import (
     ra_degs_from_str_formats,
 )
 from .oet_tmc_validators import validate_target_is_visible
-from .semantic_validator import semantic_validate
+from .semantic_validator import semantic_validate, semantic_validate_many
 
 __all__ = [
     "semantic_validate",
+    "semantic_validate_many",
     "SchematicValidationError",
     "ra_degs_from_str_formats",
     "dec_degs_str_formats",
@@ -3,6 +3,7 @@ from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from ska_ost_osd.common.models import ApiResponse
 from ska_ost_osd.osd.common.constant import ARRAY_ASSEMBLY_PATTERN
 from ska_ost_osd.telvalidation.common.constant import (
     CAR_TELMODEL_SOURCE,
@@ -99,3 +100,16 @@ class SemanticValidationModel(BaseModel):
                 "Please provide 'osd_version' by replacing '{osd_version}' placeholder"
             )
         return v
+
+
+class SemanticValidationBatchResult(ApiResponse[Any]):
+    """Result of a single payload of a semantic validation batch request.
+
+    result_data and result_code are what the payload would have returned
+    as a separate POST /semantic_validation request.
+
+    :param duration_ms: float, time spent validating the payload in
+        milliseconds.
+    """
+
+    duration_ms: float
@@ -10,15 +10,21 @@ capabilities. e.g: in rule file below is rule and error messages.
 'number_ska_dishes' constraints value fetched from OSD capabilities.
 """
 
+import ast
 import logging
 import re
+import threading
+import warnings
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Union
 
 import astropy.units as u
 from astropy.time import Time
 from simpleeval import EvalWithCompoundTypes
 
+from ska_ost_osd.common.metrics import register_cache
+
 from .common.constant import MID_VALIDATION_CONSTANT_JSON_FILE_PATH
 from .common.error_handling import (
     SchemanticValidationKeyError,
@@ -32,11 +38,46 @@ from .coordinates_conversion import (
 
 logging.getLogger("telvalidation")
 
+# distinct rule strings across the mid, low and SBD validation constants
+RULE_CACHE_SIZE = 1024
+
 
 from collections import deque
 
 
-def get_value_based_on_provided_path(nested_data: Union[dict, list], path: list) -> Any:
+def build_key_index(nested_data: Union[dict, list]) -> dict:
+    """Map every dictionary and list of a nested structure to the keys
+    found in it or below it, in a single pass.
+
+    :param nested_data: Union[dict, list], nested dictionary or list of
+        dictionaries, e.g. an observing command input.
+    :return: dict, frozenset of keys per ``id()`` of each dictionary and
+        list. The index is only valid while nested_data is alive and
+        unchanged.
+    """
+
+    index = {}
+
+    def collect(node: Union[dict, list]) -> frozenset:
+        keys = set()
+        children = node
+        if isinstance(node, dict):
+            keys.update(node)
+            children = node.values()
+        for child in children:
+            if isinstance(child, (dict, list)):
+                keys.update(collect(child))
+        index[id(node)] = keys = frozenset(keys)
+        return keys
+
+    if isinstance(nested_data, (dict, list)):
+        collect(nested_data)
+    return index
+
+
+def get_value_based_on_provided_path(
+    nested_data: Union[dict, list], path: list, key_index: dict = None
+) -> Any:
     """Retrieve a value from a nested dictionary or list of dictionaries based
     on a path.
 
@@ -44,10 +85,19 @@ def get_value_based_on_provided_path(nested_data: Union[dict, list], path: list)
         dictionaries to search.
     :param path: List[str], keys representing the path to the desired
         value, e.g., ['a', 'b', 'c'].
+    :param key_index: dict, optional index of nested_data from
+        build_key_index. Nested dictionaries that do not contain the key
+        searched for are then skipped instead of searched.
     :return: Any, value at the specified path, or None if not found or
         invalid path.
     """
 
+    def may_contain(data: dict, key: str) -> bool:
+        return key_index is None or key in key_index.get(id(data), (key,))
+
+    if path and isinstance(nested_data, dict) and not may_contain(nested_data, path[0]):
+        return None
+
     stack = deque()
     stack.append((nested_data, path))
 
@@ -67,10 +117,13 @@ def get_value_based_on_provided_path(nested_data: Union[dict, list], path: list)
                 # Check if the current key exists in any nested dictionary
                 for value in current_data.values():
                     if isinstance(value, dict):
-                        stack.append((value, [current_key] + remaining_path))
+                        if may_contain(value, current_key):
+                            stack.append((value, [current_key] + remaining_path))
                     elif isinstance(value, list):
                         for item in value:
-                            if isinstance(item, dict):
+                            if isinstance(item, dict) and may_contain(
+                                item, current_key
+                            ):
                                 stack.append((item, [current_key] + remaining_path))
         elif isinstance(current_data, list):
             for item in current_data:
@@ -121,43 +174,226 @@ def get_matched_rule_constraint_from_osd(
             "max_frequency_hz": 1050000000.0
         }]
 
+    Only capabilities whose key is an identifier used in the rule are
+    matched, e.g. ``number_fsps`` does not match a rule that only uses
+    ``number_fsps_per_subarray``.
+
     :param basic_capabilities: dict, Capabilities from OSD.
     :param search_key: str, Key from the rule file.
     :param rule: str, Rule for validating the data and associated error.
     :return: list, Matched capabilities based on the rule keys.
     """
 
-    result = []
+    return _bind_rule_constraints(
+        _constraint_nodes(basic_capabilities, search_key),
+        rule_identifiers(rule) if rule else frozenset(),
+    )
+
+
+def _constraint_nodes(basic_capabilities: dict, search_key: str = None) -> list:
+    """Return every dictionary of the capabilities in depth-first order,
+    together with the number of its items matching the search key.
+
+    :param basic_capabilities: dict, Capabilities from OSD.
+    :param search_key: str, Key from the rule file.
+    :return: list, (dictionary, number of matches) tuples.
+    """
+
+    nodes = []
     stack = [basic_capabilities]
 
     while stack:
         current_dict = stack.pop()
 
         if isinstance(current_dict, dict):
-            temp_value = {}
+            matches = 0
             for key, value in current_dict.items():
-                if rule and key in rule:
-                    temp_value.update({key: value})
                 if isinstance(value, dict):
                     stack.append(value)
                 elif isinstance(value, list):
                     for item in value:
                         if isinstance(item, dict):
                             stack.append(item)
+                # a search key of None matches every item with a None value
                 if key == search_key or value == search_key:
-                    result.append(current_dict)
-            if temp_value:
-                result.append(temp_value)
+                    matches += 1
+            nodes.append((current_dict, matches))
+
+    return nodes
+
+
+def _bind_rule_constraints(nodes: list, identifiers: frozenset) -> list:
+    """Select the capabilities used by a rule.
+
+    :param nodes: list, (dictionary, number of matches) tuples from
+        _constraint_nodes.
+    :param identifiers: frozenset, names referenced by the rule.
+    :return: list, Matched capabilities based on the rule keys.
+    """
 
+    result = []
+    for current_dict, matches in nodes:
+        result.extend([current_dict] * matches)
+        temp_value = {
+            key: value for key, value in current_dict.items() if key in identifiers
+        }
+        if temp_value:
+            result.append(temp_value)
     return result
 
 
+def build_rule_bindings(capabilities: dict, rules: set) -> dict:
+    """Match the capabilities of every rule with a single walk over the
+    capabilities.
+
+    :param capabilities: dict, Capabilities from OSD.
+    :param rules: set, rule expressions to bind.
+    :return: dict, matched capabilities per rule, as returned by
+        get_matched_rule_constraint_from_osd without a search key.
+    """
+
+    nodes = _constraint_nodes(capabilities)
+    return {
+        rule: _bind_rule_constraints(nodes, rule_identifiers(rule)) for rule in rules
+    }
+
+
+def collect_rules(semantic_validate_constant_json: Union[dict, list]) -> set:
+    """Return all rule expressions of a validation constants section.
+
+    :param semantic_validate_constant_json: Union[dict, list], rules
+        and nested sections from a validation constants file.
+    :return: set, rule expressions.
+    """
+
+    rules = set()
+    stack = [semantic_validate_constant_json]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if isinstance(current.get("rule"), str):
+                rules.add(current["rule"])
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+    return rules
+
+
+class ValidationContext:
+    """State of a single semantic validation call.
+
+    Validated input values are stored as variables so that later rules
+    can refer to them through ``dependency_key``. Every call of
+    validate_json gets its own context, so concurrent validations never
+    see each other's values.
+
+    :param capabilities: dict, matched capabilities from OSD.
+    :param rule_bindings: dict, matched capabilities per rule from
+        build_rule_bindings, rules missing from it are matched against
+        capabilities.
+    """
+
+    def __init__(self, capabilities: dict = None, rule_bindings: dict = None) -> None:
+        self.capabilities = capabilities
+        self.rule_bindings = rule_bindings or {}
+        self.variables = {}
+        self._indexed_input = None
+        self._key_index = None
+
+    def add_variables(self, variables: dict) -> None:
+        """Store validated input values for dependent rules.
+
+        :param variables: dict, input values by key.
+        """
+        self.variables.update(variables)
+
+    def key_index(self, command_input: Union[dict, list]) -> dict:
+        """Return the key index of the command input, built on first use.
+
+        :param command_input: Union[dict, list], the command input being
+            validated.
+        :return: dict, index from build_key_index.
+        """
+        if self._indexed_input is not command_input:
+            self._key_index = build_key_index(command_input)
+            self._indexed_input = command_input
+        return self._key_index
+
+    def constraints(self, rule: str) -> list:
+        """Return the capabilities matched by a rule.
+
+        :param rule: str, rule expression.
+        :return: list, Matched capabilities based on the rule keys.
+        """
+        if rule in self.rule_bindings:
+            return self.rule_bindings[rule]
+        return get_matched_rule_constraint_from_osd(
+            basic_capabilities=self.capabilities, search_key=None, rule=rule
+        )
+
+
+# only read and written by the deprecated module level helpers below
+_default_context = ValidationContext()
+
+
+def _warn_deprecated(name: str, replacement: str) -> None:
+    warnings.warn(
+        (
+            f"{name} is deprecated and will be removed in the next major release, "
+            f"use {replacement} instead"
+        ),
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
+def add_semantic_variables(semantic_object: Any):
+    """Update the internal semantic validation data with the provided semantic
+    object.
+
+    .. deprecated:: Validations keep their variables in a
+        ValidationContext, use ValidationContext.add_variables.
+
+    :param semantic_object: Any, the semantic object containing
+        variables to add to the validation data.
+    :return: None
+    """
+    _warn_deprecated("add_semantic_variables", "ValidationContext.add_variables")
+    _default_context.add_variables(semantic_object)
+
+
+def get_semantic_variables():
+    """Retrieve the current semantic validation data.
+
+    .. deprecated:: Validations keep their variables in a
+        ValidationContext, use ValidationContext.variables.
+
+    :return: dict, the dictionary containing all semantic validation
+        variables.
+    """
+    _warn_deprecated("get_semantic_variables", "ValidationContext.variables")
+    return _default_context.variables
+
+
+def clear_semantic_variable_data():
+    """Clear all semantic validation data stored internally.
+
+    .. deprecated:: Every validation gets a new ValidationContext, there
+        is nothing to clear.
+
+    :return: None
+    """
+    _warn_deprecated("clear_semantic_variable_data", "a new ValidationContext")
+    _default_context.variables.clear()
+
+
 def apply_validation_rule(
     key_to_validate: str,
     validation_data: list[dict[str, Union[str, dict]]],
     command_input_json_config: dict,
     parent_path_list: list,
-    capabilities: dict,
+    capabilities: dict = None,
+    context: ValidationContext = None,
 ) -> str:
     """Evaluate validation rules using simpleeval and return an error message
     if the input is invalid.
@@ -169,29 +405,33 @@ def apply_validation_rule(
         the operator.
     :param parent_path_list: list, Represents the current parent path to
         identify the correct child key.
-    :param capabilities: dict, The capabilities dictionary.
+    :param capabilities: dict, The capabilities dictionary, used when no
+        context is given.
+    :param context: ValidationContext, state of the validation call.
     :return: str, The error message after applying the rule.
     """
 
+    if context is None:
+        context = ValidationContext(capabilities)
+
     res_value = get_value_based_on_provided_path(
-        command_input_json_config, parent_path_list
+        command_input_json_config,
+        parent_path_list,
+        context.key_index(command_input_json_config),
     )
     if res_value or isinstance(res_value, list | dict | tuple | set):
-        add_semantic_variables({key_to_validate: res_value})
+        context.add_variables({key_to_validate: res_value})
         error_msgs = []
 
         for rule_data in validation_data:
             try:
-                osd_base_constraint = get_matched_rule_constraint_from_osd(
-                    basic_capabilities=capabilities,
-                    search_key=None,
-                    rule=rule_data["rule"],
-                )
+                osd_base_constraint = context.constraints(rule_data["rule"])
                 eval_result = evaluate_rule(
                     key_to_validate,
                     res_value,
                     rule_data,
                     osd_base_constraint,
+                    context.variables,
                 )
                 if eval_result and True not in eval_result:
                     error_msg = format_error_message(rule_data, osd_base_constraint)
@@ -207,19 +447,26 @@ def apply_validation_rule(
     return ""
 
 
-def update_names_with_dependencies(rule_data: dict, names: dict) -> dict:
+def update_names_with_dependencies(
+    rule_data: dict, names: dict, dependency_values: dict = None
+) -> dict:
     """Update the 'names' dictionary with dependency values from rule_data.
 
     :param rule_data: dict, A dictionary containing rule data, including
         a "dependency_key" key.
     :param names: dict, A dictionary to be updated with dependency
         values.
+    :param dependency_values: dict, input values validated so far in the
+        current validation, the deprecated module level variables when
+        not given.
     :return: dict, The updated 'names' dictionary with dependency
         values.
+    :raises KeyError: If a dependency has not been validated.
     """
+    if dependency_values is None:
+        dependency_values = _default_context.variables
 
     if "dependency_key" in rule_data:
-        dependency_values = get_semantic_variables()
         for dependency_value in rule_data["dependency_key"]:
             names.update(
                 {
@@ -229,11 +476,65 @@ def update_names_with_dependencies(rule_data: dict, names: dict) -> dict:
     return names
 
 
+@lru_cache(maxsize=RULE_CACHE_SIZE)
+def compile_rule(rule: str) -> ast.AST:
+    """Parse a rule expression once, keyed by its text.
+
+    The returned node tree is never modified by simpleeval and is shared
+    by all requests evaluating the same rule.
+
+    :param rule: str, rule expression from a validation constants file.
+    :return: ast.AST, parsed expression for ``previously_parsed``.
+    """
+    return EvalWithCompoundTypes.parse(rule)
+
+
+@lru_cache(maxsize=RULE_CACHE_SIZE)
+def rule_identifiers(rule: str) -> frozenset:
+    """Return the names referenced by a rule expression.
+
+    :param rule: str, rule expression from a validation constants file.
+    :return: frozenset, identifiers of the rule, e.g. ``number_fsps``.
+    """
+    return frozenset(
+        node.id for node in ast.walk(compile_rule(rule)) if isinstance(node, ast.Name)
+    )
+
+
+register_cache(
+    "compiled_rules",
+    lambda: {
+        "hits": compile_rule.cache_info().hits,
+        "misses": compile_rule.cache_info().misses,
+    },
+)
+
+# evaluators keep the names of the rule being evaluated, one per thread
+_evaluators = threading.local()
+
+
+def get_evaluator() -> EvalWithCompoundTypes:
+    """Return the rule evaluator of the calling thread, created on first
+    use.
+
+    :return: EvalWithCompoundTypes, evaluator with ``len`` and ``re``
+        registered, callers only set its names.
+    """
+    evaluator = getattr(_evaluators, "evaluator", None)
+    if evaluator is None:
+        evaluator = EvalWithCompoundTypes()
+        evaluator.functions["len"] = len
+        evaluator.functions["re"] = re
+        _evaluators.evaluator = evaluator
+    return evaluator
+
+
 def evaluate_rule(
     key_to_validate: str,
     res_value: Union[str, list],
     rule_data: dict[str, Union[str, dict]],
     osd_base_constraint: list[dict],
+    dependency_values: dict = None,
 ) -> bool:
     """Evaluate a single validation rule using simpleeval.
 
@@ -243,24 +544,27 @@ def evaluate_rule(
         data.
     :param osd_base_constraint: list[dict], The list of dictionaries
         containing the rule keys.
+    :param dependency_values: dict, input values validated so far, read
+        for the rule's ``dependency_key``, the deprecated module level
+        variables when not given.
     :return: bool, True if the rule is satisfied, False otherwise.
     """
 
     names = {}
     eval_new_data = []
-    simple_eval = EvalWithCompoundTypes()
-    simple_eval.functions["len"] = len
-    simple_eval.functions["re"] = re
+    simple_eval = get_evaluator()
+    rule = rule_data["rule"]
+    parsed_rule = compile_rule(rule)
 
     if len(osd_base_constraint) > 1:
         # if found multiple constraints values from OSD
         for i in osd_base_constraint:
             names = {key_to_validate: res_value}
             names = {**names, **i}
-            names = update_names_with_dependencies(rule_data, names)
+            names = update_names_with_dependencies(rule_data, names, dependency_values)
 
             simple_eval.names = names
-            eval_data = simple_eval.eval(rule_data["rule"])
+            eval_data = simple_eval.eval(rule, previously_parsed=parsed_rule)
 
             if not eval_data:
                 eval_new_data.append(False)
@@ -274,10 +578,10 @@ def evaluate_rule(
 
         names = {key_to_validate: res_value}
         names = {**names, **osd_base_constraint_value}
-        names = update_names_with_dependencies(rule_data, names)
+        names = update_names_with_dependencies(rule_data, names, dependency_values)
 
         simple_eval.names = names
-        eval_data = simple_eval.eval(rule_data["rule"])
+        eval_data = simple_eval.eval(rule, previously_parsed=parsed_rule)
         eval_new_data = (
             [not bool(eval_data)] if isinstance(eval_data, set) else [bool(eval_data)]
         )
@@ -307,6 +611,7 @@ def validate_json(
     command_input_json_config: dict,
     parent_path_list: list = None,
     capabilities: dict = None,
+    context: ValidationContext = None,
 ) -> list:
     """This function is written to match keys from the user input command and
     validation constant rules present in mid, low, and SBD validation constant
@@ -324,26 +629,48 @@ def validate_json(
         List representing the current parent path.
     :param capabilities: dict
         Defined key-value structure pair from the OSD API.
+    :param context: ValidationContext
+        State shared by the rules of one validation, a new context is
+        created from `capabilities` when not given.
 
     :return: list
         A list (`error_msg_list`) containing all combined errors arising
         due to semantic validation.
     """
 
-    error_msg_list = []
+    if context is None:
+        context = ValidationContext(capabilities)
+
+    return apply_validation_steps(
+        validation_steps(semantic_validate_constant_json, parent_path_list),
+        command_input_json_config,
+        context,
+    )
+
+
+def validation_steps(
+    semantic_validate_constant_json: dict, parent_path_list: list
+) -> list:
+    """Flatten the rules of validation constants into the order in which
+    validate_json applies them.
+
+    The steps do not depend on the command input and can be reused for
+    every input validated against the same constants.
+
+    :param semantic_validate_constant_json: dict, parameters with their
+        rules and error messages.
+    :param parent_path_list: list, path of the constants in the command
+        input.
+    :return: list, (key to validate, rules, path in the command input)
+        tuples.
+    """
+
+    steps = []
     for key, value in semantic_validate_constant_json.items():
         current_path = parent_path_list + [key]
 
         if isinstance(value, list):
-            rule_result = apply_validation_rule(
-                key_to_validate=key,
-                validation_data=value,
-                command_input_json_config=command_input_json_config,
-                parent_path_list=current_path,
-                capabilities=capabilities,
-            )
-            if rule_result:
-                error_msg_list.append(rule_result)
+            steps.append((key, value, current_path))
         elif isinstance(value, dict):
             # added extra key as rule parent to perform rule validation
             # on child
@@ -352,23 +679,36 @@ def validate_json(
             # key helps to apply rule on child
             if "parent_key_rule" in value:
                 rule_key = list(value.keys())[1]
-                rule_result = apply_validation_rule(
-                    key_to_validate=rule_key,
-                    validation_data=value["parent_key_rule"],
-                    command_input_json_config=command_input_json_config,
-                    parent_path_list=current_path + [rule_key],
-                    capabilities=capabilities,
-                )
-                if rule_result:
-                    error_msg_list.append(rule_result)
-            error_msg_list.extend(
-                validate_json(
-                    value,
-                    command_input_json_config,
-                    current_path,
-                    capabilities,
+                steps.append(
+                    (rule_key, value["parent_key_rule"], current_path + [rule_key])
                 )
-            )
+            steps.extend(validation_steps(value, current_path))
+    return steps
+
+
+def apply_validation_steps(
+    steps: list, command_input_json_config: dict, context: ValidationContext
+) -> list:
+    """Apply flattened validation rules to a command input.
+
+    :param steps: list, steps from validation_steps.
+    :param command_input_json_config: dict, the command input to
+        validate.
+    :param context: ValidationContext, state of the validation call.
+    :return: list, error messages of the failed rules.
+    """
+
+    error_msg_list = []
+    for key_to_validate, validation_data, path in steps:
+        rule_result = apply_validation_rule(
+            key_to_validate=key_to_validate,
+            validation_data=validation_data,
+            command_input_json_config=command_input_json_config,
+            parent_path_list=path,
+            context=context,
+        )
+        if rule_result:
+            error_msg_list.append(rule_result)
     return error_msg_list
 
 
@@ -427,34 +767,3 @@ def validate_target_is_visible(
         )
         logging.error(error_message)
         raise SchematicValidationError(error_message)
-
-
-_semantic_validate_data = {}
-
-
-def add_semantic_variables(semantic_object: Any):
-    """Update the internal semantic validation data with the provided semantic
-    object.
-
-    :param semantic_object: Any, the semantic object containing
-        variables to add to the validation data.
-    :return: None
-    """
-    _semantic_validate_data.update(semantic_object)
-
-
-def get_semantic_variables():
-    """Retrieve the current semantic validation data.
-
-    :return: dict, the dictionary containing all semantic validation
-        variables.
-    """
-    return _semantic_validate_data
-
-
-def clear_semantic_variable_data():
-    """Clear all semantic validation data stored internally.
-
-    :return: None
-    """
-    _semantic_validate_data.clear()
@@ -1,11 +1,26 @@
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
+from os import environ
+from typing import Any, Dict, List
 
-from fastapi import Body
+from fastapi import Body, Request, Response
 from jsonschema import ValidationError
+from pydantic import ValidationError as ModelValidationError
 from ska_telmodel_client import TMData
 
+from ska_ost_osd.common.compression import EncodedBody
+from ska_ost_osd.common.error_handling import get_http_status_from_map
+from ska_ost_osd.common.metrics import stage_timer
 from ska_ost_osd.common.models import ApiResponse
-from ska_ost_osd.common.utils import convert_to_response_object, get_responses
+from ska_ost_osd.common.utils import (
+    convert_to_response_object,
+    encode_response_object,
+    get_responses,
+    response_envelope,
+)
+from ska_ost_osd.osd.cache.tmdata_pool import source_key, tmdata_pool
 from ska_ost_osd.osd.routers.api import handle_validation_error, osd_router
 from ska_ost_osd.telvalidation.common.constant import (
     SEMANTIC_VALIDATION_DISABLED_MSG,
@@ -13,8 +28,10 @@ from ska_ost_osd.telvalidation.common.constant import (
     SEMANTICALLY_VALID_JSON_MSG,
     SWAGGER_SEMANTIC_VALIDATION_JSON_FILE_PATH,
 )
+from ska_ost_osd.telvalidation.common.error_handling import SchematicValidationError
 from ska_ost_osd.telvalidation.common.utils import read_json
 from ska_ost_osd.telvalidation.models.semantic_schema_validator import (
+    SemanticValidationBatchResult,
     SemanticValidationModel,
 )
 from ska_ost_osd.telvalidation.semantic_validator import (
@@ -22,6 +39,19 @@ from ska_ost_osd.telvalidation.semantic_validator import (
     semantic_validate,
 )
 
+# payloads of a batch request validated in parallel
+SEMANTIC_BATCH_WORKERS = int(environ.get("OSD_SEMANTIC_BATCH_WORKERS", "4"))
+
+
+def validation_message() -> str:
+    """Return the message of a payload that passed semantic validation.
+
+    :return: str, the message depending on VALIDATION_STRICTNESS.
+    """
+    if int(VALIDATION_STRICTNESS) < int(SEMANTIC_VALIDATION_VALUE):
+        return SEMANTIC_VALIDATION_DISABLED_MSG
+    return SEMANTICALLY_VALID_JSON_MSG
+
 
 @osd_router.post(
     "/semantic_validation",
@@ -62,7 +92,8 @@ def semantically_validate_json(
     sources = [semantic_model.sources]
 
     try:
-        tm_data = TMData(sources, update=True)
+        with stage_timer("source_resolve"):
+            tm_data = tmdata_pool.get(sources)
         semantic_validate(
             observing_command_input=semantic_model.observing_command_input,
             tm_data=tm_data,
@@ -77,13 +108,129 @@ def semantically_validate_json(
     if error_details:
         raise ValueError(error_details)
 
-    if int(VALIDATION_STRICTNESS) < int(SEMANTIC_VALIDATION_VALUE):
-        return convert_to_response_object(
-            response=SEMANTIC_VALIDATION_DISABLED_MSG,
-            result_code=HTTPStatus.OK,
+    return convert_to_response_object(
+        response=validation_message(),
+        result_code=HTTPStatus.OK,
+    )
+
+
+def batch_error_result(error: Exception) -> Dict[str, Any]:
+    """Return the result of a batch payload that failed with an error.
+
+    :param error: Exception, the error raised for the payload.
+    :return: Dict[str, Any], the response envelope of the error.
+    """
+    if isinstance(error, SchematicValidationError):
+        return response_envelope(
+            error.message.split("\n"), HTTPStatus.UNPROCESSABLE_ENTITY
         )
+    if isinstance(error, ModelValidationError):
+        return response_envelope(
+            [detail["msg"] for detail in error.errors()],
+            get_http_status_from_map(error),
+        )
+    if error.args and isinstance(error.args[0], (list, dict)):
+        details = error.args[0]
     else:
-        return convert_to_response_object(
-            response=SEMANTICALLY_VALID_JSON_MSG,
-            result_code=HTTPStatus.OK,
+        details = str(error)
+    return response_envelope(details, get_http_status_from_map(error))
+
+
+def validate_batch_item(
+    semantic_model: SemanticValidationModel, tm_data: TMData
+) -> Dict[str, Any]:
+    """Validate a single payload of a batch request.
+
+    :param semantic_model: SemanticValidationModel, the payload.
+    :param tm_data: TMData, the snapshot of the payload's sources.
+    :return: Dict[str, Any], the SemanticValidationBatchResult of the
+        payload as a plain dictionary.
+    """
+    start = time.perf_counter()
+    try:
+        semantic_validate(
+            observing_command_input=semantic_model.observing_command_input,
+            tm_data=tm_data,
+            array_assembly=semantic_model.array_assembly,
+            raise_semantic=semantic_model.raise_semantic,
+            interface=semantic_model.interface,
+            osd_data=semantic_model.osd_data,
         )
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        result = batch_error_result(error)
+    else:
+        result = response_envelope(validation_message(), HTTPStatus.OK)
+
+    result["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+@osd_router.post(
+    "/semantic_validation/batch",
+    summary="Validate several command inputs semantically in one request",
+    description="""Accepts a list of payloads with the same fields as the
+    POST /semantic_validation body and returns one result per payload, in
+    the same order, with the time spent validating it. Payloads with the
+    same sources share one TMData snapshot and the OSD capabilities of
+    each array assembly are resolved once. Payloads are validated
+    concurrently and a failing payload does not fail the whole request.
+    """,
+    responses=get_responses(ApiResponse[SemanticValidationBatchResult]),
+    response_model=ApiResponse[SemanticValidationBatchResult],
+)
+def semantically_validate_json_batch(
+    request: Request,
+    semantic_models: List[SemanticValidationModel] = Body(
+        min_length=1,
+        example=[read_json(SWAGGER_SEMANTIC_VALIDATION_JSON_FILE_PATH)],
+    ),
+) -> Response:
+    """Validate a list of input JSON payloads semantically.
+
+    :param request: Request, incoming request.
+    :param semantic_models: List[SemanticValidationModel], payloads with
+        the same fields as the POST /semantic_validation body.
+    :return: Response, ApiResponse[SemanticValidationBatchResult] with
+        one result per payload, encoded as JSON.
+    """
+    # sources are loaded once per batch, a source that fails to load is
+    # turned into one error result here rather than in every worker
+    snapshots: Dict[tuple, TMData] = {}
+    load_errors: Dict[tuple, Dict[str, Any]] = {}
+    for semantic_model in semantic_models:
+        key = source_key([semantic_model.sources])
+        if key not in snapshots and key not in load_errors:
+            try:
+                with stage_timer("source_resolve"):
+                    snapshots[key] = tmdata_pool.get([semantic_model.sources])
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                load_errors[key] = dict(batch_error_result(error), duration_ms=0.0)
+
+    with ThreadPoolExecutor(
+        max_workers=min(SEMANTIC_BATCH_WORKERS, len(semantic_models)),
+        thread_name_prefix="semantic-batch",
+    ) as executor:
+        # run each payload in a copy of the request context so that its
+        # stages are added to the request's Server-Timing header
+        results: List[Any] = []
+        for semantic_model in semantic_models:
+            key = source_key([semantic_model.sources])
+            if key in load_errors:
+                results.append(dict(load_errors[key]))
+            else:
+                results.append(
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        validate_batch_item,
+                        semantic_model,
+                        snapshots[key],
+                    )
+                )
+        results = [
+            result if isinstance(result, dict) else result.result()
+            for result in results
+        ]
+
+    return EncodedBody(
+        encode_response_object(results, result_code=HTTPStatus.OK)
+    ).response(request.headers.get("accept-encoding"))
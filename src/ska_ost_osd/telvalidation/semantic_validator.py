@@ -7,16 +7,24 @@ to fetch rule constraints values.
 """
 
 import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 from os import environ
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from pydantic import ValidationError
 from ska_telmodel_client import TMData
 
+from ska_ost_osd.common.metrics import stage_timer
+from ska_ost_osd.common.single_flight import single_flight
+from ska_ost_osd.osd.cache.snapshot_cache import snapshot_cache
+from ska_ost_osd.osd.cache.tmdata_pool import tmdata_pool
 from ska_ost_osd.telvalidation.models.semantic_schema_validator import SemanticModel
 
 from .common.constant import (
     ASSIGN_RESOURCE,
+    CAR_TELMODEL_SOURCE,
     CONFIGURE,
     LOW_SBD_VALIDATION_CONSTANT_JSON_FILE_PATH,
     LOW_VALIDATION_CONSTANT_JSON_FILE_PATH,
@@ -29,12 +37,25 @@ from .common.constant import (
     SKA_MID_TELESCOPE,
 )
 from .common.error_handling import SchematicValidationError
-from .oet_tmc_validators import clear_semantic_variable_data, validate_json
+from .oet_tmc_validators import (
+    ValidationContext,
+    apply_validation_steps,
+    build_rule_bindings,
+    collect_rules,
+    validation_steps,
+)
 
 logging.getLogger("telvalidation")
 
 VALIDATION_STRICTNESS = environ.get("VALIDATION_STRICTNESS", "2")
 
+VALIDATION_CONSTANT_FILES = (
+    MID_VALIDATION_CONSTANT_JSON_FILE_PATH,
+    LOW_VALIDATION_CONSTANT_JSON_FILE_PATH,
+    MID_SBD_VALIDATION_CONSTANT_JSON_FILE_PATH,
+    LOW_SBD_VALIDATION_CONSTANT_JSON_FILE_PATH,
+)
+
 
 def get_validation_data(interface: str, telescope: str) -> Optional[str]:
     """Get the validation constant JSON file path based on the provided
@@ -89,7 +110,10 @@ def fetch_capabilities_from_osd(
     if osd_data:
         fetched_osd_data = osd_data
     else:
-        fetched_osd_data, _ = get_osd_data(
+        # concurrent validations against the same TMData share one lookup
+        fetched_osd_data, _ = single_flight.do(
+            ("semantic_osd", id(tm_data), telescope, array_assembly),
+            get_osd_data,
             capabilities=[telescope],
             array_assembly=array_assembly,
             tmdata=tm_data,
@@ -313,6 +337,141 @@ def fetch_matched_capabilities_from_basic_capabilities(
     return capabilities
 
 
+def get_rule_bindings(
+    tm_data: TMData,
+    validation_file: str,
+    array_assembly: str,
+    osd_data: Optional[dict] = None,
+) -> dict:
+    """Return the OSD capabilities of an array assembly and the
+    capabilities matched by each rule of a validation constants file.
+
+    Without osd_data both only depend on the snapshot and are computed
+    once per snapshot, validation constants file and array assembly.
+
+    :param tm_data: TMData, the TMData object created externally.
+    :param validation_file: str, validation constants file path.
+    :param array_assembly: str, specific capabilities like 'AA0.5'.
+    :param osd_data: Optional[dict], externally passed OSD data.
+    :return: dict, "capabilities" and "rule_bindings".
+    """
+    semantic_validate_data = snapshot_cache.document(tm_data, validation_file)
+
+    def bind_rules() -> dict:
+        # call OSD API and fetch capabilities and basic capabilities
+        capabilities, basic_capabilities = fetch_capabilities_from_osd(
+            telescope=semantic_validate_data["telescope"],
+            array_assembly=array_assembly,
+            tm_data=tm_data,
+            osd_data=osd_data,
+        )
+        capabilities_lookup = build_basic_capabilities_lookup(basic_capabilities)
+        matched_capabilities = fetch_matched_capabilities_from_basic_capabilities(
+            capabilities, capabilities_lookup
+        )
+        return {
+            "capabilities": matched_capabilities,
+            "rule_bindings": build_rule_bindings(
+                matched_capabilities,
+                collect_rules(semantic_validate_data[array_assembly]),
+            ),
+        }
+
+    if osd_data:
+        return bind_rules()
+    # capabilities and rules only depend on the snapshot, match them once
+    return snapshot_cache.derived(
+        tm_data, ("rule_bindings", validation_file, array_assembly), bind_rules
+    )
+
+
+class ValidationPlan:
+    """Rules of an interface family together with the OSD capabilities
+    they are checked against.
+
+    A plan does not depend on the command input. It is built once per
+    validation constants file, interface family, array assembly and
+    snapshot, and validating an input only evaluates its rules.
+
+    :param steps: list, flattened rules from validation_steps.
+    :param capabilities: dict, matched capabilities from OSD.
+    :param rule_bindings: dict, matched capabilities per rule.
+    """
+
+    def __init__(self, steps: list, capabilities: dict, rule_bindings: dict) -> None:
+        self.steps = steps
+        self.capabilities = capabilities
+        self.rule_bindings = rule_bindings
+
+    def validate(self, observing_command_input: dict) -> list:
+        """Apply the rules of the plan to a command input.
+
+        :param observing_command_input: dict, user JSON input for
+            semantic validation.
+        :return: list, error messages if validation fails; empty list
+            otherwise.
+        """
+        return apply_validation_steps(
+            self.steps,
+            observing_command_input,
+            ValidationContext(self.capabilities, self.rule_bindings),
+        )
+
+
+def interface_family(interface: str) -> str:
+    """Return the section of the validation constants for an interface.
+
+    :param interface: str, assign/configure resource or SBD interface.
+    :return: str, "assign_resource", "configure" or "sbd".
+    """
+    if ASSIGN_RESOURCE in interface:
+        return "assign_resource"
+    if CONFIGURE in interface:
+        return "configure"
+    return "sbd"
+
+
+def get_validation_plan(
+    tm_data: TMData,
+    interface: str,
+    telescope: str,
+    array_assembly: str,
+    osd_data: Optional[dict] = None,
+) -> ValidationPlan:
+    """Return the validation plan of an interface, telescope and array
+    assembly.
+
+    Without osd_data the plan only depends on the snapshot and is built
+    once per snapshot.
+
+    :param tm_data: TMData, the TMData object created externally.
+    :param interface: str, assign/configure resource schema interface name.
+    :param telescope: str, the telescope identifier (e.g., 'mid' or 'low').
+    :param array_assembly: str, specific capabilities like 'AA0.5', 'AA1'.
+    :param osd_data: Optional[dict], externally passed OSD data.
+    :return: ValidationPlan, the plan to validate inputs with.
+    """
+    validation_file = get_validation_data(interface, telescope)
+    family = interface_family(interface)
+
+    def build_plan() -> ValidationPlan:
+        semantic_validate_data = snapshot_cache.document(tm_data, validation_file)
+        bindings = get_rule_bindings(tm_data, validation_file, array_assembly, osd_data)
+        return ValidationPlan(
+            validation_steps(semantic_validate_data[array_assembly].get(family), []),
+            bindings["capabilities"],
+            bindings["rule_bindings"],
+        )
+
+    if osd_data:
+        return build_plan()
+    return snapshot_cache.derived(
+        tm_data,
+        ("validation_plan", validation_file, family, array_assembly),
+        build_plan,
+    )
+
+
 def validate_command_input(
     observing_command_input: dict,
     tm_data: TMData,
@@ -334,36 +493,9 @@ def validate_command_input(
     otherwise.
     """
 
-    semantic_validate_data = tm_data[
-        get_validation_data(interface, telescope)
-    ].get_dict()
-    # call OSD API and fetch capabilities and basic capabilities
-    capabilities, basic_capabilities = fetch_capabilities_from_osd(
-        telescope=semantic_validate_data["telescope"],
-        array_assembly=array_assembly,
-        tm_data=tm_data,
-        osd_data=osd_data,
-    )
-    capabilities_lookup = build_basic_capabilities_lookup(basic_capabilities)
-    matched_capabilities = fetch_matched_capabilities_from_basic_capabilities(
-        capabilities, capabilities_lookup
-    )
-    validation_data = semantic_validate_data[array_assembly].get(
-        "assign_resource"
-        if ASSIGN_RESOURCE in interface
-        else "configure"
-        if CONFIGURE in interface
-        else "sbd"
-    )
-
-    msg_list = validate_json(
-        validation_data,
-        command_input_json_config=observing_command_input,
-        parent_path_list=[],
-        capabilities=matched_capabilities,
-    )
-
-    return msg_list
+    plan = get_validation_plan(tm_data, interface, telescope, array_assembly, osd_data)
+    with stage_timer("rule_evaluation"):
+        return plan.validate(observing_command_input)
 
 
 def semantic_validate(
@@ -405,7 +537,6 @@ def semantic_validate(
             raise err
         except ValueError as semantic_error:
             raise semantic_error
-        clear_semantic_variable_data()
         version = observing_command_input.get("interface") or interface
         telescope = observing_command_input.get("telescope")
 
@@ -438,3 +569,106 @@ def semantic_validate(
             return False
 
     return True
+
+
+# state of a semantic_validate_many worker process, set by _init_worker
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(
+    sources: List[str],
+    array_assembly: str,
+    interface: Optional[str],
+    osd_data: Optional[dict],
+) -> None:
+    """Load the TMData of a worker process and preload the validation
+    constants and OSD capabilities of the array assembly.
+
+    :param sources: List[str], TMData source URIs.
+    :param array_assembly: str, array assembly of all inputs.
+    :param interface: Optional[str], interface of inputs without one.
+    :param osd_data: Optional[dict], externally passed OSD data.
+    """
+    tm_data = tmdata_pool.get(sources)
+    _worker_state.update(
+        tm_data=tm_data,
+        array_assembly=array_assembly,
+        interface=interface,
+        osd_data=osd_data,
+    )
+    if osd_data:
+        return
+    for validation_file in VALIDATION_CONSTANT_FILES:
+        try:
+            if array_assembly in snapshot_cache.document(tm_data, validation_file):
+                get_rule_bindings(tm_data, validation_file, array_assembly)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # inputs needing this file report the error themselves
+            logging.debug("Not preloading %s: %s", validation_file, error)
+
+
+def _validate_in_worker(observing_command_input: dict) -> Union[bool, Exception]:
+    """Validate one input in a worker process.
+
+    :param observing_command_input: dict, command input to validate.
+    :return: Union[bool, Exception], True if valid, otherwise the error
+        raised by semantic_validate.
+    """
+    try:
+        return semantic_validate(
+            observing_command_input,
+            _worker_state["tm_data"],
+            array_assembly=_worker_state["array_assembly"],
+            interface=_worker_state["interface"],
+            osd_data=_worker_state["osd_data"],
+        )
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return error
+
+
+def semantic_validate_many(
+    observing_command_inputs: Iterable[dict],
+    sources: Union[str, List[str]] = CAR_TELMODEL_SOURCE,
+    array_assembly: str = "AA0.5",
+    interface: Optional[str] = None,
+    osd_data: Optional[dict] = None,
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> List[Union[bool, Exception]]:
+    """Semantically validate many command inputs in a pool of processes.
+
+    Rule evaluation is CPU bound, so large workloads such as the SBDs of
+    an observing night are spread over processes rather than threads.
+    Each worker loads the TMData and preloads the validation constants and
+    OSD capabilities once, inputs are dispatched in chunks.
+
+    :param observing_command_inputs: Iterable[dict], command inputs as
+        accepted by semantic_validate.
+    :param sources: Union[str, List[str]], TMData source URIs, every
+        worker loads them once.
+    :param array_assembly: str, array assembly version like 'AA0.5'.
+    :param interface: Optional[str], full interface URI for inputs that
+        do not contain one.
+    :param osd_data: Optional[dict], externally passed OSD data.
+    :param max_workers: Optional[int], number of processes, the number of
+        CPUs by default.
+    :param chunksize: Optional[int], inputs sent to a worker at a time,
+        by default about four chunks per worker.
+    :return: List[Union[bool, Exception]], in the order of the inputs,
+        True for a valid input and otherwise the error semantic_validate
+        raised for it, e.g. a SchematicValidationError.
+    """
+    inputs = list(observing_command_inputs)
+    if not inputs:
+        return []
+    if isinstance(sources, str):
+        sources = [sources]
+    max_workers = min(max_workers or os.cpu_count() or 1, len(inputs))
+    chunksize = chunksize or math.ceil(len(inputs) / (max_workers * 4))
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(sources, array_assembly, interface, osd_data),
+    ) as executor:
+        return list(executor.map(_validate_in_worker, inputs, chunksize=chunksize))
@@ -0,0 +1 @@
+"""Benchmarks, run as modules and not collected by pytest."""
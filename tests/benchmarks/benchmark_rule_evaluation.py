@@ -0,0 +1,82 @@
+"""Benchmark of semantic validation rule evaluation.
+
+Compares building a new evaluator for every rule evaluation with the
+per-thread evaluator used by ``evaluate_rule``. Run from the repository
+root with::
+
+    python -m tests.benchmarks.benchmark_rule_evaluation
+"""
+
+import argparse
+import re
+import timeit
+
+from simpleeval import EvalWithCompoundTypes
+
+from ska_ost_osd.telvalidation.oet_tmc_validators import compile_rule, evaluate_rule
+
+# rules from the mid validation constants with inputs that satisfy them
+RULES = [
+    (
+        "receptor_ids",
+        ["SKA001", "SKA036"],
+        "(0 < len(receptor_ids) <= number_ska_dishes)",
+        {"number_ska_dishes": 4},
+    ),
+    (
+        "freq_min",
+        350000000.0,
+        "min_frequency_hz <= freq_min <= max_frequency_hz",
+        {"min_frequency_hz": 350000000.0, "max_frequency_hz": 1050000000.0},
+    ),
+    ("channel_count", 140, "(channel_count % 20) == 0", {}),
+    ("receiver_band", "1", "receiver_band in ['1','2', '5a','5b']", {}),
+    (
+        "fsp_ids",
+        [1, 2],
+        "False if len([num for num in fsp_ids if num > number_fsps])> 0 else True",
+        {"number_fsps": 4},
+    ),
+]
+
+
+def evaluate_with_new_evaluator() -> None:
+    """Evaluate every rule with a newly built evaluator, as before."""
+    for key, value, rule, constraint in RULES:
+        simple_eval = EvalWithCompoundTypes()
+        simple_eval.functions["len"] = len
+        simple_eval.functions["re"] = re
+        simple_eval.names = {key: value, **constraint}
+        simple_eval.eval(rule, previously_parsed=compile_rule(rule))
+
+
+def evaluate_with_shared_evaluator() -> None:
+    """Evaluate every rule through evaluate_rule."""
+    for key, value, rule, constraint in RULES:
+        evaluate_rule(key, value, {"rule": rule}, [constraint])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--number", type=int, default=2000, help="rule sets evaluated per run"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs")
+    args = parser.parse_args()
+
+    evaluations = args.number * len(RULES)
+    results = {}
+    for name, function in (
+        ("new evaluator per rule", evaluate_with_new_evaluator),
+        ("shared evaluator", evaluate_with_shared_evaluator),
+    ):
+        best = min(timeit.repeat(function, number=args.number, repeat=args.repeat))
+        results[name] = best
+        print(f"{name:24} {best / evaluations * 1e6:8.2f} us per evaluation")
+
+    saving = 1 - results["shared evaluator"] / results["new evaluator per rule"]
+    print(f"{'saving':24} {saving:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
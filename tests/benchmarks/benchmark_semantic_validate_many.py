@@ -0,0 +1,50 @@
+"""Benchmark of semantic_validate_many against sequential validation.
+
+Validates copies of the mid SBD test input against the tmdata folder of
+the repository, once in the calling process and then with process pools
+of increasing size. Run from the repository root with::
+
+    python -m tests.benchmarks.benchmark_semantic_validate_many
+"""
+
+import argparse
+import os
+import time
+
+from ska_telmodel_client import TMData
+
+from ska_ost_osd.telvalidation import semantic_validate, semantic_validate_many
+from tests.unit.ska_ost_osd.utils import read_json
+
+SOURCES = ["file://tmdata"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--inputs", type=int, default=2000, help="inputs validated")
+    args = parser.parse_args()
+
+    sbd = read_json("test_files/testfile_mid_sbd.json")["valid"]
+    inputs = [sbd] * args.inputs
+
+    tm_data = TMData(SOURCES)
+    start = time.perf_counter()
+    for observing_command_input in inputs:
+        semantic_validate(observing_command_input, tm_data, raise_semantic=False)
+    sequential = time.perf_counter() - start
+    print(f"{'sequential':12} {args.inputs / sequential:10.1f} inputs/s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        semantic_validate_many(inputs, SOURCES, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{workers:3} workers  {args.inputs / elapsed:10.1f} inputs/s"
+            f"  {sequential / elapsed:5.2f}x"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
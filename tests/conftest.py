@@ -10,7 +10,14 @@ from fastapi.testclient import TestClient
 from ska_telmodel_client import TMData
 
 from ska_ost_osd.app import create_app
+from ska_ost_osd.osd.cache.response_cache import response_cache
+from ska_ost_osd.osd.cache.snapshot_cache import snapshot_cache
+from ska_ost_osd.osd.cache.tmdata_pool import tmdata_pool
 from ska_ost_osd.osd.osd import osd_tmdata_source
+from ska_ost_osd.osd.version_mapping.version_resolver import (
+    cycle_resolver,
+    version_resolver,
+)
 from ska_ost_osd.telvalidation.common.constant import CAR_TELMODEL_SOURCE
 from tests.unit.ska_ost_osd.common.constant import (
     DEFAULT_OSD_RESPONSE_WITH_NO_PARAMETER,
@@ -48,6 +55,23 @@ OSD_MAJOR_VERSION = version("ska-ost-osd").split(".")[0]
 BASE_API_URL = f"/ska-ost-osd/osd/api/v{OSD_MAJOR_VERSION}"
 
 
+@pytest.fixture(autouse=True)
+def reset_osd_caches():
+    """Start every test with empty process-wide OSD caches so mocked
+    TMData never leaks between tests."""
+    tmdata_pool.clear()
+    version_resolver.invalidate()
+    cycle_resolver.invalidate()
+    response_cache.clear()
+    snapshot_cache.clear()
+    yield
+    tmdata_pool.clear()
+    version_resolver.invalidate()
+    cycle_resolver.invalidate()
+    response_cache.clear()
+    snapshot_cache.clear()
+
+
 @pytest.fixture(scope="session")
 def create_entity_object():
     def _create_entity_object(filepath: str):
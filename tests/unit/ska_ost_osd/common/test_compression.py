@@ -0,0 +1,81 @@
+"""Unit tests for Content-Encoding negotiation and compressed variants."""
+
+import gzip
+from unittest import mock
+
+import brotli
+import pytest
+
+from ska_ost_osd.common.compression import (
+    EncodedBody,
+    compress,
+    negotiate_encoding,
+    representation_etag,
+)
+
+BODY = b'{"result_data":{"custom_stations":"' + b"S8-1, " * 500 + b'"}}'
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("deflate, gzip;q=0.5", "gzip"),
+        ("gzip;q=0", None),
+        ("br", "br"),
+        ("*", "br"),
+        ("*, br;q=0", "gzip"),
+        ("*, br;q=0, gzip;q=0", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    """Quality values and wildcards are honoured."""
+    assert negotiate_encoding(accept_encoding) == expected
+
+
+def test_brotli_is_preferred():
+    """brotli wins over gzip at equal quality."""
+    assert negotiate_encoding("gzip, br") == "br"
+    assert negotiate_encoding("gzip, br;q=0.5") == "gzip"
+
+
+def test_variant_is_compressed_once():
+    """A shared body is compressed once per encoding."""
+    encoded = EncodedBody(BODY)
+
+    with mock.patch(
+        "ska_ost_osd.common.compression.compress", wraps=compress
+    ) as mock_compress:
+        first = encoded.variant("gzip")
+        second = encoded.variant("gzip")
+
+    assert first is second
+    assert gzip.decompress(first) == BODY
+    mock_compress.assert_called_once()
+    assert encoded.size == len(BODY) + len(first)
+
+
+def test_small_body_is_not_compressed():
+    """Bodies below the threshold are sent as they are."""
+    response = EncodedBody(b'{"result_data":{}}').response("gzip")
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, encoding, decompress",
+    [("br, gzip", "br", brotli.decompress), ("gzip", "gzip", gzip.decompress)],
+)
+def test_response_uses_negotiated_variant(accept_encoding, encoding, decompress):
+    """The compressed response gets its own ETag and Content-Encoding."""
+    response = EncodedBody(BODY).response(
+        accept_encoding, headers={"ETag": '"abc"', "Cache-Control": "no-cache"}
+    )
+
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["etag"] == representation_etag('"abc"', encoding)
+    assert response.headers["cache-control"] == "no-cache"
+    assert decompress(response.body) == BODY
@@ -0,0 +1,77 @@
+"""Unit tests for the Prometheus metrics."""
+
+from prometheus_client import CollectorRegistry
+
+from ska_ost_osd.common.metrics import CacheCollector, registry, stage_timer
+from ska_ost_osd.common.single_flight import SingleFlight, SingleFlightCollector
+from tests.conftest import BASE_API_URL
+
+
+def test_cache_hit_ratio():
+    """Registered caches are exposed with hits, misses and hit ratio."""
+    test_registry = CollectorRegistry()
+    collector = CacheCollector()
+    test_registry.register(collector)
+    collector.register("response", lambda: {"hits": 3, "misses": 1})
+    collector.register("empty", lambda: {"hits": 0, "misses": 0})
+
+    def sample(name, cache):
+        return test_registry.get_sample_value(name, {"cache": cache})
+
+    assert sample("osd_cache_hits_total", "response") == 3
+    assert sample("osd_cache_misses_total", "response") == 1
+    assert sample("osd_cache_hit_ratio", "response") == 0.75
+    assert sample("osd_cache_hit_ratio", "empty") == 0.0
+
+
+def test_single_flight_collector():
+    """Calls of a SingleFlight are read when scraped."""
+    test_registry = CollectorRegistry()
+    flight = SingleFlight()
+    test_registry.register(SingleFlightCollector(flight))
+    flight.shared = 2
+
+    assert test_registry.get_sample_value("osd_single_flight_in_flight") == 0
+    assert test_registry.get_sample_value("osd_single_flight_shared_total") == 2
+
+
+def test_stage_timer_observes_stage():
+    """Timed stages are recorded in osd_stage_duration_seconds."""
+
+    def count():
+        return (
+            registry.get_sample_value(
+                "osd_stage_duration_seconds_count", {"stage": "test_stage"}
+            )
+            or 0
+        )
+
+    before = count()
+    with stage_timer("test_stage"):
+        pass
+
+    assert count() == before + 1
+
+
+def test_metrics_endpoint(client_get):
+    """GET /metrics exposes the stages of a served OSD request."""
+    labels = {"stage": "serialization"}
+    serialization_count = (
+        registry.get_sample_value("osd_stage_duration_seconds_count", labels) or 0
+    )
+    client_get(f"{BASE_API_URL}/osd", params={"source": "file", "capabilities": "mid"})
+
+    response = client_get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        registry.get_sample_value("osd_stage_duration_seconds_count", labels)
+        == serialization_count + 1
+    )
+    for sample in (
+        'osd_stage_duration_seconds_count{stage="get_data"}',
+        'osd_http_request_duration_seconds_count{method="GET",route="/osd"}',
+        'osd_cache_hit_ratio{cache="tmdata_pool"}',
+        "osd_single_flight_in_flight 0.0",
+    ):
+        assert sample in response.text
@@ -0,0 +1,67 @@
+"""Unit tests for Server-Timing headers and slow request logging."""
+
+import json
+import logging
+from unittest import mock
+
+from ska_ost_osd.common.metrics import stage_timer
+from ska_ost_osd.common.request_timing import (
+    RequestTimings,
+    _current_timings,
+    server_timing_header,
+)
+from tests.conftest import BASE_API_URL
+
+
+def test_server_timing_header():
+    """Stages are listed in milliseconds followed by the total."""
+    header = server_timing_header({"get_data": 0.0012, "serialization": 0.0005}, 0.01)
+
+    assert header == "get_data;dur=1.200, serialization;dur=0.500, total;dur=10.000"
+
+
+def test_stage_timer_records_into_current_request():
+    """Repeated stages are summed, stages outside a request are ignored."""
+    with stage_timer("get_data"):
+        pass
+
+    timings = RequestTimings()
+    token = _current_timings.set(timings)
+    try:
+        with stage_timer("get_data"):
+            pass
+        with stage_timer("get_data"):
+            pass
+        with stage_timer("serialization"):
+            pass
+    finally:
+        _current_timings.reset(token)
+
+    assert list(timings.stages()) == ["get_data", "serialization"]
+
+
+def test_osd_response_has_server_timing(client_get):
+    """GET /osd responses break down the time spent per stage."""
+    response = client_get(
+        f"{BASE_API_URL}/osd", params={"source": "file", "capabilities": "mid"}
+    )
+
+    stages = [
+        part.split(";")[0] for part in response.headers["server-timing"].split(", ")
+    ]
+    assert {"source_resolve", "get_data", "serialization"} <= set(stages)
+    assert stages[-1] == "total"
+
+
+def test_slow_requests_are_logged(client_get, caplog):
+    """Requests over the threshold log their stages and query parameters."""
+    params = {"source": "file", "capabilities": "mid"}
+    with mock.patch(
+        "ska_ost_osd.common.request_timing.SLOW_REQUEST_THRESHOLD_MS", 0
+    ), caplog.at_level(logging.WARNING, logger="ska_ost_osd.common.request_timing"):
+        client_get(f"{BASE_API_URL}/osd", params=params)
+
+    record = json.loads(caplog.records[-1].getMessage().split(": ", 1)[1])
+    assert record["query"] == params
+    assert record["status"] == 200
+    assert "serialization" in record["stages_ms"]
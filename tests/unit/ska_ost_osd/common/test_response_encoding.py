@@ -0,0 +1,42 @@
+"""Unit tests for the pre-encoded ApiResponse path."""
+
+import json
+from http import HTTPStatus
+
+import pytest
+
+from ska_ost_osd.common.frozen import freeze
+from ska_ost_osd.common.utils import (
+    convert_to_response_object,
+    encode_response_object,
+)
+
+PAYLOAD = freeze(
+    {
+        "capabilities": {
+            "mid": {
+                "basic_capabilities": {"max_frequency_hz": 15400000000.0},
+                "AA0.5": {"number_receptors": 4, "name": "Ñ", "allowed": None},
+            }
+        }
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "response, result_code",
+    [
+        (PAYLOAD, HTTPStatus.OK),
+        (["Array Assembly AA100 is not valid"], HTTPStatus.BAD_REQUEST),
+        ("semantic validation disabled", HTTPStatus.OK),
+    ],
+)
+def test_encoded_response_matches_api_response(response, result_code):
+    """The encoded body equals the JSON of the equivalent ApiResponse."""
+    expected = json.loads(
+        convert_to_response_object(response, result_code=result_code).model_dump_json()
+    )
+
+    body = encode_response_object(response, result_code=result_code)
+
+    assert json.loads(body) == expected
@@ -0,0 +1,74 @@
+"""Unit tests for SingleFlight request coalescing."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ska_ost_osd.common.single_flight import SingleFlight
+
+
+def run_concurrently(flight: SingleFlight, function, callers: int = 5) -> list:
+    """Start callers that call function through flight while it blocks."""
+    release = threading.Event()
+
+    def blocking():
+        release.wait(timeout=5)
+        return function()
+
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        futures = [executor.submit(flight.do, "key", blocking) for _ in range(callers)]
+        while flight.shared < callers - 1:
+            threading.Event().wait(0.01)
+        release.set()
+    return futures
+
+
+def test_concurrent_callers_share_one_call():
+    """Only the first caller runs, the others get its result."""
+    flight = SingleFlight()
+    calls = []
+
+    futures = run_concurrently(flight, lambda: calls.append(1) or {"data": 1})
+
+    assert len(calls) == 1
+    results = [future.result() for future in futures]
+    assert all(result is results[0] for result in results)
+    assert flight.in_flight() == 0
+
+
+def test_concurrent_callers_share_the_error():
+    """An exception of the running call is raised in every caller."""
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError(["not found"])
+
+    for future in run_concurrently(flight, fail):
+        with pytest.raises(ValueError):
+            future.result()
+
+
+def test_waiters_raise_their_own_error():
+    """Waiters do not share the exception instance of the running call."""
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError(["not found"])
+
+    errors = [future.exception() for future in run_concurrently(flight, fail)]
+
+    leader = next(error for error in errors if error.__cause__ is None)
+    waiters = [error for error in errors if error is not leader]
+    assert len({id(error) for error in errors}) == len(errors)
+    assert all(error.__cause__ is leader for error in waiters)
+    assert all(error.args == (["not found"],) for error in waiters)
+
+
+def test_sequential_calls_run_again():
+    """Results are not kept once the call has finished."""
+    flight = SingleFlight()
+
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+    assert flight.shared == 0
@@ -9,7 +9,7 @@ class TestCycleAPI:
     """This class contains unit tests for the Cycle GET API, which is
     responsible for fetching Dictionary containing list of cycle numbers."""
 
-    @mock.patch("ska_ost_osd.osd.osd.TMData")
+    @mock.patch("ska_ost_osd.osd.version_mapping.version_resolver.TMData")
     def test_cycle_endpoint(self, mock_tmdata, client_get):
         """Test that GET /cycle returns appropriate json response after
         fetching cycle data from TMData."""
@@ -32,8 +32,27 @@ class TestCycleAPI:
 
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == expected_json
+        mock_tmdata.assert_called_once_with(
+            ["car:ost/ska-ost-osd?main#tmdata"], update=True
+        )
 
-    @mock.patch("ska_ost_osd.osd.osd.TMData")
+    @mock.patch("ska_ost_osd.osd.version_mapping.version_resolver.TMData")
+    def test_cycle_endpoint_conditional_get(self, mock_tmdata, client_get):
+        """Test that GET /cycle returns 304 while the cycle mapping is
+        unchanged."""
+        mock_tmdata_instance = mock.MagicMock()
+        mock_tmdata.return_value = mock_tmdata_instance
+        mock_tmdata_instance.__getitem__.return_value.get_dict.return_value = {
+            "cycle_1": ["1.0.0"],
+        }
+
+        etag = client_get(f"{BASE_API_URL}/cycle").headers["etag"]
+        response = client_get(f"{BASE_API_URL}/cycle", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["etag"] == etag
+
+    @mock.patch("ska_ost_osd.osd.version_mapping.version_resolver.TMData")
     def test_cycle_endpoint_file_not_found(self, mock_tmdata, client_get):
         """Test that GET /cycle returns 500 or appropriate error when TMData
         raises an exception."""
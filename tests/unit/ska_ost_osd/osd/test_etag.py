@@ -0,0 +1,101 @@
+"""Unit tests for the conditional GET validators."""
+
+from unittest import mock
+
+import pytest
+
+from ska_ost_osd.osd.cache.etag import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    compute_etag,
+    etag_matches,
+    osd_validators,
+    snapshot_digest,
+)
+from ska_ost_osd.osd.cache.tmdata_pool import TMDataPool
+
+
+def make_tmdata(content: bytes) -> mock.MagicMock:
+    """Build a TMData mock returning the same content for every file."""
+    tmdata = mock.MagicMock()
+    tmdata.__getitem__.return_value.get.return_value = content
+    return tmdata
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ("*", True),
+        ('"xyz"', False),
+    ],
+)
+def test_etag_matches(if_none_match, expected):
+    """If-None-Match accepts lists, wildcards and weak tags."""
+    assert etag_matches(if_none_match, '"abc"') is expected
+
+
+def test_compute_etag_is_stable_and_query_dependent():
+    """Equal inputs give equal ETags, different queries do not."""
+    assert compute_etag({"a": 1, "b": 2}) == compute_etag({"b": 2, "a": 1})
+    assert compute_etag("source", ["mid"]) != compute_etag("source", ["low"])
+
+
+def test_snapshot_digest_is_computed_once_per_snapshot():
+    """Files are hashed once per snapshot and the digest follows content."""
+    first = make_tmdata(b"one")
+
+    assert snapshot_digest(first) == snapshot_digest(first)
+    assert snapshot_digest(first) != snapshot_digest(make_tmdata(b"two"))
+    assert first.__getitem__.return_value.get.call_count == 4
+
+
+def test_pinned_source_is_immutable_without_loading():
+    """Released versions are identified by their URI alone."""
+    with mock.patch("ska_ost_osd.osd.cache.etag.tmdata_pool") as mock_pool:
+        etag, cache_control = osd_validators(
+            ["car:ost/ska-ost-osd?1.0.0#tmdata"],
+            capabilities="mid",
+            requested_ref="1.0.0",
+        )
+
+    assert etag == compute_etag(
+        ("car:ost/ska-ost-osd?1.0.0#tmdata",), [None, "mid", None, False, None, True]
+    )
+    assert cache_control == IMMUTABLE_CACHE_CONTROL
+    mock_pool.get.assert_not_called()
+
+
+@pytest.mark.parametrize("requested_ref", [None, "main", "1.0.0-fix"])
+def test_resolved_release_is_revalidated(requested_ref):
+    """A release that was not asked for by version, e.g. the latest
+    release, may change and has to be revalidated."""
+    with mock.patch("ska_ost_osd.osd.cache.etag.tmdata_pool") as mock_pool:
+        etag, cache_control = osd_validators(
+            ["car:ost/ska-ost-osd?1.0.0#tmdata"],
+            capabilities="mid",
+            requested_ref=requested_ref,
+        )
+
+    assert etag == compute_etag(
+        ("car:ost/ska-ost-osd?1.0.0#tmdata",), [None, "mid", None, False, None, True]
+    )
+    assert cache_control == REVALIDATE_CACHE_CONTROL
+    mock_pool.get.assert_not_called()
+
+
+def test_branch_source_follows_content():
+    """Branch sources are revalidated and change ETag with their content."""
+    snapshots = iter([make_tmdata(b"one"), make_tmdata(b"two")])
+    pool = TMDataPool(ttl_seconds=0, factory=lambda *_, **__: next(snapshots))
+    source = ["gitlab://gitlab.com/ska-telescope/ost/ska-ost-osd?main#tmdata"]
+
+    with mock.patch("ska_ost_osd.osd.cache.etag.tmdata_pool", pool):
+        first, cache_control = osd_validators(source, capabilities="mid")
+        second, _ = osd_validators(source, capabilities="mid")
+
+    assert cache_control == REVALIDATE_CACHE_CONTROL
+    assert first != second
@@ -0,0 +1,150 @@
+"""Unit tests for field selection on OSD responses."""
+
+from unittest import mock
+
+import pytest
+
+from ska_ost_osd.osd.field_selection.field_selection import (
+    contains_key,
+    parse_fields,
+    select_fields,
+)
+from ska_ost_osd.osd.osd import get_selected_osd_from_source
+
+OSD_DATA = {
+    "observatory_policy": {"cycle_number": 1},
+    "capabilities": {
+        "mid": {
+            "basic_capabilities": {"receiver_information": [{"rx_id": "Band_1"}]},
+            "AA0.5": {"number_ska_dishes": 4, "subarray_templates": ["MID_*"]},
+            "AA0": {"number_ska_dishes": 0},
+        },
+        "low": {
+            "basic_capabilities": {"max_frequency_hz": 350000000.0},
+            "AA0.5": {"number_stations": 4},
+        },
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    [
+        (None, None),
+        ("", None),
+        (" a.b , /c/d,a.b,", ("a.b", "/c/d")),
+    ],
+)
+def test_parse_fields(fields, expected):
+    """Paths are split, stripped and de-duplicated."""
+    assert parse_fields(fields) == expected
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    [
+        (
+            ("AA0.5.number_ska_dishes",),
+            {"capabilities": {"mid": {"AA0.5": {"number_ska_dishes": 4}}}},
+        ),
+        (
+            ("basic_capabilities.max_frequency_hz",),
+            {
+                "capabilities": {
+                    "low": {"basic_capabilities": {"max_frequency_hz": 350000000.0}}
+                }
+            },
+        ),
+        (
+            ("/capabilities/mid/AA0.5/number_ska_dishes", "observatory_policy"),
+            {
+                "observatory_policy": {"cycle_number": 1},
+                "capabilities": {"mid": {"AA0.5": {"number_ska_dishes": 4}}},
+            },
+        ),
+        (
+            ("AA0.5", "AA0.5.number_stations"),
+            {
+                "capabilities": {
+                    "mid": {"AA0.5": OSD_DATA["capabilities"]["mid"]["AA0.5"]},
+                    "low": {"AA0.5": {"number_stations": 4}},
+                }
+            },
+        ),
+    ],
+)
+def test_select_fields(fields, expected):
+    """Dotted paths, pointers and overlapping paths select subtrees."""
+    selected, missing = select_fields(OSD_DATA, fields)
+
+    assert selected == expected
+    assert not missing
+
+
+def test_select_fields_reports_missing_paths():
+    """Paths that match nothing are reported, the rest is selected."""
+    selected, missing = select_fields(
+        OSD_DATA, ("AA0.5.number_stations", "AA9", "/capabilities/mid/AA0.5/x")
+    )
+
+    assert selected == {"capabilities": {"low": {"AA0.5": {"number_stations": 4}}}}
+    assert missing == ["AA9", "/capabilities/mid/AA0.5/x"]
+
+
+def test_contains_key():
+    """Keys are found at any depth, including inside lists."""
+    assert contains_key(OSD_DATA, "subarray_templates")
+    assert contains_key([{"a": {"rx_id": 1}}], "rx_id")
+    assert not contains_key(OSD_DATA["capabilities"]["low"], "subarray_templates")
+
+
+@mock.patch("ska_ost_osd.osd.osd.get_osd_from_source")
+def test_templates_are_only_processed_when_selected(mock_get_osd_from_source):
+    """Template mappings are only processed when the selection includes
+    subarray_templates."""
+    mock_get_osd_from_source.return_value = OSD_DATA
+    source = ["file://tmdata"]
+
+    get_selected_osd_from_source(
+        ("AA0.5.number_ska_dishes",), source, process_templates=True
+    )
+    assert mock_get_osd_from_source.call_count == 1
+    assert mock_get_osd_from_source.call_args.kwargs["process_templates"] is False
+
+    get_selected_osd_from_source(("AA0.5",), source, process_templates=True)
+    assert mock_get_osd_from_source.call_count == 3
+    assert mock_get_osd_from_source.call_args.kwargs["process_templates"] is True
+
+    with pytest.raises(ValueError):
+        get_selected_osd_from_source(("AA9",), source, process_templates=True)
+
+
+@mock.patch("ska_ost_osd.osd.osd.get_osd_from_source")
+def test_template_paths_are_selected_from_expanded_templates(
+    mock_get_osd_from_source,
+):
+    """A path into a single template is selected from the processed data
+    when templates are expanded."""
+    template = {"MID_X": {"subarray_type": "AA0.5"}}
+    expanded = {"capabilities": {"mid": {"AA0.5": {"subarray_templates": template}}}}
+    mock_get_osd_from_source.side_effect = lambda *_, **kwargs: (
+        expanded if kwargs["process_templates"] else OSD_DATA
+    )
+    source = ["file://tmdata"]
+
+    for field in (
+        "AA0.5.subarray_templates.MID_X",
+        "/capabilities/mid/AA0.5/subarray_templates/MID_X",
+    ):
+        selected = get_selected_osd_from_source(
+            (field,), source, process_templates=True, expand_templates=True
+        )
+        assert selected == expanded
+
+    with pytest.raises(ValueError):
+        get_selected_osd_from_source(
+            ("AA0.5.subarray_templates.MID_X",),
+            source,
+            process_templates=True,
+            expand_templates=False,
+        )
@@ -1,3 +1,4 @@
+import copy
 from unittest.mock import patch
 
 import pytest
@@ -60,6 +61,22 @@ def test_get_osd_data(
     assert result_keys == expected_keys
 
 
+def test_get_osd_data_shares_snapshot_data(
+    tm_data_osd,  # pylint: disable=W0621
+):
+    """Each request gets its own envelope around shared read-only data."""
+    first, _ = get_osd_data(["mid"], "AA0.5", tmdata=tm_data_osd, cycle_id=1)
+    second, _ = get_osd_data(["mid"], "AA0.5", tmdata=tm_data_osd, cycle_id=1)
+
+    assert first is not second
+    assert first["capabilities"] is not second["capabilities"]
+    assert first["capabilities"]["mid"]["AA0.5"] is (
+        second["capabilities"]["mid"]["AA0.5"]
+    )
+    with pytest.raises(TypeError):
+        first["capabilities"]["mid"]["AA0.5"]["number_receptors"] = 0
+
+
 def test_set_source_car_method(validate_car_class):
     """This test case checks if the output of the osd_tmdata_source function is
     as expected or not.
@@ -374,9 +391,10 @@ def test_get_osd_data_template_processing_called(
     """Test that process_template_mappings is called when process_templates=True."""
 
     # Mock the template processing function to return modified data
-    def mock_template_processing(data, _capability, _template_data):
-        # Add mock subarray_templates to the data
-        modified_data = data.copy()
+    def mock_template_processing(data, _capability, _template_data, keys_only=False):
+        assert not keys_only
+        # Add mock subarray_templates to a copy, tmdata documents are read-only
+        modified_data = copy.deepcopy(data)
         if "AA0.5" in modified_data:
             modified_data["AA0.5"]["subarray_templates"] = {
                 "mid_template_1": {"config": "test"}
@@ -0,0 +1,184 @@
+"""Unit tests for the resolved OSD response cache."""
+
+import json
+from unittest import mock
+
+import pytest
+
+from ska_ost_osd.common.utils import encode_response_object
+from ska_ost_osd.osd.cache.response_cache import (
+    ResponseCache,
+    payload_size,
+    response_cache,
+)
+from ska_ost_osd.osd.osd import (
+    get_encoded_osd_from_source,
+    get_osd_batch,
+    get_osd_from_source,
+    get_osd_using_tmdata,
+)
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache."""
+
+    def test_hit_and_miss_counters(self):
+        """Lookups are counted as hits or misses."""
+        cache = ResponseCache(max_bytes=1024)
+
+        assert cache.get("key") is None
+        cache.put("key", {"a": 1})
+
+        assert cache.get("key") == {"a": 1}
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "entries": 1,
+            "bytes": payload_size({"a": 1}),
+        }
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Entries are evicted in LRU order once the byte limit is hit."""
+        cache = ResponseCache(max_bytes=30)
+        cache.put("first", {"a": 1}, size=10)
+        cache.put("second", {"b": 2}, size=10)
+        cache.put("third", {"c": 3}, size=10)
+        cache.get("first")
+
+        cache.put("fourth", {"d": 4}, size=10)
+
+        assert len(cache) == 3
+        assert cache.size == 30
+        assert cache.get("second") is None
+        assert cache.get("fourth") == {"d": 4}
+
+    def test_oversized_entry_is_not_cached(self):
+        """A value larger than the whole cache is skipped."""
+        cache = ResponseCache(max_bytes=5)
+
+        cache.put("key", {"too": "large"})
+
+        assert len(cache) == 0
+
+
+@mock.patch("ska_ost_osd.osd.osd.get_osd_data")
+@mock.patch("ska_ost_osd.osd.osd.tmdata_pool")
+@mock.patch("ska_ost_osd.osd.osd.version_resolver")
+def test_pinned_version_is_resolved_once(mock_resolver, mock_pool, mock_get_osd_data):
+    """Repeated queries for a released version are served from the cache
+    while branch sources are always resolved."""
+    mock_resolver.versions_dict = {"cycle_1": ["1.0.0"]}
+    mock_get_osd_data.return_value = ({"capabilities": {"mid": {}}}, [])
+
+    for _ in range(2):
+        get_osd_using_tmdata(osd_version="1.0.0", source="car", capabilities="mid")
+    assert mock_get_osd_data.call_count == 1
+
+    for _ in range(2):
+        get_osd_using_tmdata(gitlab_branch="main", source="gitlab", capabilities="mid")
+    assert mock_get_osd_data.call_count == 3
+    assert mock_pool.get.call_count == 3
+
+
+@mock.patch("ska_ost_osd.osd.osd.get_osd_data")
+@mock.patch("ska_ost_osd.osd.osd.tmdata_pool")
+@mock.patch("ska_ost_osd.osd.osd.version_resolver")
+def test_cached_payload_is_read_only(mock_resolver, _mock_pool, mock_get_osd_data):
+    """Cached payloads are shared between requests and cannot be modified."""
+    mock_resolver.versions_dict = {"cycle_1": ["1.0.0"]}
+    mock_get_osd_data.return_value = ({"capabilities": {"mid": {}}}, [])
+
+    first = get_osd_using_tmdata(osd_version="1.0.0", source="car", capabilities="mid")
+    second = get_osd_using_tmdata(osd_version="1.0.0", source="car", capabilities="mid")
+
+    assert first is second
+    with pytest.raises(TypeError):
+        second["capabilities"]["low"] = {}
+
+
+@mock.patch("ska_ost_osd.osd.osd.get_osd_data")
+@mock.patch("ska_ost_osd.osd.osd.tmdata_pool")
+@mock.patch("ska_ost_osd.osd.osd.version_resolver")
+def test_batch_loads_each_source_once(mock_resolver, mock_pool, mock_get_osd_data):
+    """Batch queries are grouped by source and failures stay per query."""
+    mock_resolver.versions_dict = {"cycle_1": ["1.0.0"]}
+    mock_get_osd_data.side_effect = lambda **kwargs: (
+        {"capabilities": {kwargs["capabilities"][0]: {}}},
+        [],
+    )
+
+    results = get_osd_batch(
+        [
+            {"source": "gitlab", "gitlab_branch": "main", "capabilities": "mid"},
+            {"source": "gitlab", "gitlab_branch": "main", "capabilities": "low"},
+            {"source": "car", "osd_version": "1.0.0", "capabilities": "mid"},
+            {"source": "car", "cycle_id": 99, "capabilities": "mid"},
+        ]
+    )
+
+    assert [data for data, _ in results[:3]] == [
+        {"capabilities": {"mid": {}}},
+        {"capabilities": {"low": {}}},
+        {"capabilities": {"mid": {}}},
+    ]
+    assert results[3][0] is None
+    assert "99" in results[3][1][0]
+    assert mock_pool.get.call_count == 2
+
+
+@mock.patch("ska_ost_osd.osd.osd.get_osd_data")
+@mock.patch("ska_ost_osd.osd.osd.tmdata_pool")
+def test_encoded_body_is_cached_for_pinned_source(_mock_pool, mock_get_osd_data):
+    """Released versions are resolved and encoded once, branch sources every
+    time."""
+    mock_get_osd_data.return_value = ({"capabilities": {"mid": {}}}, [])
+    pinned = ["car:ost/ska-ost-osd?1.0.0#tmdata"]
+    branch = ["gitlab://gitlab.com/ska-telescope/ost/ska-ost-osd?main#tmdata"]
+
+    first = get_encoded_osd_from_source(pinned, capabilities="mid")
+    second = get_encoded_osd_from_source(pinned, capabilities="mid")
+    get_encoded_osd_from_source(branch, capabilities="mid")
+    get_encoded_osd_from_source(branch, capabilities="mid")
+
+    assert first is second
+    assert json.loads(first.body)["result_data"] == {"capabilities": {"mid": {}}}
+    assert mock_get_osd_data.call_count == 3
+
+
+@mock.patch("ska_ost_osd.osd.osd.get_osd_data")
+@mock.patch("ska_ost_osd.osd.osd.tmdata_pool")
+def test_data_and_encoded_body_share_one_entry(_mock_pool, mock_get_osd_data):
+    """The encoded body is added to the entry holding the OSD data of the
+    same query and counted against the cache size."""
+    mock_get_osd_data.return_value = ({"capabilities": {"mid": {}}}, [])
+    pinned = ["car:ost/ska-ost-osd?1.0.0#tmdata"]
+
+    osd_data = get_osd_from_source(pinned, capabilities="mid")
+    encoded = get_encoded_osd_from_source(pinned, capabilities="mid")
+
+    assert mock_get_osd_data.call_count == 1
+    assert len(response_cache) == 1
+    assert response_cache.size == len(encoded.body) + encoded.size
+    assert get_osd_from_source(pinned, capabilities="mid") is osd_data
+    assert get_encoded_osd_from_source(pinned, capabilities="mid") is encoded
+
+
+@mock.patch("ska_ost_osd.osd.osd.get_osd_data")
+@mock.patch("ska_ost_osd.osd.osd.tmdata_pool")
+def test_cache_miss_encodes_once(_mock_pool, mock_get_osd_data):
+    """A cold query is serialised once, sizing the entry reuses the body."""
+    mock_get_osd_data.return_value = ({"capabilities": {"mid": {"a": 1}}}, [])
+    pinned = ["car:ost/ska-ost-osd?1.0.0#tmdata"]
+
+    with mock.patch(
+        "ska_ost_osd.osd.osd.encode_response_object",
+        wraps=encode_response_object,
+    ) as mock_encode, mock.patch(
+        "ska_ost_osd.osd.cache.response_cache.payload_size"
+    ) as mock_size:
+        get_osd_from_source(pinned, capabilities="mid")
+        get_encoded_osd_from_source(pinned, capabilities="mid")
+        get_encoded_osd_from_source(pinned, capabilities="low")
+
+    assert mock_encode.call_count == 2
+    mock_size.assert_not_called()
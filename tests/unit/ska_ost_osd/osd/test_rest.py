@@ -1,4 +1,5 @@
 from http import HTTPStatus
+from unittest import mock
 
 import pytest
 
@@ -226,3 +227,227 @@ def test_invalid_cycle_id(
 
     assert str(cycle_id) in response["result_data"][0]
     assert response["result_code"] == HTTPStatus.BAD_REQUEST
+
+
+def test_osd_batch_endpoint(client_post):
+    """This function tests that a batch request returns one result per query
+    in request order and reports errors per query.
+
+    :raises AssertionError: If the results do not match the queries.
+    """
+    queries = [
+        {"source": "file", "capabilities": "mid", "array_assembly": "AA0.5"},
+        {"source": "file", "capabilities": "low", "array_assembly": "AA0.5"},
+        {"source": "file", "capabilities": "mid", "array_assembly": "AA100000"},
+    ]
+
+    response = client_post(f"{BASE_API_URL}/osd/batch", json=queries).json()
+
+    assert response["result_code"] == HTTPStatus.OK
+    mid, low, invalid = response["result_data"]
+    assert mid["result_code"] == HTTPStatus.OK
+    assert "AA0.5" in mid["result_data"]["capabilities"]["mid"]
+    assert low["result_code"] == HTTPStatus.OK
+    assert "AA0.5" in low["result_data"]["capabilities"]["low"]
+    assert invalid["result_code"] == HTTPStatus.BAD_REQUEST
+    assert invalid["query"]["array_assembly"] == "AA100000"
+    assert "AA100000" in invalid["result_data"][0]
+
+
+def test_osd_endpoint_conditional_get(client_get):
+    """This function tests that a request repeating the ETag of a previous
+    response gets a 304 without a body.
+
+    :raises AssertionError: If the ETag is missing or not honoured.
+    """
+    params = {"source": "file", "capabilities": "mid", "array_assembly": "AA0.5"}
+
+    response = client_get(f"{BASE_API_URL}/osd", params=params)
+    etag = response.headers["etag"]
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["cache-control"] == "no-cache"
+
+    not_modified = client_get(
+        f"{BASE_API_URL}/osd", params=params, headers={"If-None-Match": etag}
+    )
+    other_query = client_get(
+        f"{BASE_API_URL}/osd",
+        params={**params, "array_assembly": "AA1"},
+        headers={"If-None-Match": etag},
+    )
+
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert other_query.status_code == HTTPStatus.OK
+
+
+@pytest.mark.parametrize(
+    "params, cache_control",
+    [
+        ({"capabilities": "mid", "array_assembly": "AA0.5"}, "no-cache"),
+        (
+            {"osd_version": "1.0.0", "capabilities": "mid"},
+            "public, max-age=31536000, immutable",
+        ),
+    ],
+)
+def test_osd_endpoint_cache_control(client_get, tm_data, params, cache_control):
+    """This function tests that only explicitly requested releases are
+    cacheable indefinitely, a query resolved to the latest release is
+    revalidated.
+
+    :raises AssertionError: If the Cache-Control header is wrong.
+    """
+    with mock.patch(
+        "ska_ost_osd.osd.routers.api.resolve_osd_source",
+        return_value=("car:ost/ska-ost-osd?1.0.0#tmdata",),
+    ), mock.patch("ska_ost_osd.osd.osd.tmdata_pool") as mock_pool:
+        mock_pool.get.return_value = tm_data
+        response = client_get(f"{BASE_API_URL}/osd", params=params)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["cache-control"] == cache_control
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_osd_endpoint_compressed_response(client_get, encoding):
+    """This function tests that GET /osd honours Accept-Encoding and that
+    the ETag of the compressed response is revalidated.
+
+    :raises AssertionError: If the response is not compressed.
+    """
+    params = {"source": "file", "capabilities": "mid"}
+    headers = {"Accept-Encoding": encoding}
+
+    response = client_get(f"{BASE_API_URL}/osd", params=params, headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-encoding"] == encoding
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert "mid" in response.json()["result_data"]["capabilities"]
+
+    not_modified = client_get(
+        f"{BASE_API_URL}/osd",
+        params=params,
+        headers={**headers, "If-None-Match": response.headers["etag"]},
+    )
+
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_osd_endpoint_fields(client_get):
+    """This function tests that GET /osd only returns the selected fields.
+
+    :raises AssertionError: If other fields are returned.
+    """
+    response = client_get(
+        f"{BASE_API_URL}/osd",
+        params={
+            "source": "file",
+            "capabilities": "mid",
+            "fields": "AA0.5.number_ska_dishes,basic_capabilities.receiver_information",
+        },
+    ).json()
+
+    mid = response["result_data"]["capabilities"]["mid"]
+    assert response["result_code"] == HTTPStatus.OK
+    assert set(mid) == {"AA0.5", "basic_capabilities"}
+    assert set(mid["AA0.5"]) == {"number_ska_dishes"}
+    assert set(mid["basic_capabilities"]) == {"receiver_information"}
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        "AA2.subarray_templates.LOW_FULL_AA2",
+        "/capabilities/low/AA2/subarray_templates/LOW_FULL_AA2",
+    ],
+)
+def test_osd_endpoint_fields_in_template(client_get, fields):
+    """This function tests that GET /osd selects paths into a single
+    subarray template when templates are expanded.
+
+    :raises AssertionError: If the template is not returned.
+    """
+    params = {"source": "file", "capabilities": "low", "fields": fields}
+
+    expanded = client_get(
+        f"{BASE_API_URL}/osd", params={**params, "expand_templates": True}
+    ).json()
+    names_only = client_get(f"{BASE_API_URL}/osd", params=params).json()
+
+    assert expanded["result_code"] == HTTPStatus.OK
+    templates = expanded["result_data"]["capabilities"]["low"]["AA2"][
+        "subarray_templates"
+    ]
+    assert list(templates) == ["LOW_FULL_AA2"]
+    assert names_only["result_code"] == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    "expand_templates, expected_type", [(False, list), (True, dict)]
+)
+def test_osd_endpoint_template_names(client_get, expand_templates, expected_type):
+    """This function tests that GET /osd returns subarray template names
+    unless expand_templates is set.
+
+    :raises AssertionError: If the templates are returned in the wrong form.
+    """
+    response = client_get(
+        f"{BASE_API_URL}/osd",
+        params={
+            "source": "file",
+            "capabilities": "low",
+            "array_assembly": "AA2",
+            "expand_templates": expand_templates,
+        },
+    ).json()
+
+    templates = response["result_data"]["capabilities"]["low"]["AA2"][
+        "subarray_templates"
+    ]
+    assert response["result_code"] == HTTPStatus.OK
+    assert isinstance(templates, expected_type)
+    assert "LOW_FULL_AA2" in templates
+
+
+def test_subarray_templates_endpoint(client_get):
+    """This function tests that GET /subarray_templates pages through the
+    templates matching the query.
+
+    :raises AssertionError: If the page does not match the query.
+    """
+    params = {"source": "file", "pattern": "LOW_*", "subarray_type": "custom"}
+    first = client_get(
+        f"{BASE_API_URL}/subarray_templates", params={**params, "page_size": 5}
+    ).json()
+    second = client_get(
+        f"{BASE_API_URL}/subarray_templates",
+        params={**params, "page": 2, "page_size": 5},
+    ).json()
+
+    assert first["result_code"] == HTTPStatus.OK
+    assert first["result_data"]["total"] == second["result_data"]["total"] > 5
+    assert len(first["result_data"]["templates"]) == 5
+    assert not set(first["result_data"]["templates"]) & set(
+        second["result_data"]["templates"]
+    )
+    for name, template in first["result_data"]["templates"].items():
+        assert name.startswith("LOW_")
+        assert template["subarray_type"] == "custom"
+
+
+def test_subarray_templates_endpoint_invalid_page_size(client_get):
+    """This function tests that GET /subarray_templates rejects page sizes
+    above the limit.
+
+    :raises AssertionError: If the page size is accepted.
+    """
+    response = client_get(
+        f"{BASE_API_URL}/subarray_templates",
+        params={"source": "file", "page_size": 1000},
+    ).json()
+
+    assert response["result_code"] == HTTPStatus.UNPROCESSABLE_ENTITY
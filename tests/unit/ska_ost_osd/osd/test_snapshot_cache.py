@@ -0,0 +1,148 @@
+"""Unit tests for the per-snapshot parsed document cache."""
+
+import copy
+from unittest import mock
+
+import pytest
+
+from ska_ost_osd.osd.cache.snapshot_cache import SnapshotCache
+from ska_ost_osd.osd.common.constant import osd_file_mapping
+from ska_ost_osd.osd.osd import get_osd_data
+from ska_ost_osd.osd.template_mapping.template_mapping import (
+    process_template_mappings,
+)
+
+
+def make_tmdata(documents: dict) -> mock.MagicMock:
+    """Build a TMData mock whose files count their get_dict calls."""
+    tmdata = mock.MagicMock()
+    items = {}
+    for path, document in documents.items():
+        items[path] = mock.MagicMock()
+        items[path].get_dict.return_value = document
+    tmdata.__getitem__.side_effect = items.__getitem__
+    tmdata.items = items
+    return tmdata
+
+
+class TestSnapshotCache:
+    """Test cases for SnapshotCache."""
+
+    def test_document_is_parsed_once_per_snapshot(self):
+        """Each file is parsed once for a snapshot and again for a new
+        one."""
+        cache = SnapshotCache()
+        first = make_tmdata({"doc.json": {"a": [1]}})
+        second = make_tmdata({"doc.json": {"a": [2]}})
+
+        assert cache.document(first, "doc.json") == {"a": [1]}
+        assert cache.document(first, "doc.json") is cache.document(first, "doc.json")
+        assert cache.document(second, "doc.json") == {"a": [2]}
+        first.items["doc.json"].get_dict.assert_called_once()
+
+    def test_document_is_read_only(self):
+        """Shared documents cannot be modified, copies can."""
+        cache = SnapshotCache()
+        document = cache.document(make_tmdata({"doc.json": {"a": [1]}}), "doc.json")
+
+        with pytest.raises(TypeError):
+            document["b"] = 2
+        with pytest.raises(TypeError):
+            document["a"].append(2)
+
+        mutable = copy.deepcopy(document)
+        mutable["a"].append(2)
+        assert mutable == {"a": [1, 2]}
+
+    def test_missing_document_raises_key_error(self):
+        """Missing files are reported and not cached."""
+        cache = SnapshotCache()
+
+        with pytest.raises(KeyError):
+            cache.document(make_tmdata({}), "missing.json")
+
+    def test_derived_is_computed_once_and_frozen(self):
+        """Derived results are computed once per snapshot and read-only."""
+        cache = SnapshotCache()
+        tmdata = make_tmdata({"doc.json": {"a": [1]}})
+        factory = mock.Mock(
+            side_effect=lambda: {"b": cache.document(tmdata, "doc.json")["a"]}
+        )
+
+        first = cache.derived(tmdata, "key", factory)
+        second = cache.derived(tmdata, "key", factory)
+
+        assert first is second
+        assert first == {"b": [1]}
+        factory.assert_called_once()
+        with pytest.raises(TypeError):
+            first["c"] = 1
+
+
+def test_multi_capability_request_parses_each_file_once():
+    """A mid and low request with templates parses every file once."""
+    tmdata = make_tmdata(
+        {
+            osd_file_mapping["observatory_policies"]: {
+                "telescope_capabilities": {"Mid": "AA0.5", "Low": "AA0.5"}
+            },
+            osd_file_mapping["mid"]: {
+                "basic_capabilities": {},
+                "AA0.5": {"subarray_templates": ["MID_*"]},
+            },
+            osd_file_mapping["low"]: {
+                "basic_capabilities": {},
+                "AA0.5": {"subarray_templates": ["LOW_*"]},
+            },
+            osd_file_mapping["subarray_templates"]: {
+                "MID_FULL_AA0.5": {"subarray_type": "AA0.5"},
+                "LOW_FULL_AA0.5": {"subarray_type": "AA0.5"},
+            },
+        }
+    )
+
+    osd_data, errors = get_osd_data(
+        capabilities=["mid", "low"], tmdata=tmdata, process_templates=True
+    )
+
+    assert not errors
+    assert set(osd_data["capabilities"]) == {"mid", "low"}
+    for item in tmdata.items.values():
+        item.get_dict.assert_called_once()
+
+
+def test_templates_are_resolved_once_per_snapshot():
+    """Repeated requests slice the stored template-resolved capabilities."""
+    tmdata = make_tmdata(
+        {
+            osd_file_mapping["observatory_policies"]: {
+                "telescope_capabilities": {"Mid": "AA0.5"}
+            },
+            osd_file_mapping["mid"]: {
+                "basic_capabilities": {},
+                "AA0.5": {"subarray_templates": ["MID_*"]},
+                "AA1": {"subarray_templates": ["MID_*"]},
+            },
+            osd_file_mapping["subarray_templates"]: {
+                "MID_FULL_AA0.5": {"subarray_type": "AA0.5"},
+            },
+        }
+    )
+
+    with mock.patch(
+        "ska_ost_osd.osd.osd.process_template_mappings",
+        wraps=process_template_mappings,
+    ) as mock_process:
+        for array_assembly in ["AA0.5", "AA1", "AA0.5"]:
+            osd_data, errors = get_osd_data(
+                capabilities=["mid"],
+                array_assembly=array_assembly,
+                tmdata=tmdata,
+                process_templates=True,
+            )
+            assert not errors
+            assert osd_data["capabilities"]["mid"][array_assembly][
+                "subarray_templates"
+            ] == {"MID_FULL_AA0.5": {"subarray_type": "AA0.5"}}
+
+    mock_process.assert_called_once()
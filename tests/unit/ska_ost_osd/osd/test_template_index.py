@@ -0,0 +1,117 @@
+"""Unit tests for the subarray template index."""
+
+import fnmatch
+
+import pytest
+
+from ska_ost_osd.common.frozen import freeze
+from ska_ost_osd.osd.template_mapping.template_index import (
+    MEMOISED_RESULTS,
+    TemplateIndex,
+    get_template_index,
+)
+
+TEMPLATES = {
+    "MID_FULL_AA4": {"subarray_type": "AA4"},
+    "MID_INNER_R1KM_AA0.5": {"subarray_type": "custom"},
+    "MID_FULL_AA0.5": {"subarray_type": "AA0.5"},
+    "LOW_FULL_AA0.5": {"subarray_type": "AA0.5"},
+    "LOW_INNER_R2KM_AA4": {"subarray_type": "custom"},
+    "SHARED_AA0.5": {"subarray_type": "AA0.5"},
+}
+
+
+def fnmatch_reference(patterns, telescope):
+    """Brute force matching as done before the index existed."""
+    excluded_prefix = "low_" if telescope == "mid" else "mid_"
+    return [
+        key
+        for key in TEMPLATES
+        if any(fnmatch.fnmatchcase(key, pattern) for pattern in patterns)
+        and not key.lower().startswith(excluded_prefix)
+    ]
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        ["*_AA0.5"],
+        ["*_AA4", "MID_*"],
+        ["*INNER*"],
+        ["MID_INNER_R?KM_AA0.5"],
+        ["LOW_FULL_AA0.5"],
+        ["*"],
+        ["nonexistent_*"],
+    ],
+)
+@pytest.mark.parametrize("telescope", ["mid", "low"])
+def test_match_is_equivalent_to_fnmatch(patterns, telescope):
+    """Indexed matching returns the fnmatch result in library order."""
+    index = TemplateIndex(TEMPLATES)
+
+    assert list(index.match(patterns, telescope)) == fnmatch_reference(
+        patterns, telescope
+    )
+
+
+def test_match_returns_independent_results():
+    """Callers may modify the returned dict without affecting the index."""
+    index = TemplateIndex(TEMPLATES)
+
+    index.match(["*_AA0.5"], "mid").clear()
+
+    assert len(index.match(["*_AA0.5"], "mid")) == 3
+
+
+@pytest.mark.parametrize(
+    "telescope, subarray_type, expected",
+    [
+        (None, None, list(TEMPLATES)),
+        ("mid", "AA0.5", ["MID_FULL_AA0.5", "SHARED_AA0.5"]),
+        ("low", "custom", ["LOW_INNER_R2KM_AA4"]),
+        (None, "AA2", []),
+    ],
+)
+def test_names_filter_by_telescope_and_subarray_type(
+    telescope, subarray_type, expected
+):
+    """Template names are listed in library order after filtering."""
+    index = TemplateIndex(TEMPLATES)
+
+    assert index.names(["*"], telescope, subarray_type) == expected
+
+
+def test_memoised_results_are_bounded():
+    """Client supplied patterns cannot grow the memo without limit, the
+    least recently used results are dropped."""
+    index = TemplateIndex(TEMPLATES)
+    first = index.match(["*_AA0.5"])
+
+    for number in range(MEMOISED_RESULTS):
+        index.names([f"*_AA{number}"])
+
+    # pylint: disable=protected-access
+    assert len(index._results) == MEMOISED_RESULTS
+    assert (("*_AA0.5",), None) not in index._results
+    assert index.match(["*_AA0.5"]) == first
+
+
+def test_index_is_built_once_per_library():
+    """Read-only libraries share one index, plain dicts get a new one."""
+    library = freeze(TEMPLATES)
+
+    assert get_template_index(library) is get_template_index(library)
+    assert get_template_index(TEMPLATES) is not get_template_index(TEMPLATES)
+
+
+def test_match_without_telescope_keeps_all_templates():
+    """Without a telescope no template is left out, including ones
+    without a MID_/LOW_ prefix."""
+    index = TemplateIndex(TEMPLATES)
+
+    assert list(index.match(["*_AA0.5"])) == [
+        "MID_INNER_R1KM_AA0.5",
+        "MID_FULL_AA0.5",
+        "LOW_FULL_AA0.5",
+        "SHARED_AA0.5",
+    ]
@@ -2,6 +2,7 @@
 
 from unittest.mock import patch
 
+from ska_ost_osd.common.frozen import freeze
 from ska_ost_osd.osd.template_mapping.template_mapping import (
     find_matching_templates,
     process_template_mappings,
@@ -83,6 +84,24 @@ class TestProcessTemplateMappings:
         assert "mid_template_1" in result["AA1"]["subarray_templates"]
         assert "mid_template_2" in result["AA1"]["subarray_templates"]
 
+    def test_process_template_mappings_keys_only(self):
+        """Test that keys_only replaces the patterns with template names."""
+        capabilities_data = {"AA1": {"subarray_templates": ["mid_*"]}}
+        template_data = {
+            "mid_template_1": {"config": "test1"},
+            "mid_template_2": {"config": "test2"},
+        }
+        capability = "ska1_mid/mid_capabilities.json"
+
+        result = process_template_mappings(
+            capabilities_data, capability, template_data, keys_only=True
+        )
+
+        assert result["AA1"]["subarray_templates"] == [
+            "mid_template_1",
+            "mid_template_2",
+        ]
+
     def test_process_template_mappings_no_matches(self):
         """Test template mapping when no templates match."""
         capabilities_data = {
@@ -99,6 +118,22 @@ class TestProcessTemplateMappings:
         assert "AA1" in result
         assert "subarray_templates" not in result["AA1"]
 
+    def test_process_template_mappings_leaves_input_unchanged(self):
+        """Test that read-only input is copied only where it is modified."""
+        capabilities_data = freeze(
+            {
+                "basic_capabilities": {"test": "data"},
+                "AA1": {"subarray_templates": ["nonexistent_*"]},
+            }
+        )
+        capability = "ska1_mid/mid_capabilities.json"
+
+        result = process_template_mappings(capabilities_data, capability, {})
+
+        assert capabilities_data["AA1"] == {"subarray_templates": ["nonexistent_*"]}
+        assert result["AA1"] == {}
+        assert result["basic_capabilities"] is capabilities_data["basic_capabilities"]
+
     def test_process_template_mappings_no_data(self):
         """Test template mapping with no capabilities data."""
         result = process_template_mappings(None, "test", {})
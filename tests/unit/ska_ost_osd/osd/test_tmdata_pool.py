@@ -0,0 +1,76 @@
+"""Unit tests for the process-wide TMData pool."""
+
+from unittest import mock
+
+import pytest
+
+from ska_ost_osd.osd.cache.tmdata_pool import TMDataPool, is_pinned_source
+from ska_ost_osd.osd.common.constant import GITLAB_SOURCE
+
+
+@pytest.mark.parametrize(
+    "source_uris, expected",
+    [
+        (("car:ost/ska-ost-osd?6.0.5#tmdata",), True),
+        (("gitlab://gitlab.com/ska-telescope/ost/ska-ost-osd?1.0.0#tmdata",), True),
+        (("car:ost/ska-ost-osd?main#tmdata",), False),
+        (("car:ost/ska-ost-osd?1.2.3-rc1#tmdata",), False),
+        (
+            ("gitlab://gitlab.com/ska-telescope/ost/ska-ost-osd?1.2.3-fix#tmdata",),
+            False,
+        ),
+        (GITLAB_SOURCE, False),
+        (("file://tmdata",), False),
+        ((), False),
+    ],
+)
+def test_is_pinned_source(source_uris, expected):
+    """Only released OSD versions are treated as immutable."""
+    assert is_pinned_source(source_uris) is expected
+
+
+class TestTMDataPool:
+    """Test cases for TMDataPool."""
+
+    def test_pinned_source_is_built_once(self):
+        """A pinned source is fetched once and never refreshed."""
+        factory = mock.MagicMock()
+        pool = TMDataPool(ttl_seconds=0, factory=factory)
+        source = ("car:ost/ska-ost-osd?6.0.5#tmdata",)
+
+        first = pool.get(source)
+        second = pool.get(list(source))
+
+        assert first is second
+        factory.assert_called_once_with(list(source), update=False)
+
+    def test_mutable_source_is_refreshed_after_ttl(self):
+        """A branch source is re-fetched with update=True once the TTL
+        expires."""
+        factory = mock.MagicMock(side_effect=lambda *_, **__: mock.MagicMock())
+        pool = TMDataPool(ttl_seconds=60, factory=factory)
+
+        with mock.patch(
+            "ska_ost_osd.osd.cache.tmdata_pool.time.monotonic",
+            side_effect=[0.0, 10.0, 100.0, 100.0, 100.0],
+        ):
+            first = pool.get(GITLAB_SOURCE)
+            assert pool.get(GITLAB_SOURCE) is first
+            refreshed = pool.get(GITLAB_SOURCE)
+
+        assert refreshed is not first
+        assert factory.call_count == 2
+        factory.assert_called_with(list(GITLAB_SOURCE), update=True)
+
+    def test_invalidate_drops_only_mutable_sources(self):
+        """Invalidation without arguments keeps pinned sources."""
+        factory = mock.MagicMock(side_effect=lambda *_, **__: mock.MagicMock())
+        pool = TMDataPool(factory=factory)
+        pinned = ("car:ost/ska-ost-osd?6.0.5#tmdata",)
+
+        pinned_tmdata = pool.get(pinned)
+        file_tmdata = pool.get(("file://tmdata",))
+        pool.invalidate()
+
+        assert pool.get(pinned) is pinned_tmdata
+        assert pool.get(("file://tmdata",)) is not file_tmdata
@@ -0,0 +1,94 @@
+"""Unit tests for the in-memory OSD version resolver."""
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from ska_ost_osd.osd.common.constant import RELEASE_FILE_PATH_LATEST
+from ska_ost_osd.osd.version_mapping.version_resolver import VersionResolver
+
+
+def make_tmdata(versions_dict: dict, latest_version: str) -> mock.MagicMock:
+    """Build a TMData mock serving the version_mapping folder."""
+    tmdata = mock.MagicMock()
+
+    def get_item(path):
+        item = mock.MagicMock()
+        if path == RELEASE_FILE_PATH_LATEST:
+            item.get.return_value = f'"{latest_version}"'.encode("utf-8")
+        else:
+            item.get_dict.return_value = versions_dict
+        return item
+
+    tmdata.__getitem__.side_effect = get_item
+    return tmdata
+
+
+class TestVersionResolver:
+    """Test cases for VersionResolver."""
+
+    def test_first_access_loads_once(self):
+        """Version data is downloaded once and then served from memory."""
+        factory = mock.MagicMock(
+            return_value=make_tmdata({"cycle_1": ["1.0.0"]}, "1.0.0")
+        )
+        resolver = VersionResolver(refresh_interval=3600, factory=factory)
+
+        assert resolver.versions_dict == {"cycle_1": ["1.0.0"]}
+        assert resolver.latest_version == "1.0.0"
+        factory.assert_called_once()
+
+    def test_stale_data_is_served_while_refreshing(self):
+        """Once stale, the old data is returned and the new data is loaded
+        in the background."""
+        release_refresh = threading.Event()
+        refreshed = threading.Event()
+        old = make_tmdata({"cycle_1": ["1.0.0"]}, "1.0.0")
+        new = make_tmdata({"cycle_1": ["1.0.0", "1.0.1"]}, "1.0.1")
+
+        def factory(*_, **__):
+            if factory.calls:
+                release_refresh.wait(5)
+                refreshed.set()
+                return new
+            factory.calls += 1
+            return old
+
+        factory.calls = 0
+        resolver = VersionResolver(refresh_interval=0, factory=factory)
+
+        assert resolver.latest_version == "1.0.0"
+        assert resolver.latest_version == "1.0.0"
+        release_refresh.set()
+        assert refreshed.wait(5)
+        for _ in range(100):
+            if resolver.snapshot().latest_version == "1.0.1":
+                break
+            time.sleep(0.01)
+
+        assert resolver.snapshot().versions_dict == {"cycle_1": ["1.0.0", "1.0.1"]}
+
+    def test_invalidate_forces_reload(self):
+        """After invalidation the next access reloads synchronously."""
+        factory = mock.MagicMock(
+            side_effect=[
+                make_tmdata({"cycle_1": ["1.0.0"]}, "1.0.0"),
+                make_tmdata({"cycle_1": ["1.0.0", "1.0.1"]}, "1.0.1"),
+            ]
+        )
+        resolver = VersionResolver(refresh_interval=3600, factory=factory)
+
+        assert resolver.latest_version == "1.0.0"
+        resolver.invalidate()
+
+        assert resolver.latest_version == "1.0.1"
+
+    def test_initial_load_error_is_raised(self):
+        """Without any cached data, load errors reach the caller."""
+        factory = mock.MagicMock(side_effect=FileNotFoundError("file not found"))
+        resolver = VersionResolver(factory=factory)
+
+        with pytest.raises(FileNotFoundError):
+            _ = resolver.versions_dict
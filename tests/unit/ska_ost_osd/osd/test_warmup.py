@@ -0,0 +1,99 @@
+"""Unit tests for the startup warm-up and readiness endpoint."""
+
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from ska_ost_osd.app import create_app
+from ska_ost_osd.osd.cache.snapshot_cache import snapshot_cache
+from ska_ost_osd.osd.cache.warmup import (
+    Warmup,
+    parse_cycles,
+    warm_version,
+    warmup_versions,
+)
+from ska_ost_osd.osd.common.constant import osd_file_mapping
+
+VERSIONS_DICT = {"cycle_1": ["4.2.1", "5.0.0"], "cycle_2": ["5.1.0", "6.0.5"]}
+
+
+def test_warmup_versions_latest_first_and_distinct():
+    """The latest version comes first followed by all cycle versions."""
+    assert warmup_versions(VERSIONS_DICT, "6.0.5") == [
+        "6.0.5",
+        "4.2.1",
+        "5.0.0",
+        "5.1.0",
+    ]
+
+
+def test_warmup_versions_of_active_cycles():
+    """Only the versions of the active cycles are warmed."""
+    assert warmup_versions(VERSIONS_DICT, "6.0.5", parse_cycles("1")) == [
+        "6.0.5",
+        "4.2.1",
+        "5.0.0",
+    ]
+    assert parse_cycles("") is None
+    assert parse_cycles("1, 2") == [1, 2]
+
+
+def test_warm_version_resolves_capabilities(tm_data):
+    """Warming a version leaves the resolved capabilities cached."""
+    with mock.patch("ska_ost_osd.osd.cache.warmup.tmdata_pool") as mock_pool:
+        mock_pool.get.return_value = tm_data
+        warm_version("6.0.5")
+
+    mock_pool.get.assert_called_once_with(("car:ost/ska-ost-osd?6.0.5#tmdata",))
+    resolve = mock.Mock()
+    snapshot_cache.derived(
+        tm_data, ("resolved_capabilities", osd_file_mapping["mid"], True), resolve
+    )
+    resolve.assert_not_called()
+
+
+def test_warmup_reports_ready_after_all_versions():
+    """Failed versions are listed and do not keep the service unready."""
+    warmup = Warmup(enabled=True, workers=2)
+    snapshot = mock.Mock(versions_dict=VERSIONS_DICT, latest_version="6.0.5")
+
+    def warm(osd_version):
+        if osd_version == "4.2.1":
+            raise ValueError("not found")
+
+    assert not warmup.ready
+    with mock.patch(
+        "ska_ost_osd.osd.cache.warmup.version_resolver"
+    ) as mock_resolver, mock.patch(
+        "ska_ost_osd.osd.cache.warmup.warm_version", side_effect=warm
+    ):
+        mock_resolver.snapshot.return_value = snapshot
+        warmup.run()
+
+    status = warmup.status()
+    assert status["ready"]
+    assert sorted(status["warmed"]) == ["5.0.0", "5.1.0", "6.0.5"]
+    assert status["failed"] == {"4.2.1": "not found"}
+
+
+def test_ready_endpoint_gates_on_warmup():
+    """GET /ready answers 503 until the warm-up has finished."""
+    warmup = Warmup(enabled=True)
+    client = TestClient(create_app())
+
+    with mock.patch("ska_ost_osd.osd.cache.warmup.osd_warmup", warmup):
+        assert client.get("/ready").status_code == 503
+        warmup._done.set()  # pylint: disable=protected-access
+        response = client.get("/ready")
+
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
+
+
+def test_disabled_warmup_is_ready():
+    """Without warm-up the service is ready immediately."""
+    warmup = Warmup(enabled=False)
+    warmup.start()
+
+    assert warmup.ready
+    assert warmup.wait(0)
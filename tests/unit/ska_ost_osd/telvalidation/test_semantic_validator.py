@@ -1,4 +1,5 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import patch
 
@@ -11,13 +12,27 @@ from ska_ost_osd.telvalidation.common.error_handling import (
     SchematicValidationError,
 )
 from ska_ost_osd.telvalidation.oet_tmc_validators import (
+    EvalWithCompoundTypes,
+    ValidationContext,
+    add_semantic_variables,
+    build_key_index,
+    build_rule_bindings,
+    clear_semantic_variable_data,
+    collect_rules,
+    compile_rule,
+    evaluate_rule,
+    get_evaluator,
     get_matched_rule_constraint_from_osd,
+    get_semantic_variables,
+    get_value_based_on_provided_path,
     validate_json,
     validate_target_is_visible,
 )
 from ska_ost_osd.telvalidation.semantic_validator import (
     fetch_capabilities_from_osd,
+    get_validation_plan,
     semantic_validate,
+    semantic_validate_many,
 )
 from tests.conftest import BASE_API_URL
 from tests.unit.ska_ost_osd.common.constant import (
@@ -27,6 +42,7 @@ from tests.unit.ska_ost_osd.common.constant import (
     capabilities,
     sources,
 )
+from tests.unit.ska_ost_osd.utils import read_json
 
 
 @patch("ska_ost_osd.telvalidation.semantic_validator.fetch_capabilities_from_osd")
@@ -208,6 +224,181 @@ def test_get_matched_rule_constraint_from_osd():
     assert [{"min_frequency_hz": ["test"]}], result
 
 
+def test_rule_constraints_match_rule_identifiers_only():
+    """Capabilities are matched by the names used in a rule, not by
+    substrings of it."""
+    osd_capabilities = {
+        "number_fsps": 4,
+        "fsps": [1, 2],
+        "available_receivers": [
+            {"rx_id": "Band_1", "min_frequency_hz": 1, "max_frequency_hz": 2}
+        ],
+    }
+    rule = "0 < len(fsp_ids) <= number_fsps"
+
+    assert get_matched_rule_constraint_from_osd(osd_capabilities, None, rule) == [
+        {"number_fsps": 4}
+    ]
+    assert get_matched_rule_constraint_from_osd(
+        osd_capabilities, None, "min_frequency_hz <= freq_min <= max_frequency_hz"
+    ) == [{"min_frequency_hz": 1, "max_frequency_hz": 2}]
+
+
+def test_build_rule_bindings_matches_every_rule():
+    """Rule bindings equal the per-rule matches for all collected rules."""
+    validation_constants = {
+        "assign_resource": {
+            "dish": {
+                "receptor_ids": [
+                    {
+                        "rule": "(0 < len(receptor_ids) <= number_ska_dishes)",
+                        "error": "receptor_ids are too many!",
+                    }
+                ]
+            }
+        },
+        "configure": {"freq_min": [{"rule": "freq_min < freq_max", "error": "x"}]},
+    }
+    osd_capabilities = {"number_ska_dishes": 4, "receivers": [{"freq_max": 2}]}
+
+    rules = collect_rules(validation_constants)
+    bindings = build_rule_bindings(osd_capabilities, rules)
+
+    assert rules == {
+        "(0 < len(receptor_ids) <= number_ska_dishes)",
+        "freq_min < freq_max",
+    }
+    for rule in rules:
+        assert bindings[rule] == get_matched_rule_constraint_from_osd(
+            osd_capabilities, None, rule
+        )
+
+
+def test_deprecated_semantic_variable_helpers():
+    """The module level variable helpers warn and still feed dependency
+    values to rules evaluated without a context."""
+    rule = {"rule": "end > start", "error": "", "dependency_key": ["start"]}
+
+    with pytest.warns(DeprecationWarning, match="add_semantic_variables"):
+        add_semantic_variables({"start": 5})
+    with pytest.warns(DeprecationWarning, match="get_semantic_variables"):
+        assert get_semantic_variables() == {"start": 5}
+    assert evaluate_rule("end", 6, rule, []) == [True]
+
+    with pytest.warns(DeprecationWarning, match="clear_semantic_variable_data"):
+        clear_semantic_variable_data()
+    with pytest.warns(DeprecationWarning):
+        assert get_semantic_variables() == {}
+
+
+def test_concurrent_validations_keep_their_dependency_values():
+    """Dependency values are read from the validation they belong to."""
+    validation_constants = {
+        "start": [{"rule": "start >= 0", "error": "negative start"}],
+        "end": [
+            {
+                "rule": "end > start",
+                "error": "end before start",
+                "dependency_key": ["start"],
+            }
+        ],
+    }
+
+    def validate(start):
+        context = ValidationContext({})
+        errors = validate_json(
+            validation_constants,
+            {"start": start, "end": start + 1 if start % 2 else start - 1},
+            [],
+            context=context,
+        )
+        return start, errors, context.variables
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(validate, range(1, 200)))
+
+    for start, errors, variables in results:
+        assert errors == ([] if start % 2 else ["end before start"])
+        assert variables["start"] == start
+
+
+def rule_paths(validation_constants: dict, parent_path: list) -> list:
+    """Return the input paths looked up for a validation constants file."""
+    paths = []
+    for key, value in validation_constants.items():
+        paths.append(parent_path + [key])
+        if isinstance(value, dict):
+            if "parent_key_rule" in value:
+                paths.append(parent_path + [key, list(value.keys())[1]])
+            paths.extend(rule_paths(value, parent_path + [key]))
+    return paths
+
+
+@pytest.mark.parametrize(
+    "command_input, validation_constants",
+    [
+        ("testfile_mid_sbd.json", "mock_mid_sbd-validation-constants.json"),
+        ("testfile_low_sbd.json", "mock_low_sbd-validation-constants.json"),
+        ("testfile_mid_configure.json", "mock-validation-constants.json"),
+        ("testfile_mid_assign.json", "mock-validation-constants.json"),
+    ],
+)
+def test_key_index_does_not_change_path_lookups(command_input, validation_constants):
+    """Lookups pruned by the key index return what a full search returns."""
+    command_input = read_json(f"test_files/{command_input}")
+    key_index = build_key_index(command_input)
+
+    found = 0
+    for full_path in rule_paths(read_json(f"test_files/{validation_constants}"), []):
+        # rules of a section look up paths relative to the section
+        for path in (full_path[start:] for start in range(len(full_path))):
+            expected = get_value_based_on_provided_path(command_input, path)
+            assert (
+                get_value_based_on_provided_path(command_input, path, key_index)
+                == expected
+            ), path
+            found += expected is not None
+    assert found
+
+    assert (
+        get_value_based_on_provided_path(command_input, ["missing"], key_index) is None
+    )
+
+
+def test_evaluate_rule_parses_each_rule_once():
+    """Rules are parsed once per rule text and evaluated from the cached
+    node tree afterwards."""
+    rule_data = {
+        "rule": "0 < len(receptor_ids) <= number_ska_dishes",
+        "error": "receptor_ids are too many!",
+    }
+    compile_rule.cache_clear()
+
+    with patch.object(
+        EvalWithCompoundTypes, "parse", wraps=EvalWithCompoundTypes.parse
+    ) as mock_parse:
+        valid = evaluate_rule(
+            "receptor_ids", ["SKA001"], rule_data, [{"number_ska_dishes": 4}]
+        )
+        invalid = evaluate_rule(
+            "receptor_ids", ["SKA001"] * 5, rule_data, [{"number_ska_dishes": 4}]
+        )
+
+    assert valid == [True]
+    assert invalid == [False]
+    mock_parse.assert_called_once_with(rule_data["rule"])
+
+
+def test_evaluator_is_reused_per_thread():
+    """Each thread builds one evaluator and reuses it for every rule."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_thread = executor.submit(get_evaluator).result()
+
+    assert get_evaluator() is get_evaluator()
+    assert other_thread is not get_evaluator()
+    assert get_evaluator().functions["len"] is len
+
+
 @patch("ska_ost_osd.osd.osd.get_osd_data")
 def test_fetch_capabilities_from_osd_based_on_client_based_osd_data(mock1):
     """Test case to verify if client passed osd data from semantic_validate
@@ -245,6 +436,121 @@ def test_semantic_validate_api(client_post, request, json_body_to_validate, resp
     assert res == expected_response
 
 
+def test_validation_plan_is_built_once_per_snapshot(
+    valid_observing_command_input, invalid_observing_command_input
+):
+    """Capabilities are resolved once for all inputs validated against
+    the same snapshot, interface family and array assembly."""
+    tm_data = TMData(["file://tmdata"])
+    interface = "https://schema.skao.int/ska-tmc-assignresources/2.1"
+
+    with patch(
+        "ska_ost_osd.telvalidation.semantic_validator.fetch_capabilities_from_osd",
+        wraps=fetch_capabilities_from_osd,
+    ) as mock_fetch:
+        plan = get_validation_plan(tm_data, interface, "mid", "AA0.5")
+        assert semantic_validate(valid_observing_command_input, tm_data) is True
+        with pytest.raises(SchematicValidationError):
+            semantic_validate(invalid_observing_command_input, tm_data)
+
+    mock_fetch.assert_called_once()
+    assert get_validation_plan(tm_data, interface, "mid", "AA0.5") is plan
+    assert plan.validate(valid_observing_command_input) == []
+    assert plan.validate(invalid_observing_command_input)
+
+
+def test_semantic_validate_many_matches_semantic_validate(
+    valid_observing_command_input, invalid_observing_command_input
+):
+    """Inputs validated in worker processes give the results of
+    semantic_validate, in input order."""
+    inputs = [
+        valid_observing_command_input,
+        invalid_observing_command_input,
+        valid_observing_command_input,
+        {"subarray_id": 1},
+    ]
+    tm_data = TMData(["file://tmdata"])
+    expected = []
+    for observing_command_input in inputs:
+        try:
+            expected.append(semantic_validate(observing_command_input, tm_data))
+        except SchematicValidationError as error:
+            expected.append(error.message)
+
+    results = semantic_validate_many(
+        inputs, "file://tmdata", max_workers=2, chunksize=1
+    )
+
+    assert [
+        result.message if isinstance(result, SchematicValidationError) else result
+        for result in results
+    ] == expected
+    assert expected[0] is True
+    assert isinstance(expected[1], str)
+
+
+def test_semantic_validate_batch_api(client_post, request):
+    """Each payload of a batch gets the result of a single request."""
+    bodies = [
+        "valid_semantic_validation_body",
+        "invalid_semantic_validation_body",
+        "invalid_semantic_validation_body_aa1",
+        "invalid_semantic_validation_body_aa2",
+    ]
+    payloads = []
+    expected = []
+    for body in bodies:
+        json_body = dict(request.getfixturevalue(body), sources="file://tmdata")
+        payloads.append(json_body)
+        expected.append(
+            client_post(f"{BASE_API_URL}/semantic_validation", json=json_body).json()
+        )
+    payloads.append(dict(payloads[0], sources="file:///missing/tmdata"))
+
+    with patch(
+        "ska_ost_osd.telvalidation.routers.api.tmdata_pool.get",
+        side_effect=[TMData(["file://tmdata"]), FileNotFoundError("missing")],
+    ) as mock_get:
+        res = client_post(
+            f"{BASE_API_URL}/semantic_validation/batch", json=payloads
+        ).json()
+
+    assert mock_get.call_count == 2
+    results = res["result_data"]
+    assert [result["duration_ms"] >= 0 for result in results] == [True] * 5
+    assert [
+        {key: value for key, value in result.items() if key != "duration_ms"}
+        for result in results[:4]
+    ] == expected
+    assert results[4]["result_code"] == 404
+    assert results[4]["result_data"] == "missing"
+
+
+def test_semantic_validate_batch_api_source_load_error(
+    client_post, valid_semantic_validation_body
+):
+    """A source that fails to load yields one error result per payload
+    without validating its payloads."""
+    payload = dict(valid_semantic_validation_body, sources="file:///missing/tmdata")
+
+    with patch(
+        "ska_ost_osd.telvalidation.routers.api.tmdata_pool.get",
+        side_effect=FileNotFoundError("missing"),
+    ) as mock_get, patch(
+        "ska_ost_osd.telvalidation.routers.api.semantic_validate"
+    ) as mock_validate:
+        res = client_post(
+            f"{BASE_API_URL}/semantic_validation/batch", json=[payload] * 3
+        ).json()
+
+    mock_get.assert_called_once()
+    mock_validate.assert_not_called()
+    assert [
+        (result["result_code"], result["result_data"]) for result in res["result_data"]
+    ] == [(404, "missing")] * 3
+
+
 @patch("ska_ost_osd.telvalidation.semantic_validator.VALIDATION_STRICTNESS", "1")
 @patch("ska_ost_osd.telvalidation.routers.api.VALIDATION_STRICTNESS", "1")
 @pytest.mark.parametrize(